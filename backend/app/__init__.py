@@ -1,6 +1,16 @@
-from .services.automl_trainer import AutoML
-from .services.preprocessing import handle_null_values, handle_imbalance, handle_cat_columns, detect_task, get_dtype_columns, text_preprocessor
-from .client.swift_predict import SwiftPredict
+import importlib
+
+# Exports are resolved on first access to keep importing the tracking client and the API lightweight.
+_EXPORTS = {
+    "AutoML": ".services.automl_trainer",
+    "handle_null_values": ".services.preprocessing",
+    "handle_imbalance": ".services.preprocessing",
+    "handle_cat_columns": ".services.preprocessing",
+    "detect_task": ".services.preprocessing",
+    "get_dtype_columns": ".services.preprocessing",
+    "text_preprocessor": ".services.preprocessing",
+    "SwiftPredict": ".client.swift_predict",
+}
 
 __all__ = [
     "AutoML",
@@ -11,4 +21,16 @@ __all__ = [
     "get_dtype_columns",
     "text_preprocessor",
     "SwiftPredict"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,16 +1,27 @@
 # Importing dependencies
-from fastapi import FastAPI
-from pymongo import MongoClient
-from datetime import datetime
-import matplotlib.pyplot as plt
-from fastapi.responses import StreamingResponse
+import os
+import json
+import math
+import time
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from io import BytesIO
+from starlette.concurrency import run_in_threadpool
 import uvicorn
+from backend.app.services.model_server import ModelServer
+from backend.app.services.plot_renderer import PlotCache, render_metric_plot
+from backend.app.services.live_metrics import MetricNotifier
+from backend.app.core.storage import create_async_store, LEADERBOARD_GOALS, LEADERBOARD_KEYS
+from backend.app.core.connections import connection_stats
+from backend.app.core.downsampling import DOWNSAMPLING_METHODS, downsample
+from backend.app.core.pagination import parse_fields
 
 app = FastAPI()
 print("FastAPI is created")
-client = MongoClient(host = "localhost", port = 27017)
+# MongoDB through Motor, or the embedded SQLite store with SWIFTPREDICT_BACKEND=sqlite.
+store = create_async_store()
 origins = ["http://localhost:3000"]  # matching the React dev port
 
 app.add_middleware(
@@ -19,10 +30,32 @@ app.add_middleware(
     allow_credentials = True,
     allow_methods = ["*"],
     allow_headers = ["*"],
+    expose_headers = ["X-Next-After"],    # Page token of the paginated listings.
 )
 
-db = client["SwiftPredict"]
-run = db["Run"]
+
+# Pipelines exported with AutoML.export_pipeline(f"{SWIFTPREDICT_MODEL_DIR}/<model_name>.pkl") are served by name.
+model_server = ModelServer(
+    model_dir = os.getenv("SWIFTPREDICT_MODEL_DIR", "models"),
+    capacity = int(os.getenv("SWIFTPREDICT_MODEL_CACHE_SIZE", 8)),
+    max_batch_rows = int(os.getenv("SWIFTPREDICT_MAX_BATCH_ROWS", 1024)),
+    max_wait_ms = float(os.getenv("SWIFTPREDICT_MAX_BATCH_WAIT_MS", 2.0)),
+    check_interval = float(os.getenv("SWIFTPREDICT_MODEL_CHECK_INTERVAL", 5.0)),
+)
+
+# Rendered plots, keyed by run, metric, plotting options and the version of the plotted data.
+plot_cache = PlotCache(capacity = int(os.getenv("SWIFTPREDICT_PLOT_CACHE_SIZE", 128)))
+
+# Wakes live metric streams up on writes to their run (change streams, or polling every SWIFTPREDICT_LIVE_POLL_INTERVAL seconds).
+notifier = MetricNotifier(store, poll_interval = float(os.getenv("SWIFTPREDICT_LIVE_POLL_INTERVAL", 1.0)))
+KEEPALIVE_SECONDS = 15.0
+
+@app.on_event("startup")
+async def create_indexes():
+    """
+    Creates the indexes of the store when the server starts (a no-op if they already exist).
+    """
+    await store.ensure_indexes()
 
 @app.get("/")
 def welcome():
@@ -34,8 +67,39 @@ def welcome():
     """
     return {"Welcome": "SwiftPredict: Your compass from data to discovery."}
 
+def run_not_found(run_id: str, project_name: str) -> JSONResponse:
+    """
+    Returns the 404 response of the run mutation endpoints.
+    """
+    return JSONResponse(status_code = 404, content = {"Error": f"Run_Id : {run_id} or Project: {project_name} DOESN'T EXIST"})
+
+def json_safe(obj):
+    """
+    Replaces the NaN and infinite floats JSON can't represent (e.g. a NaN metric) with None, in nested
+    dicts and lists and in numpy arrays, which are returned as lists.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: json_safe(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [json_safe(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        finite = np.isfinite(obj) if obj.dtype.kind == "f" else None
+        return obj.tolist() if finite is None or finite.all() else np.where(finite, obj, None).tolist()
+    return obj
+
+async def find_runs(query: dict, projection: dict) -> list:
+    """
+    Returns every run document matching `query`, without their _id.
+    """
+    docs = [doc async for doc in store.iter_runs(query, projection)]
+    for doc in docs:
+        doc.pop("_id", None)
+    return docs
+
 @app.post("/{project_name}/runs/{run_id}/log_param")
-def log_param(key: str, value, run_id: str, project_name: str):
+async def log_param(key: str, value, run_id: str, project_name: str, model_name: str = None):
     """
     Logs a single parameter for a specific run of a project.
 
@@ -44,20 +108,16 @@ def log_param(key: str, value, run_id: str, project_name: str):
         value (Any): Value of the parameter.
         run_id (str): Unique identifier of the run.
         project_name (str): Name of the project.
+        model_name (str, optional): Model of the run the parameter belongs to.
 
     Returns:
-        dict: Updated run data or error message.
+        dict: Updated run data, or an error message with status 404.
     """
-    data = run.find_one({"run_id": run_id, "project_name": project_name})
-    if data:
-        param = {"run_id": run_id, "key": key, "value": value, "created_at": datetime.now(), "project_name": project_name}
-        run.insert_one(param)
-        return run.find_one({"run_id": run_id}, {"_id": 0})
-    else:
-        return {"Error": f"Run_Id : {run_id} or Project: {project_name} DOESN'T EXIST"}
+    data = await store.update_run(run_id, project_name, model_name = model_name, push = {"params": [{"key": key, "value": value}]})
+    return data if data else run_not_found(run_id, project_name)
 
 @app.post("/{project_name}/runs/{run_id}/add_tags")
-def add_tags(run_id: str, project_name: str, tags: list):
+async def add_tags(run_id: str, project_name: str, tags: list):
     """
     Adds tags to an existing run.
 
@@ -67,18 +127,13 @@ def add_tags(run_id: str, project_name: str, tags: list):
         tags (list): List of tags to add.
 
     Returns:
-        dict: Updated run data or error message.
+        dict: Updated run data, or an error message with status 404.
     """
-    data = run.find_one({"run_id": run_id, "project_name": project_name})
-    if data:
-        run.update_one({"run_id": run_id, "project_name": project_name},
-                             {"$push": {"tags": tags}})
-        run.find_one({"run_id": run_id, "project_name": project_name}, {"_id": 0})
-    else:
-        return {"Error": f"Run_Id : {run_id} or Project: {project_name} DOESN'T EXIST"}
+    data = await store.update_run(run_id, project_name, push = {"tags": tags})
+    return data if data else run_not_found(run_id, project_name)
 
 @app.post("/{project_name}/runs/{run_id}/update_status")
-def update_status(run_id: str, project_name: str, status: str):
+async def update_status(run_id: str, project_name: str, status: str):
     """
     Updates the status of a specific run.
 
@@ -88,18 +143,13 @@ def update_status(run_id: str, project_name: str, status: str):
         status (str): New status (e.g., 'completed', 'failed').
 
     Returns:
-        dict: Updated run data or error message.
+        dict: Updated run data, or an error message with status 404.
     """
-    data = run.find_one({"run_id": run_id, "project_name": project_name})
-    if data:
-        run.update_one({"run_id": run_id, "project_name": project_name},
-                             {"$set": {"status": status.lower()}})
-        return run.find_one({"run_id": run_id, "project_name": project_name}, {"_id": 0})
-    else:
-        return {"Error": f"Run_Id : {run_id} or Project: {project_name} DOESN'T EXIST"}
+    data = await store.update_run(run_id, project_name, set_fields = {"status": status.lower()})
+    return data if data else run_not_found(run_id, project_name)
 
 @app.post("/{project_name}/runs/{run_id}/add_notes")
-def add_notes(run_id: str, project_name: str, notes: str):
+async def add_notes(run_id: str, project_name: str, notes: str):
     """
     Adds descriptive notes to a specific run.
 
@@ -109,36 +159,13 @@ def add_notes(run_id: str, project_name: str, notes: str):
         notes (str): Notes or description about the run.
 
     Returns:
-        dict: Updated run data or error message.
-    """
-    data = run.find_one({"run_id": run_id, "project_name": project_name})
-    if data:
-        run.update_one({"run_id": run_id, "project_name": project_name},
-                       {"$set": {"notes": notes}})
-        return run.find_one({"run_id": run_id, "project_name": project_name}, {"_id": 0})
-    else:
-        return {"Error": f"Run_Id : {run_id} or Project: {project_name} DOESN'T EXIST"}
-
-@app.get("/projects/{status}")
-def get_projects_from_status(status: str):
+        dict: Updated run data, or an error message with status 404.
     """
-    Retrieves all projects with the given status.
-
-    Args:
-        status (str): Run status to filter by (e.g., 'completed').
-
-    Returns:
-        dict: List of projects with the specified status or a message.
-    """
-    data = run.find({"status": status.lower()}, {"_id": 0}).to_list()
-    if data:
-        return {"data":data}
-
-    else:
-        return {"message": f"No {status} projects found"}
+    data = await store.update_run(run_id, project_name, set_fields = {"notes": notes})
+    return data if data else run_not_found(run_id, project_name)
 
 @app.get("/{project_name}/runs/{run_id}")
-def fetch_run_id(run_id: str, project_name: str):
+async def fetch_run_id(run_id: str, project_name: str):
     """
     Retrieves all details associated with a specific run ID.
 
@@ -149,43 +176,121 @@ def fetch_run_id(run_id: str, project_name: str):
     Returns:
         dict: Run details or error message.
     """
-    docs = list(run.find({"run_id": run_id, "project_name": project_name}, {"model_name": 1, "run_id": 1, "metrics.metric": 1, "created_at": 1, "project_name": 1, "_id": 0}))
+    docs = await find_runs({"run_id": run_id, "project_name": project_name}, {"model_name": 1, "run_id": 1, "metrics.metric": 1, "created_at": 1, "project_name": 1})
     if docs:
         return docs
     else:
         return {"Error": f"Run_Id : {run_id}, DOESN'T EXIST"}
 
+async def list_runs(query: dict, default_projection: dict, limit: int, after: str, fields: str, stream: bool,
+                    wrap: str = None, empty: dict = None):
+    """
+    Lists Run documents sorted by _id, one page at a time, as JSON or as streamed NDJSON.
+
+    Args:
+        query (dict): Filter of the listing.
+        default_projection (dict): Projection used when the caller doesn't select `fields`.
+        limit (int): Maximum number of documents returned. None returns every document.
+        after (str): Token of the page to return, taken from the previous page.
+        fields (str): Comma-separated fields selected by the caller.
+        stream (bool): Stream one JSON document per line instead of returning a single JSON body.
+        wrap (str, optional): Key the JSON list is wrapped in, e.g. 'data'.
+        empty (dict, optional): Body returned when the first page is empty.
+
+    Returns:
+        Response: In JSON mode the next page's token, if any, is sent in the 'X-Next-After' header.
+                  In NDJSON mode it is sent as a final {"next_after": token} line.
+
+    Notes:
+        - Paging on the indexed _id (instead of skip/offset) keeps every page an index range scan.
+    """
+    try:
+        projection = parse_fields(fields, default_projection)
+        after_id = store.decode_after(after) if after else None
+    except ValueError as e:
+        return JSONResponse(status_code = 400, content = {"Error": str(e)})
+    if limit is not None and limit < 1:
+        return JSONResponse(status_code = 400, content = {"Error": "limit must be at least 1"})
+
+    # One extra document tells whether there is a next page.
+    docs = store.iter_runs(query, projection, after = after_id, limit = limit + 1 if limit is not None else None)
+
+    if stream:
+        async def lines():
+            count, last_id = 0, None
+            async for doc in docs:
+                if limit is not None and count == limit:
+                    yield json.dumps({"next_after": store.encode_after(last_id)}) + "\n"
+                    break
+                count, last_id = count + 1, doc.pop("_id")
+                yield json.dumps(json_safe(jsonable_encoder(doc))) + "\n"
+        return StreamingResponse(lines(), media_type = "application/x-ndjson")
+
+    docs = [doc async for doc in docs]
+    headers = {}
+    if limit is not None and len(docs) > limit:
+        docs = docs[:limit]
+        headers["X-Next-After"] = store.encode_after(docs[-1]["_id"])
+    for doc in docs:
+        doc.pop("_id", None)
+    if not docs and not after and empty:
+        return empty
+    return JSONResponse(content = json_safe(jsonable_encoder({wrap: docs} if wrap else docs)), headers = headers)
+
 @app.get("/projects/dl")
-def get_all_dl_projects():
+async def get_all_dl_projects(limit: int = None, after: str = None, fields: str = None, stream: bool = False):
     """
-    Retrieves a list of all distinct project names.
+    Retrieves the runs of all DL projects.
+
+    Args:
+        limit (int, optional): Page size. Defaults to every run.
+        after (str, optional): Page token from the 'X-Next-After' header of the previous page.
+        fields (str, optional): Comma-separated fields to return. Defaults to the run identifiers and metric names.
+        stream (bool, optional): Stream the runs as NDJSON. Defaults to False.
 
     Returns:
-        list or dict: List of project names or an error message.
+        list or dict: List of runs or an error message.
     """
-    projects = list(run.find({"project_type": "DL"}, {"model_name": 1, "run_id": 1, "metrics.metric": 1, "created_at": 1, "project_name": 1, "_id": 0}))
-    if projects:
-        return projects
-    else:
-        return {"Error": "No, DL Projects found"}
+    return await list_runs({"project_type": "DL"}, {"model_name": 1, "run_id": 1, "metrics.metric": 1, "created_at": 1, "project_name": 1},
+                           limit, after, fields, stream, empty = {"Error": "No, DL Projects found"})
 
 @app.get("/projects/ml")
-def get_all_ml_projects():
+async def get_all_ml_projects(limit: int = None, after: str = None, fields: str = None, stream: bool = False):
     """
-    Retrieves a list of all distinct project names.
+    Retrieves the runs of all ML projects.
+
+    Args:
+        limit (int, optional): Page size. Defaults to every run.
+        after (str, optional): Page token from the 'X-Next-After' header of the previous page.
+        fields (str, optional): Comma-separated fields to return. Defaults to every field except created_at.
+        stream (bool, optional): Stream the runs as NDJSON. Defaults to False.
 
     Returns:
-        list or dict: List of project names or an error message.
+        list or dict: List of runs or an error message.
     """
-    projects = list(run.find({"project_type": "ML"}, {"created_at": 0, "_id": 0}))
-    print(projects)
-    if projects:
-        return projects
-    else:
-        return {"Error": "No, ML Projects found"}
+    return await list_runs({"project_type": "ML"}, {"created_at": 0}, limit, after, fields, stream,
+                           empty = {"Error": "No, ML Projects found"})
+
+@app.get("/projects/{status}")    # Declared after /projects/dl and /projects/ml, which it would otherwise shadow.
+async def get_projects_from_status(status: str, limit: int = None, after: str = None, fields: str = None, stream: bool = False):
+    """
+    Retrieves all projects with the given status.
+
+    Args:
+        status (str): Run status to filter by (e.g., 'completed').
+        limit (int, optional): Page size. Defaults to every run.
+        after (str, optional): Page token from the 'X-Next-After' header of the previous page.
+        fields (str, optional): Comma-separated fields to return. Defaults to every field.
+        stream (bool, optional): Stream the runs as NDJSON. Defaults to False.
+
+    Returns:
+        dict: List of projects with the specified status or a message.
+    """
+    return await list_runs({"status": status.lower()}, {}, limit, after, fields, stream, wrap = "data",
+                           empty = {"message": f"No {status} projects found"})
 
 @app.get("/{project_name}/plots/available_metrics")
-def get_available_metrics(project_name: str):
+async def get_available_metrics(project_name: str):
     """
     Lists all available metrics logged for a given project.
 
@@ -195,52 +300,195 @@ def get_available_metrics(project_name: str):
     Returns:
         dict: List of available metrics per run.
     """
-    metrics = run.find({"project_name": project_name}, {"metrics.metric": 1, "_id": 0, "run_id": 1}).to_list()
+    metrics = await find_runs({"project_name": project_name}, {"metrics.metric": 1, "run_id": 1})
     # uniq_metrics = list(set(metrics))    # Getting only the unique metrics.
 
     return {"all_available_metrics": metrics}
 
-@app.get("/{project_name}/plots/{metric}")
-def plot_metrics(metric: str, run_id: str, project_name: str):
+@app.get("/{project_name}/leaderboard")
+async def get_leaderboard(project_name: str, metric: str = None, goal: str = "max", by: str = "best", top_k: int = None):
     """
-    Generates and returns a plot image for a specific metric of a run.
-    Only used in case of DL project type.
+    Compares the runs of a project: the best and last value of every metric per run and model,
+    computed with one aggregation in the database instead of shipping every run document.
+
+    Args:
+        project_name (str): Name of the project.
+        metric (str, optional): Only compare this metric (e.g., 'accuracy'). Defaults to every metric.
+        goal (str, optional): 'max' if higher values are better (accuracy), 'min' otherwise (loss). Defaults to 'max'.
+        by (str, optional): Rank on the 'best' or the 'last' value. Defaults to 'best'.
+        top_k (int, optional): Number of rows returned per metric. Defaults to every row.
+
+    Returns:
+        dict: Ranked rows {run_id, model_name, metric, best, best_step, last, last_step, points}
+              (NaN values as null, ranked last), or an error message with status 400/404.
+    """
+    if goal not in LEADERBOARD_GOALS or by not in LEADERBOARD_KEYS or (top_k is not None and top_k < 1):
+        return JSONResponse(status_code = 400, content = {"Error": f"goal must be one of {list(LEADERBOARD_GOALS)}, by one of {list(LEADERBOARD_KEYS)} and top_k at least 1"})
+    rows = await store.leaderboard(project_name, metric.lower() if metric else None, goal, by, top_k)
+    if not rows:
+        return JSONResponse(status_code = 404, content = {"Error": f"No metrics logged for Project: {project_name}"})
+    return {"project_name": project_name, "metric": metric, "goal": goal, "by": by, "rows": json_safe(rows)}
+
+def render_series(steps, values, max_points: int, method: str, metric: str, run_id: str) -> bytes:
+    """
+    Downsamples a series and renders it to PNG bytes.
+    """
+    steps, values = downsample(steps, values, max_points, method)
+    return render_metric_plot(steps, values, metric, run_id)
+
+def invalid_method(method: str):
+    """
+    Returns a 400 response if `method` isn't a known downsampling method, else None.
+    """
+    if method not in DOWNSAMPLING_METHODS:
+        return JSONResponse(status_code = 400, content = {"Error": f"method must be one of {list(DOWNSAMPLING_METHODS)}"})
+    return None
+
+@app.get("/{project_name}/runs/{run_id}/metrics/{metric}")
+async def fetch_metric(metric: str, run_id: str, project_name: str, max_points: int = None, method: str = "lttb", since: float = None):
+    """
+    Retrieves the logged steps and values of a metric of a DL run, optionally downsampled on the server.
 
     Args:
         metric (str): Name of the metric (e.g., 'loss').
         run_id (str): Unique identifier of the run.
         project_name (str): Name of the project.
+        max_points (int, optional): Maximum number of points returned. Defaults to every point.
+        method (str, optional): Downsampling method, 'lttb' or 'minmax'. Defaults to 'lttb'.
+        since (float, optional): Only return the points logged after this step. Defaults to every point.
 
     Returns:
-        StreamingResponse or dict: PNG image stream of the plot or error message.
+        dict: The metric's steps and values ordered by step, the number of points read and the
+              'next_since' step to poll with, or an error message with status 400/404.
+
+    Notes:
+        - Polling with `since` set to the previous response's 'next_since' only reads and transfers new points.
+        - NaN values (e.g. a diverged loss) are returned as null.
+    """
+    error = invalid_method(method)
+    if error:
+        return error
+    metric = metric.lower()
+    if since is None:
+        points = await store.read_series(run_id, project_name, metric)
+    else:
+        points = await store.read_series_since(run_id, project_name, metric, since)
+    if points is None:
+        return JSONResponse(status_code = 404, content = {"Error": f"Run_Id : {run_id} or Project: {project_name} of DL project_type DOESN'T EXIST OR The metrics field DOESN'T EXIST."})
+    next_since = float(points[0][-1]) if len(points[0]) else since
+    steps, values = await run_in_threadpool(downsample, points[0], points[1], max_points, method)
+    return {"metric": metric, "total_points": len(points[0]), "next_since": next_since, "step": steps.tolist(), "value": json_safe(values)}
+
+@app.get("/{project_name}/runs/{run_id}/metrics/{metric}/stream")
+async def stream_metric(request: Request, metric: str, run_id: str, project_name: str, since: float = None):
     """
+    Streams the new points of a metric of a DL run as server-sent events.
 
-    data = run.find_one({"run_id": run_id, "project_name": project_name, "metrics.metric": metric.lower(), "project_type": "DL"})
-    if data:
-        values = data["metrics"]["details"]
-        steps = values["step"]
-        iter_values = values["value"]
+    Every event is a JSON object {"step": [...], "value": [...], "next_since": step} holding only the
+    points logged since the previous event (NaN values as null). The stream is woken up by a MongoDB change stream when
+    the server supports it, and polls otherwise; either way it only reads a run's new points after
+    the run's version changes.
 
-        plt.figure()
-        plt.plot(steps, iter_values)
-        plt.xlabel("Step")
-        plt.ylabel(metric.title())
-        plt.title(f"{metric.title()} plot of Run_id : {run_id}")
+    Args:
+        request (Request): The incoming request, used to stop when the client disconnects.
+        metric (str): Name of the metric (e.g., 'loss').
+        run_id (str): Unique identifier of the run.
+        project_name (str): Name of the project.
+        since (float, optional): Only stream the points logged after this step. Defaults to every point.
 
-        # fig = plt.gcf()
-        # return fig, This statement will raise an error as fig is a python object and not a web serializable response, So we need to stream this in the form of binary streams.
+    Returns:
+        StreamingResponse: The 'text/event-stream' response, or an error message with status 404.
+    """
+    metric = metric.lower()
+    if await store.metric_version(run_id, project_name, metric) is None:
+        return JSONResponse(status_code = 404, content = {"Error": f"Run_Id : {run_id} or Project: {project_name} of DL project_type DOESN'T EXIST OR The metrics field DOESN'T EXIST."})
+
+    async def events():
+        key = (project_name, run_id)
+        changed = notifier.subscribe(key)
+        last_since, last_version, last_sent = since, None, time.monotonic()
+        try:
+            while not await request.is_disconnected():
+                changed.clear()    # Writes landing while reading set it again, so none are missed.
+                current = await store.metric_version(run_id, project_name, metric)
+                if current is None:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+                if current != last_version:
+                    last_version = current
+                    if last_since is None:
+                        points = await store.read_series(run_id, project_name, metric)
+                    else:
+                        points = await store.read_series_since(run_id, project_name, metric, last_since)
+                    if points is None:    # Deleted in the meantime.
+                        yield "event: end\ndata: {}\n\n"
+                        return
+                    steps, values = points
+                    if len(steps):
+                        last_since, last_sent = float(steps[-1]), time.monotonic()
+                        yield f"data: {json.dumps({'step': steps.tolist(), 'value': json_safe(values), 'next_since': last_since})}\n\n"
+                if time.monotonic() - last_sent >= KEEPALIVE_SECONDS:
+                    last_sent = time.monotonic()
+                    yield ": keep-alive\n\n"
+                await notifier.wait(changed, KEEPALIVE_SECONDS)
+        finally:
+            notifier.unsubscribe(key, changed)
+
+    return StreamingResponse(events(), media_type = "text/event-stream", headers = {"Cache-Control": "no-cache"})
 
-        buf = BytesIO()
-        plt.savefig(buf, format = "png")
-        buf.seek(0)
+@app.get("/{project_name}/plots/{metric}")
+async def plot_metrics(metric: str, run_id: str, project_name: str, max_points: int = 2000, method: str = "lttb"):
+    """
+    Generates and returns a plot image for a specific metric of a run.
+    Only used in case of DL project type.
 
-        return StreamingResponse(buf, media_type = "image/png")
+    Args:
+        metric (str): Name of the metric (e.g., 'loss').
+        run_id (str): Unique identifier of the run.
+        project_name (str): Name of the project.
+        max_points (int, optional): Series longer than this are downsampled before plotting. Defaults to 2000.
+        method (str, optional): Downsampling method, 'lttb' or 'minmax'. Defaults to 'lttb'.
 
-    else:
-        return {"Error": f"Run_Id : {run_id} or Project: {project_name} of DL project_type DOESN'T EXIST OR The metrics field DOESN'T EXIST."}
+    Returns:
+        Response or dict: PNG image of the plot or error message.
+
+    Notes:
+        - Rendered plots are cached in memory until the run logs new points for the metric,
+          so repeated dashboard refreshes skip reading and rendering the series.
+    """
+
+    error = invalid_method(method)
+    if error:
+        return error
+    metric = metric.lower()
+    error = {"Error": f"Run_Id : {run_id} or Project: {project_name} of DL project_type DOESN'T EXIST OR The metrics field DOESN'T EXIST."}
+    version = await store.metric_version(run_id, project_name, metric)
+    if version is None:
+        return error
+
+    key = (project_name, run_id, metric, max_points, method, version)
+    png = plot_cache.get(key)
+    if png is None:
+        points = await store.read_series(run_id, project_name, metric)
+        if points is None:    # Deleted in the meantime.
+            return error
+        steps, values = points
+        png = await run_in_threadpool(render_series, steps, values, max_points, method, metric, run_id)    # Keeping matplotlib off the event loop.
+        plot_cache.set(key, png)
+    return Response(content = png, media_type = "image/png")
+
+@app.get("/plots/cache_stats")
+def get_plot_cache_stats():
+    """
+    Reports the size and hit/miss counts of the rendered-plot cache.
+
+    Returns:
+        dict: Plot cache statistics.
+    """
+    return plot_cache.stats()
 
 @app.delete("/projects/delete")
-def delete_projects(project_name: str, run_id: str = None):
+async def delete_projects(project_name: str, run_id: str = None):
     """
     Deletes a specific run or all runs under a project.
 
@@ -251,27 +499,81 @@ def delete_projects(project_name: str, run_id: str = None):
     Returns:
         dict: Confirmation message of deleted entries.
     """
-    if run_id:
-        data = run.delete_many({"run_id": run_id, "project_name": project_name})
-        return {"deleted": f"{data.deleted_count} files have been deleted."}
-
-    else:
-        data = run.delete_many({"project_name": project_name})
-        return {"deleted": f"{data.deleted_count} files have been deleted."}
+    deleted = await store.delete_runs(project_name, run_id)
+    return {"deleted": f"{deleted} files have been deleted."}
 
 @app.delete("/delete_all")
-def delete_all():
+async def delete_all():
     """
     Deletes all run data from the database.
 
     Returns:
         dict: Message indicating whether deletion was successful.
     """
-    db.drop_collection("Run")
-    if db.list_collections().to_list():
+    if not await store.delete_all():
         return {"error": "Deletion Failed"}
     else:
         return {"message": "The data deleted successfully."}
 
+@app.post("/models/{model_name}/predict")
+async def predict(model_name: str, records: list[dict]):
+    """
+    Predicts on raw records with an exported AutoML pipeline.
+
+    Concurrent requests for the same model are micro-batched into a single vectorized predict call.
+
+    Args:
+        model_name (str): Name of the exported pipeline file, without the '.pkl' extension.
+        records (list[dict]): Raw rows keyed by the training CSV's column names.
+
+    Returns:
+        dict: Predictions in the order of the records, or an error message with status 404 (unknown model)
+              or 400 (no records, or records the pipeline can't convert).
+    """
+    try:
+        predictions = await model_server.predict(model_name, records)
+    except FileNotFoundError as e:
+        return JSONResponse(status_code = 404, content = {"Error": str(e)})
+    except (ValueError, TypeError, KeyError) as e:    # Raised while converting or predicting on the records.
+        return JSONResponse(status_code = 400, content = {"Error": f"Invalid records: {e}"})
+    return {"predictions": predictions}
+
+@app.post("/models/{model_name}/reload")
+def reload_model(model_name: str):
+    """
+    Makes the next prediction request load a model's file again, e.g. right after re-exporting it.
+
+    Without this, a re-exported or deleted model is noticed within SWIFTPREDICT_MODEL_CHECK_INTERVAL seconds.
+
+    Args:
+        model_name (str): Name of the exported pipeline file, without the '.pkl' extension.
+
+    Returns:
+        dict: Confirmation message.
+    """
+    model_server.cache.reload(model_name)
+    return {"message": f"Model {model_name} will be reloaded on the next request."}
+
+@app.get("/connections/stats")
+def get_connection_stats():
+    """
+    Reports the MongoDB connections of the API process: the API's own pool plus any shared client pools.
+
+    Returns:
+        dict: Connection counts, or an empty 'api' entry with the SQLite backend.
+    """
+    pool_stats = getattr(store, "pool_stats", None)
+    return {"api": pool_stats() if pool_stats else {}, "clients": connection_stats()}
+
+@app.get("/models/stats")
+def get_model_stats():
+    """
+    Reports the loaded models plus p50/p99 latency and batch-size histograms per model.
+
+    Returns:
+        dict: Serving statistics.
+    """
+    return model_server.stats()
+
 if __name__ == '__main__':
     uvicorn.run(app, port = 8000)
\ No newline at end of file
@@ -1,29 +1,41 @@
 # Importing dependencies
-import os
+import time
+import queue
 import secrets
+import weakref
+import threading
 from datetime import datetime
-from pymongo import MongoClient
+from ..core.storage import TrackingStore, create_store, register_exit_callback
 
 
 class SwiftPredict:
     """
     A lightweight experiment tracking class for logging parameters, metrics, and run metadata
-    to a MongoDB backend.
+    to a MongoDB backend (or an embedded SQLite database).
 
     Attributes:
         run_id (str): A unique identifier for the current run.
         api_base (str): The base URL for the FastAPI server (default is localhost).
         project_name (str): Name of the ML project or experiment.
         created_at (datetime): Timestamp when the run was created.
-        client (MongoClient): MongoDB client instance.
-        db (Database): MongoDB database named 'SwiftPredict'.
-        run (Collection): MongoDB collection for storing run-related data.
+        store (TrackingStore): Storage backend the run is logged to.
+        run (Collection): MongoDB collection for storing run-related data (None with the SQLite backend).
+        buffered (bool): If True, params and metrics are queued in memory and written in batches.
+        background (bool): If True, batches are written by a background thread fed by a bounded queue.
+        stats (dict): Counts of 'enqueued', 'written' and 'dropped' events in buffered/background mode.
+        bucketed (bool): If True, step metrics are stored in fixed-size bucket documents (DL only).
 
     Environment Variables:
+        SWIFTPREDICT_BACKEND: Storage backend, 'mongo' or 'sqlite'. Defaults to 'mongo'.
         MONGO_URI: MongoDB connection string. Defaults to 'mongodb://localhost:27017'.
+        SWIFTPREDICT_SQLITE_PATH: Database file of the SQLite backend.
     """
 
-    def __init__(self, project_name: str, project_type: str, api_base: str = "http://localhost:8000"):
+    def __init__(self, project_name: str, project_type: str, api_base: str = "http://localhost:8000",
+                 buffered: bool = False, flush_size: int = 500, flush_interval: float = 5.0,
+                 background: bool = False, queue_size: int = 10000, when_full: str = "block",
+                 metric_storage: str = "document", backend: str = None, store: TrackingStore = None,
+                 flush_retries: int = 3):
         """
         Initializes a new SwiftPredict run instance.
 
@@ -31,16 +43,205 @@ class SwiftPredict:
             project_name (str): The name of the project for which the run is being logged.
             project_type (str): Can be either ML or DL.
             api_base (str, optional): Base URL of the FastAPI backend. Defaults to 'http://localhost:8000'.
+            buffered (bool, optional): Queue params and metrics in memory and write them with a single
+                `bulk_write` of upserts instead of one round trip per call. Defaults to False.
+            flush_size (int, optional): Number of queued events that triggers a flush in buffered mode.
+            flush_interval (float, optional): Seconds after the last flush after which the next logging
+                call triggers a flush in buffered mode.
+            background (bool, optional): Hand events to a worker thread through a bounded queue so
+                logging calls never wait on MongoDB. Implies buffered. Defaults to False.
+            queue_size (int, optional): Maximum number of events waiting in the background queue.
+            when_full (str, optional): What to do when the background queue is full, either 'block'
+                (wait for free space) or 'drop' (discard the event and count it). Defaults to 'block'.
+            metric_storage (str, optional): Where DL step metrics are stored, either 'document' (arrays
+                inside the run document) or 'bucketed' (fixed-size documents in the MetricBuckets
+                collection, so long runs never approach MongoDB's 16 MB document limit). Ignored for
+                ML projects. Defaults to 'document'.
+            backend (str, optional): Storage backend, 'mongo' or 'sqlite' (no server needed, for local
+                experimentation and CI). Defaults to the SWIFTPREDICT_BACKEND environment variable.
+            store (TrackingStore, optional): An already opened store, shared instead of opening a new one.
+            flush_retries (int, optional): Number of consecutive failed flushes after which buffered mode drops
+                the buffered events (counted in `stats['dropped']`). Errors that retrying can't fix, like a value
+                the store can't encode, drop the batch right away. Defaults to 3.
+
+        Notes:
+            - In buffered mode the queue is also flushed on `finalize_run`, `find_project_runs`
+              and at interpreter exit. Call `flush()` to force a write.
+            - In background mode `flush()` waits until the worker has written every queued event
+              and `close()` additionally stops the worker.
         """
+        if when_full not in ("block", "drop"):
+            raise ValueError("when_full must be either 'block' or 'drop'.")
+        if metric_storage not in ("document", "bucketed"):
+            raise ValueError("metric_storage must be either 'document' or 'bucketed'.")
+
         self.run_id = secrets.token_hex(8)
         self.api_base = api_base
         self.project_name = project_name
         self.created_at = datetime.now()
-        mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-        self.client = MongoClient(mongo_uri)
-        self.db = self.client["SwiftPredict"]
-        self.run = self.db["Run"]
+        self._owns_store = store is None
+        self.store = store or create_store(backend)
         self.project_type = project_type
+        self.bucketed = metric_storage == "bucketed" and project_type == "DL"
+        self.buffered = buffered or background
+        self.background = background
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.when_full = when_full
+        self.flush_retries = flush_retries
+        self._failed_flushes = 0
+        self.stats = {"enqueued": 0, "written": 0, "dropped": 0}
+        self._stats_lock = threading.Lock()
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._closed = False
+        if background:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._worker = threading.Thread(target=self._drain, name=f"SwiftPredict-{self.run_id}", daemon=True)
+            self._worker.start()
+        if self.buffered:
+            _open_loggers.add(self)
+
+    @property
+    def run(self):
+        """
+        The store's MongoDB collection, kept for code querying it directly (None with the SQLite backend).
+        """
+        return getattr(self.store, "run", None)
+
+    def _count(self, key: str, amount: int = 1):
+        """
+        Increments one of the event counters in `stats`.
+        """
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _enqueue(self, event: tuple):
+        """
+        Adds a logging event to the in-memory buffer (or the background queue) and flushes
+        the buffer once a threshold is reached.
+
+        Raises:
+            RuntimeError: If the logger has already been closed.
+        """
+        if self._closed:
+            raise RuntimeError("This SwiftPredict logger has been closed.")
+        if self.background:
+            try:
+                self._queue.put(event, block=self.when_full == "block")
+            except queue.Full:
+                self._count("dropped")
+                return
+            self._count("enqueued")
+            return
+
+        self._buffer.append(event)
+        self._count("enqueued")
+        if len(self._buffer) >= self.flush_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _drain(self):
+        """
+        Worker loop of the background mode.
+
+        Blocks for the next event, then takes whatever else is already queued (up to `flush_size`)
+        and writes it as one batch, so batches grow with the logging rate. A `None` event stops the loop.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.flush_size and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [event for event in batch if event is not None]
+            try:
+                self._write_events(events)
+                self._count("written", len(events))
+            except Exception as e:    # Keeping the worker alive whatever the backend raises.
+                self._count("dropped", len(events))
+                print(f"SwiftPredict: Failed to write {len(events)} logging events: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if batch[-1] is None:
+                return
+
+    def _write_events(self, events: list):
+        """
+        Writes a batch of logging events with one `TrackingStore.write_batch` call.
+
+        Events belonging to the same model are merged, so with MongoDB a batch costs one
+        `bulk_write` round trip regardless of how many params or metric steps it holds
+        (plus one for the buckets with bucketed metric storage).
+
+        Args:
+            events (list): Tuples of ("param", model_name, key, value) or
+                           ("metric", model_name, key, step, value).
+        """
+        grouped = {}
+        for event in events:
+            model = grouped.setdefault(event[1], {"params": [], "metric": [], "step": [], "value": []})
+            if event[0] == "param":
+                model["params"].append({"key": event[2], "value": event[3]})
+            else:
+                model["metric"].append(event[2])
+                model["step"].append(event[3])
+                model["value"].append(event[4])
+
+        if grouped:
+            run = {"run_id": self.run_id, "project_name": self.project_name, "project_type": self.project_type}
+            self.store.write_batch(run, self.created_at, grouped, bucketed=self.bucketed)
+
+    def flush(self):
+        """
+        Writes all buffered params and metrics to the database.
+
+        In background mode this waits until the worker thread has processed every queued event.
+
+        Raises:
+            Exception: A transient error of the store (see `TrackingStore.transient_errors`). The buffered
+                       events are kept for the next flush, until `flush_retries` flushes in a row failed.
+        """
+        if self.background:
+            if self._worker.is_alive():
+                self._queue.join()
+            return
+
+        self._last_flush = time.monotonic()
+        try:
+            self._write_events(self._buffer)
+        except Exception as e:
+            self._failed_flushes += 1
+            if isinstance(e, self.store.transient_errors) and self._failed_flushes < self.flush_retries:
+                raise    # The events stay buffered for the next flush.
+            # Retrying can't succeed (or kept failing), so the batch is dropped instead of wedging the logger.
+            self._count("dropped", len(self._buffer))
+            print(f"SwiftPredict: Failed to write {len(self._buffer)} logging events: {e}")
+        else:
+            self._count("written", len(self._buffer))
+        self._buffer = []
+        self._failed_flushes = 0
+
+    def close(self):
+        """
+        Flushes all pending events, stops the background worker, if any, and closes the store
+        unless it was passed in by the caller.
+
+        Logging after `close()` raises a RuntimeError. Calling `close()` more than once is a no-op.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self.background:
+            self._queue.put(None)
+            self._worker.join()
+        if self._owns_store:
+            self.store.close()
+        _open_loggers.discard(self)
 
     def log_param(self, key: str, value, model_name: str):
         """
@@ -54,29 +255,14 @@ class SwiftPredict:
         Notes:
             - If the run already exists, the parameter is appended to the list.
             - If the run does not exist, a new document is created with the parameter.
+            - Either way this is a single upsert (no read before the write).
+            - In buffered mode the parameter is queued and upserted on the next flush.
         """
-        check = self.run.find_one({
-            "run_id": self.run_id,
-            "model_name": model_name,
-            "project_type": self.project_type
-        })
-        if check:
-            self.run.update_one(
-                {"run_id": self.run_id, "model_name": model_name, "project_type": self.project_type},
-                {
-                    "$set": {"project_name": self.project_name, "created_at": self.created_at},
-                    "$push": {"params": {"key": key, "value": value}}
-                }
-            )
+        event = ("param", model_name, key, value)
+        if self.buffered:
+            self._enqueue(event)
         else:
-            self.run.insert_one({
-                "run_id": self.run_id,
-                "params": [{"key": key, "value": value}],
-                "created_at": self.created_at,
-                "project_name": self.project_name,
-                "model_name": model_name,
-                "project_type": self.project_type
-            })
+            self._write_events([event])
 
     def log_or_update_metric(self, key: str, value, model_name: str, step: float = None):
         """
@@ -92,58 +278,17 @@ class SwiftPredict:
             - If the metric key already exists, new step and value are appended to lists.
             - If not, a new metrics document is created.
             - Multiple values are only meaningful for DL project types (one per epoch/step).
+            - In buffered mode the metric is queued and upserted on the next flush.
+            - With bucketed metric storage the point is appended to the metric's current bucket.
         """
-        check = self.run.find_one({
-            "run_id": self.run_id,
-            "project_name": self.project_name,
-            "model_name": model_name
-        })
-        type_check = self.run.find_one({
-            "run_id": self.run_id,
-            "project_name": self.project_name,
-            "project_type": "DL"
-        })
-        if check:
-            if type_check:
-                if step is not None:
-                    self.run.update_one(
-                        {"run_id": self.run_id, "project_name": self.project_name, "model_name": model_name},
-                        {
-                            "$push": {
-                                "metrics.metric": key.lower(),
-                                "metrics.details.step": float(step),
-                                "metrics.details.value": float(value)
-                            }
-                        }
-                    )
-                else:
-                    raise ValueError("Provide step for DL project types!")
-            else:
-                self.run.update_one(
-                    {"run_id": self.run_id, "project_name": self.project_name, "model_name": model_name},
-                    {
-                        "$push": {
-                            "metrics.metric": key.lower(),
-                            "metrics.details.step": 0.0,
-                            "metrics.details.value": float(value)
-                        }
-                    }
-                )
+        if self.project_type == "DL" and step is None:
+            raise ValueError("Provide step for DL project types!")
+        step = float(step) if step is not None and self.project_type == "DL" else 0.0
+        event = ("metric", model_name, key.lower(), step, float(value))
+        if self.buffered:
+            self._enqueue(event)
         else:
-            self.run.insert_one({
-                "run_id": self.run_id,
-                "project_name": self.project_name,
-                "model_name": model_name,
-                "metrics": {
-                    "metric": [key.lower()],
-                    "details": {
-                        "step": [float(step)] if step is not None else [0.0],
-                        "value": [float(value)]
-                    }
-                },
-                "created_at": self.created_at,
-                "project_type": self.project_type,
-            })
+            self._write_events([event])
 
     def log_params(self, params: dict, model_name: str):
         """
@@ -159,14 +304,35 @@ class SwiftPredict:
         for key, value in params.items():
             self.log_param(key=key, value=value, model_name=model_name)
 
-    def find_project_runs(self) -> list:
+    def iter_project_runs(self, fields: list = None, batch_size: int = 500):
+        """
+        Iterates over the run records of the current project without loading them all at once.
+
+        Args:
+            fields (list, optional): Fields to return. Defaults to every field.
+            batch_size (int, optional): Number of documents fetched per round trip.
+
+        Yields:
+            dict: One document at a time, excluding MongoDB _id fields.
+        """
+        if self.buffered:
+            self.flush()
+        projection = {field: 1 for field in fields} if fields else None
+        for doc in self.store.iter_runs({"project_name": self.project_name}, projection, batch_size=batch_size):
+            doc.pop("_id", None)
+            yield doc
+
+    def find_project_runs(self, fields: list = None) -> list:
         """
         Retrieves all run records for the current project.
 
+        Args:
+            fields (list, optional): Fields to return. Defaults to every field.
+
         Returns:
             list: All documents for this project, excluding MongoDB _id fields.
         """
-        return list(self.run.find({"project_name": self.project_name}, {"_id": 0}))
+        return list(self.iter_project_runs(fields=fields))
 
     def finalize_run(self, status: str, notes: str = "", tags: list = None):
         """
@@ -177,13 +343,24 @@ class SwiftPredict:
             notes (str, optional): Additional notes about the run. Defaults to empty string.
             tags (list, optional): List of tags or labels associated with the run. Defaults to None.
         """
-        self.run.update_many(
-            {"run_id": self.run_id},
-            {
-                "$set": {
-                    "status": status.lower(),
-                    "notes": notes,
-                    "tags": tags or []
-                }
-            }
-        )
\ No newline at end of file
+        if self.buffered:
+            self.flush()
+        self.store.finalize_run(self.run_id, status.lower(), notes, tags or [])
+
+
+# Buffered loggers not closed yet. Weak references, so a logger dropped without close() isn't kept alive.
+_open_loggers = weakref.WeakSet()
+
+
+def _close_at_exit():
+    """
+    Flushes and closes every buffered SwiftPredict instance still open at interpreter exit.
+    """
+    for logger in list(_open_loggers):
+        try:
+            logger.close()
+        except Exception as e:    # Still closing the remaining loggers.
+            print(f"SwiftPredict: Failed to flush run {logger.run_id} at exit: {e}")
+
+
+register_exit_callback(_close_at_exit)    # Runs before the shared MongoDB clients are closed.
@@ -1,5 +1,21 @@
 # Importing dependencies
-from pymongo import MongoClient
+import os
+from pathlib import Path
+from pymongo import MongoClient, IndexModel, ASCENDING
+from backend.app.core.metric_store import METRIC_BUCKETS, BUCKET_INDEXES
+
+# Connection settings shared by the API and the setup script
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
+MONGO_MAX_POOL_SIZE = int(os.getenv("SWIFTPREDICT_MONGO_POOL_SIZE", 100))
+
+def default_cache_dir() -> Path:
+    """
+    Returns the directory used for SwiftPredict's local caches and the SQLite tracking database.
+
+    Environment Variables:
+        SWIFTPREDICT_CACHE_DIR: Overrides the default of '~/.cache/swiftpredict'.
+    """
+    return Path(os.getenv("SWIFTPREDICT_CACHE_DIR", Path.home() / ".cache" / "swiftpredict"))
 
 # Defining the schema
 validator = {
@@ -25,7 +41,7 @@ validator = {
                                  }}
                        },
             "metrics": {"bsonType": "object",    # metrics = {metric: Name of the metric, details: {step:[all the steps], value: [ALl the corresponding values]}
-                       "required": ["metric", "details"],
+                       "required": ["metric"],    # Runs with bucketed metric storage only record the metric names here.
                         "properties": {
                             "metric": {"bsonType": "array",
                                        "items": {"bsonType": "string"}},
@@ -44,8 +60,74 @@ validator = {
     }
 }
 
+# Indexes matching the filters used by the API and the SwiftPredict client
+RUN_INDEXES = [
+    # {run_id}, {run_id, project_name}, {run_id, project_name, model_name(, project_type)}
+    IndexModel([("run_id", ASCENDING), ("project_name", ASCENDING), ("model_name", ASCENDING)], name = "run_project_model"),
+    # Listings are paginated on _id, so each listing filter is indexed together with _id.
+    # {project_name}: project runs, available metrics and deletes
+    IndexModel([("project_name", ASCENDING), ("_id", ASCENDING)], name = "project_id"),
+    # {project_type}: ML / DL project listings
+    IndexModel([("project_type", ASCENDING), ("_id", ASCENDING)], name = "type_id"),
+    # {status}: projects by status
+    IndexModel([("status", ASCENDING), ("_id", ASCENDING)], name = "status_id"),
+]
+
+# Indexes replaced by the _id-based listing indexes above, dropped by main()
+RETIRED_RUN_INDEXES = ["project_created", "type_project", "status_project"]
+
+# One representative filter per query shape issued against the Run collection
+RUN_QUERY_SHAPES = {
+    "run": {"run_id": "x"},
+    "run_project": {"run_id": "x", "project_name": "x"},
+    "run_model": {"run_id": "x", "model_name": "x", "project_type": "ML"},
+    "run_project_model": {"run_id": "x", "project_name": "x", "model_name": "x", "project_type": "ML"},
+    "dl_metric": {"run_id": "x", "project_name": "x", "metrics.metric": "loss", "project_type": "DL"},
+    "project": {"project_name": "x"},
+    "project_type": {"project_type": "DL"},
+    "status": {"status": "completed"},
+}
+
+def ensure_indexes(collection, indexes: list = None):
+    """
+    Creates the indexes of a collection if they don't exist yet.
+
+    Args:
+        collection (Collection): The Run collection, or the MetricBuckets collection.
+        indexes (list, optional): Indexes to create. Defaults to `RUN_INDEXES`.
+
+    Returns:
+        list: Names of the indexes (an awaitable when used with a Motor collection).
+    """
+    return collection.create_indexes(indexes or RUN_INDEXES)
+
+def _plan_stages(plan: dict) -> list:
+    """
+    Returns every stage name of an explain() plan tree.
+    """
+    stages = [plan.get("stage")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages += _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages += _plan_stages(child)
+    return stages
+
+def find_collection_scans(collection) -> list:
+    """
+    Explains every query shape in `RUN_QUERY_SHAPES` and reports those that would scan the whole collection.
+
+    Args:
+        collection (Collection): The Run collection.
+
+    Returns:
+        list: Names of the query shapes whose winning plan is a COLLSCAN.
+    """
+    return [name for name, query in RUN_QUERY_SHAPES.items()
+            if "COLLSCAN" in _plan_stages(collection.find(query).explain()["queryPlanner"]["winningPlan"])]
+
 def main():
-    client = MongoClient(host = "localhost", port = 27017)
+    client = MongoClient(MONGO_URI)
     db = client["SwiftPredict"]
 
     collections = db.list_collection_names()
@@ -58,12 +140,27 @@ def main():
         print("Run collection created")
     else:
         print("The Run collection already exists")
+        # Collections created by an older version keep their old validator unless it is replaced.
+        db.command("collMod", "Run", validator = validator, validationAction = "error")
+        print("Run validator updated")
         run = db["Run"]
         print("DB:", run.database.name)
         print("Collection:", run.name)
         print("Count in collection:", run.count_documents({}))
         print("Filtered:", list(run.find({"project_type": "ML"})))
 
+    run = db["Run"]
+    for name in set(RETIRED_RUN_INDEXES) & set(run.index_information()):
+        run.drop_index(name)
+        print("Dropped retired index:", name)
+    print("Indexes:", ensure_indexes(run))
+    print("Metric bucket indexes:", ensure_indexes(db[METRIC_BUCKETS], BUCKET_INDEXES))
+    collection_scans = find_collection_scans(run)
+    if collection_scans:
+        print("Queries still doing a COLLSCAN:", collection_scans)
+    else:
+        print("Every query shape is served by an index")
+
 if __name__ == "__main__":
     main()
 
@@ -0,0 +1,192 @@
+# Importing dependencies
+import os
+import re
+import atexit
+import threading
+from pymongo import MongoClient, monitoring
+from .config import MONGO_URI, MONGO_MAX_POOL_SIZE
+from .storage import run_exit_callbacks
+
+CREDENTIALS_PATTERN = re.compile(r"//[^@/]+@")
+
+
+class PoolCounter(monitoring.ConnectionPoolListener):
+    """
+    Counts the connections of one client's pools, for monitoring.
+
+    Attributes:
+        open (int): Connections currently open.
+        checked_out (int): Connections currently used by an operation.
+        created (int): Connections opened since the client was created.
+    """
+
+    def __init__(self):
+        self.open = 0
+        self.checked_out = 0
+        self.created = 0
+        self._lock = threading.Lock()
+
+    def _add(self, **changes):
+        with self._lock:
+            for name, change in changes.items():
+                setattr(self, name, getattr(self, name) + change)
+
+    def connection_created(self, event):
+        self._add(open = 1, created = 1)
+
+    def connection_closed(self, event):
+        self._add(open = -1)
+
+    def connection_checked_out(self, event):
+        self._add(checked_out = 1)
+
+    def connection_checked_in(self, event):
+        self._add(checked_out = -1)
+
+    # The remaining events aren't counted (the base class raises NotImplementedError for them).
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        pass
+
+
+class _Entry:
+    """
+    A registered client with its reference count and connection counter.
+    """
+
+    def __init__(self, client: MongoClient, counter: PoolCounter, max_pool_size: int):
+        self.client = client
+        self.counter = counter
+        self.max_pool_size = max_pool_size
+        self.refs = 0
+
+
+_clients = {}
+_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    """
+    Forgets the parent's clients in a forked child process.
+
+    MongoClient isn't fork-safe, so a child (e.g. a joblib/multiprocessing worker used for parallel
+    training) must open its own connections. The parent's clients are dropped without being closed,
+    which would also close sockets the parent still uses. This only resets the registry: objects
+    holding a client must call `get_client` again in the child, as `MongoStore` does when it notices
+    the process id changed.
+    """
+    global _lock
+    _lock = threading.Lock()    # The parent may have held the lock while forking.
+    _clients.clear()
+
+
+if hasattr(os, "register_at_fork"):    # Not available on Windows, which spawns instead of forking.
+    os.register_at_fork(after_in_child = _reset_after_fork)
+
+
+def get_client(uri: str = MONGO_URI, max_pool_size: int = MONGO_MAX_POOL_SIZE) -> MongoClient:
+    """
+    Returns the process-wide client of a URI, creating it on first use, and takes a reference on it.
+
+    Every caller shares the client's connection pool, so creating many `SwiftPredict` runs in one
+    process no longer opens one pool per run. Call `release_client` once the client isn't needed.
+
+    Args:
+        uri (str, optional): MongoDB connection string. Defaults to MONGO_URI.
+        max_pool_size (int, optional): Maximum connections of the pool, used when the client is created.
+            Defaults to SWIFTPREDICT_MONGO_POOL_SIZE (100).
+
+    Returns:
+        MongoClient: The shared client.
+    """
+    with _lock:
+        entry = _clients.get(uri)
+        if entry is None:
+            counter = PoolCounter()
+            entry = _Entry(MongoClient(uri, maxPoolSize = max_pool_size, event_listeners = [counter]), counter, max_pool_size)
+            _clients[uri] = entry
+        entry.refs += 1
+        return entry.client
+
+
+def release_client(uri: str = MONGO_URI):
+    """
+    Drops a reference taken by `get_client`.
+
+    The client stays open for the next caller even when no references are left, since closing it
+    would only make the next run reconnect. Use `close_client` or `close_all` to close it.
+    """
+    with _lock:
+        entry = _clients.get(uri)
+        if entry is not None and entry.refs > 0:
+            entry.refs -= 1
+
+
+def close_client(uri: str = MONGO_URI):
+    """
+    Closes the shared client of a URI and its connections. The next `get_client` opens a new one.
+    """
+    with _lock:
+        entry = _clients.pop(uri, None)
+    if entry is not None:
+        entry.client.close()
+
+
+def close_all():
+    """
+    Closes every shared client.
+    """
+    with _lock:
+        entries = list(_clients.values())
+        _clients.clear()
+    for entry in entries:
+        entry.client.close()
+
+
+def _close_at_exit():
+    """
+    Lets the exit callbacks (e.g. buffered loggers flushing) write through the clients, then closes them.
+    """
+    run_exit_callbacks()
+    close_all()
+
+
+atexit.register(_close_at_exit)
+
+
+def connection_stats() -> dict:
+    """
+    Reports the shared clients of this process, for monitoring.
+
+    Returns:
+        dict: Per URI (with credentials redacted): 'refs', 'max_pool_size', 'open_connections',
+              'checked_out' and 'created_connections'.
+    """
+    with _lock:
+        return {
+            CREDENTIALS_PATTERN.sub("//***@", uri): {
+                "refs": entry.refs,
+                "max_pool_size": entry.max_pool_size,
+                "open_connections": entry.counter.open,
+                "checked_out": entry.counter.checked_out,
+                "created_connections": entry.counter.created,
+            }
+            for uri, entry in _clients.items()
+        }
@@ -0,0 +1,91 @@
+# Importing dependencies
+import numpy as np
+
+DOWNSAMPLING_METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Selects the points of a series kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. The points in between are split into `max_points - 2`
+    buckets, and each bucket keeps the point forming the largest triangle with the previously kept
+    point and the average of the next bucket, which preserves the visual shape of the series.
+
+    Args:
+        x (np.ndarray): Steps, in ascending order.
+        y (np.ndarray): Values.
+        max_points (int): Number of points to keep (at least 3).
+
+    Returns:
+        np.ndarray: Indices of the kept points, in ascending order.
+    """
+    n = len(x)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)    # Bucket i covers [edges[i], edges[i + 1]).
+    selected = np.empty(max_points, dtype = int)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        next_x, next_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+
+        ax, ay = x[previous], y[previous]
+        areas = np.abs((ax - next_x) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y - ay))
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+def minmax_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Selects the minimum and the maximum of `max_points // 2` equally sized buckets, plus the first and last points.
+
+    Cheaper than LTTB and keeps every spike, at the cost of a more jagged line.
+
+    Args:
+        y (np.ndarray): Values.
+        max_points (int): Approximate number of points to keep.
+
+    Returns:
+        np.ndarray: Indices of the kept points, in ascending order.
+    """
+    n = len(y)
+    n_buckets = max((max_points - 4) // 2, 1)    # Leaves room for the first/last points and the remainder bucket.
+    size = n // n_buckets
+    usable = size * n_buckets
+    blocks = y[:usable].reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    indices = [offsets + blocks.argmin(axis = 1), offsets + blocks.argmax(axis = 1), [0, n - 1]]
+    if usable < n:    # The remainder joins as one more (shorter) bucket.
+        tail = y[usable:]
+        indices.append([usable + int(tail.argmin()), usable + int(tail.argmax())])
+    return np.unique(np.concatenate(indices))
+
+
+def downsample(steps, values, max_points: int = None, method: str = "lttb") -> tuple:
+    """
+    Reduces a metric series to at most about `max_points` points for plotting.
+
+    Args:
+        steps (array-like): Steps, in ascending order.
+        values (array-like): Values of the steps.
+        max_points (int, optional): Maximum number of points returned. None returns the series unchanged.
+        method (str, optional): Either 'lttb' (Largest-Triangle-Three-Buckets) or 'minmax'. Defaults to 'lttb'.
+
+    Returns:
+        tuple: (steps, values) float arrays.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(f"method must be one of {DOWNSAMPLING_METHODS}.")
+    steps, values = np.asarray(steps, dtype = float), np.asarray(values, dtype = float)
+    if max_points is None or len(steps) <= max(max_points, 3):
+        return steps, values
+
+    max_points = max(max_points, 3)
+    indices = lttb_indices(steps, values, max_points) if method == "lttb" else minmax_indices(values, max_points)
+    return steps[indices], values[indices]
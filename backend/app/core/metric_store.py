@@ -0,0 +1,127 @@
+# Importing dependencies
+from datetime import datetime
+import numpy as np
+from pymongo import UpdateOne, IndexModel, ASCENDING
+
+# Step metrics of DL runs stored with metric_storage = "bucketed" live in fixed-size bucket documents:
+# {run_id, project_name, model_name, metric, count, first_step, last_step, steps: [...], values: [...]}
+METRIC_BUCKETS = "MetricBuckets"
+BUCKET_SIZE = 1000
+
+BUCKET_INDEXES = [
+    # {run_id, project_name, model_name, metric} sorted by first_step: reading a series bucket by bucket
+    IndexModel([("run_id", ASCENDING), ("project_name", ASCENDING), ("model_name", ASCENDING),
+                ("metric", ASCENDING), ("first_step", ASCENDING)], name = "run_metric_step"),
+    # {run_id, project_name, model_name, metric, last_step > x}: live tails reading only the newest buckets
+    IndexModel([("run_id", ASCENDING), ("project_name", ASCENDING), ("model_name", ASCENDING),
+                ("metric", ASCENDING), ("last_step", ASCENDING)], name = "run_metric_last_step"),
+    # {project_name(, metric)}: leaderboards and deletes
+    IndexModel([("project_name", ASCENDING), ("metric", ASCENDING)], name = "project_metric"),
+]
+
+
+def series_filter(run_id: str, project_name: str, model_name: str, metric: str) -> dict:
+    """
+    Returns the filter matching every bucket of one metric series.
+    """
+    return {"run_id": run_id, "project_name": project_name, "model_name": model_name, "metric": metric}
+
+
+def bucket_updates(run_id: str, project_name: str, model_name: str, metric: str, steps: list, values: list,
+                   created_at: datetime = None, bucket_size: int = BUCKET_SIZE) -> list:
+    """
+    Builds the upserts appending points to a metric series.
+
+    Each upsert appends to a bucket of the series that still has room for all of its points, or creates
+    a new bucket if there is none. Points beyond `bucket_size` are split over several upserts, so a
+    bucket never holds more than `bucket_size` points.
+
+    Args:
+        run_id (str): Unique identifier of the run.
+        project_name (str): Name of the project.
+        model_name (str): Name of the model.
+        metric (str): Name of the metric.
+        steps (list): Steps of the new points.
+        values (list): Values of the new points.
+        created_at (datetime, optional): Creation time stored on new buckets.
+        bucket_size (int, optional): Maximum number of points per bucket.
+
+    Returns:
+        list: `UpdateOne` operations for the bucket collection, to be run in order.
+    """
+    operations = []
+    for i in range(0, len(steps), bucket_size):
+        chunk_steps, chunk_values = steps[i:i + bucket_size], values[i:i + bucket_size]
+        operations.append(UpdateOne(
+            {**series_filter(run_id, project_name, model_name, metric), "count": {"$lte": bucket_size - len(chunk_steps)}},
+            {
+                "$setOnInsert": {"created_at": created_at or datetime.now()},
+                "$push": {"steps": {"$each": chunk_steps}, "values": {"$each": chunk_values}},
+                "$inc": {"count": len(chunk_steps)},
+                "$min": {"first_step": min(chunk_steps)},
+                "$max": {"last_step": max(chunk_steps)}
+            },
+            upsert = True
+        ))
+    return operations
+
+
+def document_points(doc: dict, metric: str) -> tuple:
+    """
+    Extracts the points of one metric from the parallel arrays of a Run document.
+
+    Returns:
+        tuple: (steps, values) lists.
+    """
+    metrics = doc.get("metrics") or {}
+    details = metrics.get("details") or {}
+    points = [(step, value) for name, step, value in zip(metrics.get("metric", []), details.get("step", []), details.get("value", []))
+              if name == metric]
+    return [step for step, _ in points], [value for _, value in points]
+
+
+def merge_points(doc: dict, buckets: list, metric: str) -> tuple:
+    """
+    Merges the points of a metric stored in a Run document with those stored in buckets, ordered by step.
+
+    Args:
+        doc (dict): The Run document of the model.
+        buckets (list): Bucket documents of the series, in any order.
+        metric (str): Name of the metric.
+
+    Returns:
+        tuple: (steps, values) float arrays.
+    """
+    steps, values = document_points(doc, metric)
+    for bucket in sorted(buckets, key = lambda bucket: bucket["first_step"]):
+        steps += bucket["steps"]
+        values += bucket["values"]
+    steps, values = np.asarray(steps, dtype = float), np.asarray(values, dtype = float)
+    if np.any(np.diff(steps) < 0):    # Series logged in step order (the usual case) skip the sort.
+        order = np.argsort(steps, kind = "stable")    # Stable, so repeated steps keep their logging order.
+        steps, values = steps[order], values[order]
+    return steps, values
+
+
+def merge_points_since(points: list, buckets: list, since: float) -> tuple:
+    """
+    Merges the points logged after step `since`, ordered by step.
+
+    Args:
+        points (list): [step, value] pairs from the Run document, already filtered on the metric and step.
+        buckets (list): Bucket documents whose last_step is greater than `since`.
+        since (float): Only points with a greater step are returned.
+
+    Returns:
+        tuple: (steps, values) float arrays.
+    """
+    steps = [step for step, _ in points]
+    values = [value for _, value in points]
+    for bucket in sorted(buckets, key = lambda bucket: bucket["first_step"]):
+        steps += bucket["steps"]
+        values += bucket["values"]
+    steps, values = np.asarray(steps, dtype = float), np.asarray(values, dtype = float)
+    keep = steps > since    # Buckets straddling `since` also hold older points.
+    steps, values = steps[keep], values[keep]
+    order = np.argsort(steps, kind = "stable")
+    return steps[order], values[order]
@@ -0,0 +1,426 @@
+# Importing dependencies
+import os
+from pymongo import UpdateOne, ReturnDocument
+from pymongo.errors import ConnectionFailure
+from .config import MONGO_URI, MONGO_MAX_POOL_SIZE, ensure_indexes
+from .connections import PoolCounter, get_client, release_client
+from .metric_store import METRIC_BUCKETS, BUCKET_INDEXES, bucket_updates, series_filter, merge_points, merge_points_since
+from .pagination import encode_after, decode_after
+from .storage import TrackingStore
+
+
+def batch_operations(run: dict, created_at, models: dict, bucketed: bool) -> tuple:
+    """
+    Builds the upserts of `TrackingStore.write_batch`: one per model on the Run collection, plus the
+    bucket appends when metrics are bucketed.
+
+    Returns:
+        tuple: (Run collection operations, MetricBuckets collection operations).
+    """
+    operations = []
+    bucket_operations = []
+    for model_name, model in models.items():
+        update = {"$setOnInsert": {"created_at": created_at}}
+        push = {}
+        if model["params"]:
+            push["params"] = {"$each": model["params"]}
+        if model["metric"] and bucketed:
+            series = {}
+            for metric, step, value in zip(model["metric"], model["step"], model["value"]):
+                points = series.setdefault(metric, ([], []))
+                points[0].append(step)
+                points[1].append(value)
+            update["$addToSet"] = {"metrics.metric": {"$each": list(series)}}
+            for metric, (steps, values) in series.items():
+                bucket_operations += bucket_updates(run["run_id"], run["project_name"], model_name, metric,
+                                                    steps, values, created_at = created_at)
+        elif model["metric"]:
+            push["metrics.metric"] = {"$each": model["metric"]}
+            push["metrics.details.step"] = {"$each": model["step"]}
+            push["metrics.details.value"] = {"$each": model["value"]}
+        if push:
+            update["$push"] = push
+        operations.append(UpdateOne({**run, "model_name": model_name}, update, upsert = True))
+    return operations, bucket_operations
+
+
+def run_update(run_id: str, project_name: str, model_name: str, push: dict, set_fields: dict) -> tuple:
+    """
+    Builds the filter and update document of `TrackingStore.update_run`.
+    """
+    query = {"run_id": run_id, "project_name": project_name}
+    if model_name:
+        query["model_name"] = model_name
+    update = {}
+    if push:
+        update["$push"] = {field: {"$each": values} for field, values in push.items()}
+    if set_fields:
+        update["$set"] = set_fields
+    return query, update
+
+
+def metric_run_query(run_id: str, project_name: str, metric: str) -> dict:
+    """
+    Returns the filter of the DL run document holding a metric.
+    """
+    return {"run_id": run_id, "project_name": project_name, "metrics.metric": metric, "project_type": "DL"}
+
+
+def since_pipeline(run_id: str, project_name: str, metric: str, since: float) -> list:
+    """
+    Returns the aggregation filtering a Run document's points of a metric down to those after step `since`,
+    so only new points leave the server.
+    """
+    zipped = {"$zip": {"inputs": [{"$ifNull": ["$metrics.metric", []]}, {"$ifNull": ["$metrics.details.step", []]},
+                                  {"$ifNull": ["$metrics.details.value", []]}]}}
+    new_points = {"$filter": {"input": zipped, "as": "point", "cond": {"$and": [
+        {"$eq": [{"$arrayElemAt": ["$$point", 0]}, metric]},
+        {"$gt": [{"$arrayElemAt": ["$$point", 1]}, since]}
+    ]}}}
+    return [
+        {"$match": metric_run_query(run_id, project_name, metric)},
+        {"$limit": 1},
+        {"$project": {"_id": 0, "model_name": 1, "points": {"$map": {"input": new_points, "as": "point", "in": {"$slice": ["$$point", 1, 2]}}}}}
+    ]
+
+
+def bucket_since_query(run_id: str, project_name: str, model_name: str, metric: str, since: float) -> dict:
+    """
+    Returns the filter of the buckets holding points after step `since`.
+    """
+    return {**series_filter(run_id, project_name, model_name, metric), "last_step": {"$gt": since}}
+
+
+def version_pipeline(run_id: str, project_name: str, model_name: str, metric: str) -> list:
+    """
+    Returns the aggregation summing up the buckets of a metric series.
+    """
+    return [
+        {"$match": series_filter(run_id, project_name, model_name, metric)},
+        {"$group": {"_id": None, "points": {"$sum": "$count"}, "last_step": {"$max": "$last_step"}}}
+    ]
+
+def _point(index: int) -> dict:
+    """
+    Returns the expression of one element of an unwound, zipped point.
+    """
+    return {"$arrayElemAt": ["$points", index]}
+
+
+def _is_ranked(value) -> dict:
+    """
+    Returns the expression telling whether a value is a number other than NaN, which MongoDB sorts below every number.
+    """
+    return {"$and": [{"$isNumber": value}, {"$gte": [value, float("-inf")]}]}
+
+
+def leaderboard_pipeline(project_name: str, metric: str = None, goal: str = "max", by: str = "best", top_k: int = None) -> list:
+    """
+    Builds the aggregation of `TrackingStore.leaderboard`, run on the Run collection.
+
+    The points of the run documents' parallel arrays and of the metric buckets (pulled in with
+    $unionWith) are unwound into one stream of {run_id, model_name, metric, step, value, seq}
+    documents, then grouped per run, model and metric with $top. Both $match stages use indexed
+    fields ('project_id' on Run, 'project_metric' on MetricBuckets). Requires MongoDB 5.2+.
+
+    NaN (and non-numeric) values sort after every number, so they never win 'best' and their rows rank
+    last, matching `SQLiteStore.leaderboard`; MongoDB on its own sorts NaN below every number.
+    """
+    run_match = {"project_name": project_name}
+    bucket_match = {"project_name": project_name}
+    if metric:
+        run_match["metrics.metric"] = metric
+        bucket_match["metric"] = metric
+    zipped = {"$zip": {"inputs": [{"$ifNull": ["$metrics.metric", []]}, {"$ifNull": ["$metrics.details.step", []]},
+                                  {"$ifNull": ["$metrics.details.value", []]}]}}
+
+    pipeline = [
+        {"$match": run_match},
+        {"$project": {"_id": 0, "run_id": 1, "model_name": 1, "points": zipped}},
+        {"$unwind": {"path": "$points", "includeArrayIndex": "seq"}},
+        {"$project": {"run_id": 1, "model_name": 1, "seq": 1, "metric": _point(0), "step": _point(1), "value": _point(2)}},
+    ]
+    if metric:
+        pipeline.append({"$match": {"metric": metric}})
+    pipeline += [
+        {"$unionWith": {"coll": METRIC_BUCKETS, "pipeline": [
+            {"$match": bucket_match},
+            {"$project": {"_id": 0, "run_id": 1, "model_name": 1, "metric": 1, "points": {"$zip": {"inputs": ["$steps", "$values"]}}}},
+            {"$unwind": {"path": "$points", "includeArrayIndex": "seq"}},
+            {"$project": {"run_id": 1, "model_name": 1, "metric": 1, "seq": 1, "step": _point(0), "value": _point(1)}},
+        ]}},
+        {"$set": {"ranked": _is_ranked("$value")}},
+        {"$group": {
+            "_id": {"run_id": "$run_id", "model_name": "$model_name", "metric": "$metric"},
+            "best": {"$top": {"sortBy": {"ranked": -1, "value": -1 if goal == "max" else 1},
+                              "output": [{"$cond": ["$ranked", "$value", float("nan")]}, {"$cond": ["$ranked", "$step", None]}]}},
+            "last": {"$top": {"sortBy": {"step": -1, "seq": -1}, "output": ["$value", "$step"]}},
+            "points": {"$sum": 1}
+        }},
+        {"$project": {
+            "_id": 0, "run_id": "$_id.run_id", "model_name": "$_id.model_name", "metric": "$_id.metric",
+            "best": {"$arrayElemAt": ["$best", 0]}, "best_step": {"$arrayElemAt": ["$best", 1]},
+            "last": {"$arrayElemAt": ["$last", 0]}, "last_step": {"$arrayElemAt": ["$last", 1]}, "points": 1,
+            "ranked": _is_ranked({"$arrayElemAt": [f"${by}", 0]})
+        }},
+    ]
+
+    order = {"ranked": -1, by: -1 if goal == "max" else 1, "run_id": 1, "model_name": 1}
+    if top_k:
+        pipeline += [
+            {"$group": {"_id": "$metric", "rows": {"$topN": {"n": top_k, "sortBy": order, "output": "$$ROOT"}}}},
+            {"$sort": {"_id": 1}},
+            {"$unwind": "$rows"},
+            {"$replaceRoot": {"newRoot": "$rows"}},
+        ]
+    else:
+        pipeline.append({"$sort": {"metric": 1, **order}})
+    pipeline.append({"$unset": "ranked"})
+    return pipeline
+
+# Projection of the run document fields a metric version is computed from, without loading any points.
+VERSION_PROJECTION = {"_id": 0, "model_name": 1, "points": {"$size": {"$ifNull": ["$metrics.details.step", []]}}}
+BUCKET_PROJECTION = {"_id": 0, "first_step": 1, "steps": 1, "values": 1}
+
+
+class MongoStore(TrackingStore):
+    """
+    `TrackingStore` on MongoDB through pymongo, used by the `SwiftPredict` client.
+
+    Stores of the same URI share one process-wide client and connection pool (see `core.connections`).
+    A store used in a forked child process (e.g. a multiprocessing worker) takes the child's own client
+    on first use instead of the parent's, which isn't fork-safe.
+
+    Attributes:
+        client (MongoClient): The shared MongoDB client of the URI.
+        db (Database): MongoDB database named 'SwiftPredict'.
+        run (Collection): Collection of the run documents.
+        buckets (Collection): Collection of the bucketed metric points.
+    """
+
+    transient_errors = TrackingStore.transient_errors + (ConnectionFailure,)
+
+    def __init__(self, uri: str = MONGO_URI, max_pool_size: int = MONGO_MAX_POOL_SIZE):
+        self.uri = uri
+        self.max_pool_size = max_pool_size
+        self._closed = False
+        self._connect()
+
+    def _connect(self):
+        """
+        Takes a reference on the current process's shared client of the URI.
+        """
+        self._pid = os.getpid()
+        self._client = get_client(self.uri, max_pool_size = self.max_pool_size)
+        self._db = self._client["SwiftPredict"]
+
+    def _current_db(self):
+        """
+        Returns the database, reconnecting first if the process was forked since the store connected.
+        """
+        if self._pid != os.getpid():
+            self._connect()    # The parent's reference was dropped with the registry (see `core.connections`).
+        return self._db
+
+    @property
+    def client(self):
+        self._current_db()
+        return self._client
+
+    @property
+    def db(self):
+        return self._current_db()
+
+    @property
+    def run(self):
+        return self._current_db()["Run"]
+
+    @property
+    def buckets(self):
+        return self._current_db()[METRIC_BUCKETS]
+
+    def write_batch(self, run: dict, created_at, models: dict, bucketed: bool = False):
+        operations, bucket_operations = batch_operations(run, created_at, models, bucketed)
+        if operations:
+            self.run.bulk_write(operations, ordered = False)
+        if bucket_operations:
+            self.buckets.bulk_write(bucket_operations, ordered = True)    # In order, so each bucket keeps its steps in logging order.
+
+    def finalize_run(self, run_id: str, status: str, notes: str, tags: list):
+        self.run.update_many({"run_id": run_id}, {"$set": {"status": status, "notes": notes, "tags": tags}})
+
+    def update_run(self, run_id: str, project_name: str, model_name: str = None, push: dict = None, set_fields: dict = None):
+        query, update = run_update(run_id, project_name, model_name, push, set_fields)
+        return self.run.find_one_and_update(query, update, projection = {"_id": 0}, return_document = ReturnDocument.AFTER)
+
+    def iter_runs(self, query: dict, projection: dict = None, after = None, limit: int = None, batch_size: int = 500):
+        if after is not None:
+            query = {**query, "_id": {"$gt": after}}
+        cursor = self.run.find(query, projection or None).sort("_id", 1).batch_size(batch_size)
+        return cursor.limit(limit) if limit else cursor
+
+    def read_series(self, run_id: str, project_name: str, metric: str):
+        data = self.run.find_one(metric_run_query(run_id, project_name, metric), {"_id": 0, "model_name": 1, "metrics": 1})
+        if not data:
+            return None
+        docs = list(self.buckets.find(series_filter(run_id, project_name, data.get("model_name"), metric), BUCKET_PROJECTION))
+        return merge_points(data, docs, metric)
+
+    def read_series_since(self, run_id: str, project_name: str, metric: str, since: float):
+        data = next(self.run.aggregate(since_pipeline(run_id, project_name, metric, since)), None)
+        if not data:
+            return None
+        docs = list(self.buckets.find(bucket_since_query(run_id, project_name, data.get("model_name"), metric, since), BUCKET_PROJECTION))
+        return merge_points_since(data["points"], docs, since)
+
+    def metric_version(self, run_id: str, project_name: str, metric: str):
+        data = self.run.find_one(metric_run_query(run_id, project_name, metric), VERSION_PROJECTION)
+        if not data:
+            return None
+        stats = list(self.buckets.aggregate(version_pipeline(run_id, project_name, data.get("model_name"), metric)))
+        return (data["points"], stats[0]["points"], stats[0]["last_step"]) if stats else (data["points"], 0, None)
+
+    def leaderboard(self, project_name: str, metric: str = None, goal: str = "max", by: str = "best", top_k: int = None) -> list:
+        return list(self.run.aggregate(leaderboard_pipeline(project_name, metric, goal, by, top_k)))
+
+    def delete_runs(self, project_name: str, run_id: str = None) -> int:
+        query = {"run_id": run_id, "project_name": project_name} if run_id else {"project_name": project_name}
+        deleted = self.run.delete_many(query).deleted_count
+        self.buckets.delete_many(query)
+        return deleted
+
+    def delete_all(self) -> bool:
+        self.db.drop_collection("Run")
+        self.db.drop_collection(METRIC_BUCKETS)
+        return not set(self.db.list_collection_names()) & {"Run", METRIC_BUCKETS}
+
+    def ensure_indexes(self):
+        ensure_indexes(self.run)
+        ensure_indexes(self.buckets, BUCKET_INDEXES)
+
+    def encode_after(self, last_id) -> str:
+        return encode_after(last_id)
+
+    def decode_after(self, token: str):
+        return decode_after(token)
+
+    def close(self):
+        """
+        Releases this store's reference on the shared client, which stays open for other runs.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._pid == os.getpid():    # A reference taken by the parent process isn't in this process's registry.
+                release_client(self.uri)
+
+
+class AsyncMongoStore(TrackingStore):
+    """
+    The asynchronous counterpart of `MongoStore` on Motor, used by the API.
+    """
+
+    def __init__(self, uri: str = MONGO_URI, max_pool_size: int = MONGO_MAX_POOL_SIZE):
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        self.max_pool_size = max_pool_size
+        self.counter = PoolCounter()
+        self.client = AsyncIOMotorClient(uri, maxPoolSize = max_pool_size, event_listeners = [self.counter])
+        self.db = self.client["SwiftPredict"]
+        self.run = self.db["Run"]
+        self.buckets = self.db[METRIC_BUCKETS]
+
+    async def write_batch(self, run: dict, created_at, models: dict, bucketed: bool = False):
+        operations, bucket_operations = batch_operations(run, created_at, models, bucketed)
+        if operations:
+            await self.run.bulk_write(operations, ordered = False)
+        if bucket_operations:
+            await self.buckets.bulk_write(bucket_operations, ordered = True)
+
+    async def finalize_run(self, run_id: str, status: str, notes: str, tags: list):
+        await self.run.update_many({"run_id": run_id}, {"$set": {"status": status, "notes": notes, "tags": tags}})
+
+    async def update_run(self, run_id: str, project_name: str, model_name: str = None, push: dict = None, set_fields: dict = None):
+        query, update = run_update(run_id, project_name, model_name, push, set_fields)
+        return await self.run.find_one_and_update(query, update, projection = {"_id": 0}, return_document = ReturnDocument.AFTER)
+
+    async def iter_runs(self, query: dict, projection: dict = None, after = None, limit: int = None, batch_size: int = 500):
+        if after is not None:
+            query = {**query, "_id": {"$gt": after}}
+        cursor = self.run.find(query, projection or None).sort("_id", 1).batch_size(batch_size)
+        if limit:
+            cursor = cursor.limit(limit)
+        async for doc in cursor:
+            yield doc
+
+    async def read_series(self, run_id: str, project_name: str, metric: str):
+        data = await self.run.find_one(metric_run_query(run_id, project_name, metric), {"_id": 0, "model_name": 1, "metrics": 1})
+        if not data:
+            return None
+        docs = await self.buckets.find(series_filter(run_id, project_name, data.get("model_name"), metric),
+                                       BUCKET_PROJECTION).to_list(length = None)
+        return merge_points(data, docs, metric)
+
+    async def read_series_since(self, run_id: str, project_name: str, metric: str, since: float):
+        data = await self.run.aggregate(since_pipeline(run_id, project_name, metric, since)).to_list(length = 1)
+        if not data:
+            return None
+        docs = await self.buckets.find(bucket_since_query(run_id, project_name, data[0].get("model_name"), metric, since),
+                                       BUCKET_PROJECTION).to_list(length = None)
+        return merge_points_since(data[0]["points"], docs, since)
+
+    async def watch_changes(self):
+        """
+        Yields (project_name, run_id) for every write to a run document or a metric bucket, from a change stream.
+
+        Raises:
+            OperationFailure: If the server doesn't support change streams (e.g. a standalone server).
+        """
+        pipeline = [
+            {"$match": {"ns.coll": {"$in": ["Run", METRIC_BUCKETS]}, "operationType": {"$in": ["insert", "update", "replace"]}}},
+            {"$project": {"fullDocument.run_id": 1, "fullDocument.project_name": 1}}
+        ]
+        async with self.db.watch(pipeline, full_document = "updateLookup") as stream:
+            async for change in stream:
+                doc = change.get("fullDocument") or {}
+                yield doc.get("project_name"), doc.get("run_id")
+
+    async def metric_version(self, run_id: str, project_name: str, metric: str):
+        data = await self.run.find_one(metric_run_query(run_id, project_name, metric), VERSION_PROJECTION)
+        if not data:
+            return None
+        stats = await self.buckets.aggregate(version_pipeline(run_id, project_name, data.get("model_name"), metric)).to_list(length = None)
+        return (data["points"], stats[0]["points"], stats[0]["last_step"]) if stats else (data["points"], 0, None)
+
+    async def leaderboard(self, project_name: str, metric: str = None, goal: str = "max", by: str = "best", top_k: int = None) -> list:
+        return await self.run.aggregate(leaderboard_pipeline(project_name, metric, goal, by, top_k)).to_list(length = None)
+
+    async def delete_runs(self, project_name: str, run_id: str = None) -> int:
+        query = {"run_id": run_id, "project_name": project_name} if run_id else {"project_name": project_name}
+        deleted = (await self.run.delete_many(query)).deleted_count
+        await self.buckets.delete_many(query)
+        return deleted
+
+    async def delete_all(self) -> bool:
+        await self.db.drop_collection("Run")
+        await self.db.drop_collection(METRIC_BUCKETS)
+        return not set(await self.db.list_collection_names()) & {"Run", METRIC_BUCKETS}
+
+    async def ensure_indexes(self):
+        await ensure_indexes(self.run)
+        await ensure_indexes(self.buckets, BUCKET_INDEXES)
+
+    def encode_after(self, last_id) -> str:
+        return encode_after(last_id)
+
+    def decode_after(self, token: str):
+        return decode_after(token)
+
+    def pool_stats(self) -> dict:
+        """
+        Reports the connections of the API's Motor client.
+        """
+        return {"max_pool_size": self.max_pool_size, "open_connections": self.counter.open,
+                "checked_out": self.counter.checked_out, "created_connections": self.counter.created}
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,50 @@
+# Importing dependencies
+import re
+import base64
+from bson import ObjectId
+from bson.errors import InvalidId
+
+FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z0-9_]+)*$")
+
+
+def encode_after(last_id: ObjectId) -> str:
+    """
+    Turns the _id of the last document of a page into the opaque token of the next page.
+    """
+    return base64.urlsafe_b64encode(last_id.binary).decode("ascii").rstrip("=")
+
+
+def decode_after(token: str) -> ObjectId:
+    """
+    Turns a token created by `encode_after` back into an _id.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        return ObjectId(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, TypeError, InvalidId) as e:
+        raise ValueError(f"Invalid page token: {token}") from e
+
+
+def parse_fields(fields: str, default: dict) -> dict:
+    """
+    Builds a projection from a comma-separated list of (dotted) field names.
+
+    Args:
+        fields (str): Caller-selected fields, e.g. 'run_id,model_name,metrics.metric'. None or empty selects `default`.
+        default (dict): Projection used when no fields are selected.
+
+    Returns:
+        dict or None: The projection (None for every field). It always returns _id, which pagination needs and callers strip.
+
+    Raises:
+        ValueError: If a field name is invalid.
+    """
+    if not fields:
+        return {key: value for key, value in default.items() if key != "_id"} or None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    invalid = [name for name in names if not FIELD_PATTERN.match(name)]
+    if invalid:
+        raise ValueError(f"Invalid fields: {invalid}")
+    return {name: 1 for name in names if name != "_id"} or {"_id": 1}
@@ -0,0 +1,292 @@
+# Importing dependencies
+import os
+import json
+import math
+import base64
+import sqlite3
+import threading
+from pathlib import Path
+from itertools import groupby, islice
+from datetime import datetime
+import numpy as np
+from .storage import TrackingStore, apply_projection, is_inclusion
+from .config import default_cache_dir
+
+COLUMNS = ("id", "run_id", "project_name", "model_name", "project_type", "created_at", "status", "notes", "tags")
+QUERY_COLUMNS = ("run_id", "project_name", "model_name", "project_type", "status")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    project_name TEXT NOT NULL,
+    model_name TEXT,
+    project_type TEXT,
+    created_at TEXT,
+    status TEXT,
+    notes TEXT,
+    tags TEXT,
+    UNIQUE (run_id, project_name, model_name, project_type)
+);
+CREATE INDEX IF NOT EXISTS runs_project ON runs (project_name, id);
+CREATE INDEX IF NOT EXISTS runs_type ON runs (project_type, id);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, id);
+CREATE TABLE IF NOT EXISTS params (run_pk INTEGER NOT NULL, key TEXT NOT NULL, value TEXT);
+CREATE INDEX IF NOT EXISTS params_run ON params (run_pk);
+CREATE TABLE IF NOT EXISTS metrics (run_pk INTEGER NOT NULL, metric TEXT NOT NULL, step REAL NOT NULL, value REAL);
+CREATE INDEX IF NOT EXISTS metrics_run ON metrics (run_pk, metric, step);
+"""
+
+# sqlite3 binds float('nan') as NULL, so NaN metric values (e.g. roc_auc on a single-class fold) are
+# stored as NULL and read back as NaN. Databases created before that have a NOT NULL value column.
+NULLABLE_METRIC_VALUES = """
+CREATE TABLE metrics_nullable (run_pk INTEGER NOT NULL, metric TEXT NOT NULL, step REAL NOT NULL, value REAL);
+INSERT INTO metrics_nullable (rowid, run_pk, metric, step, value) SELECT rowid, run_pk, metric, step, value FROM metrics;
+DROP TABLE metrics;
+ALTER TABLE metrics_nullable RENAME TO metrics;
+CREATE INDEX metrics_run ON metrics (run_pk, metric, step);
+"""
+
+
+def default_sqlite_path() -> Path:
+    """
+    Returns the database file of the SQLite backend.
+
+    Environment Variables:
+        SWIFTPREDICT_SQLITE_PATH: Overrides the default of 'tracking.sqlite' inside `default_cache_dir()`.
+    """
+    return Path(os.getenv("SWIFTPREDICT_SQLITE_PATH", default_cache_dir() / "tracking.sqlite"))
+
+
+def _wants(projection: dict, field: str) -> bool:
+    """
+    Returns whether a projection returns (part of) a field.
+    """
+    if not projection or not is_inclusion(projection):
+        return not projection or projection.get(field, 1) != 0
+    return any(key == field or field.startswith(key + ".") or key.startswith(field + ".")
+               for key, value in projection.items() if value)
+
+
+class SQLiteStore(TrackingStore):
+    """
+    `TrackingStore` in an embedded SQLite database, for local experimentation and CI without a MongoDB server.
+
+    Run documents are stored as one row per (run, model) with params and metric points in their own
+    append-only tables, so logging never rewrites a growing document. Documents are assembled in the
+    shape of the Mongo Run documents when read. Metric points are stored the same way whether or not
+    bucketed storage is requested.
+
+    The connection is shared across threads (the client's background worker, the API's worker
+    threads) and serialized with a lock.
+
+    Attributes:
+        path (Path): Location of the SQLite database file.
+    """
+
+    transient_errors = TrackingStore.transient_errors + (sqlite3.OperationalError,)    # E.g. 'database is locked'.
+
+    def __init__(self, path: str = None):
+        """
+        Opens (or creates) the database.
+
+        Args:
+            path (str, optional): Path of the database file. Defaults to `default_sqlite_path()`.
+        """
+        self.path = Path(path) if path else default_sqlite_path()
+        self.path.parent.mkdir(parents = True, exist_ok = True)
+        self.conn = sqlite3.connect(self.path, check_same_thread = False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")    # Durable across application crashes, and much faster than FULL.
+        self._lock = threading.Lock()
+        self.ensure_indexes()
+
+    def ensure_indexes(self):
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+            if any(column[1] == "value" and column[3] for column in self.conn.execute("PRAGMA table_info(metrics)")):
+                self.conn.executescript(f"BEGIN; {NULLABLE_METRIC_VALUES} COMMIT;")
+
+    def _documents(self, rows: list, projection: dict = None) -> list:
+        """
+        Assembles run rows into Run documents, loading only the params and metrics the projection returns.
+        """
+        docs = {}
+        for row in rows:
+            doc = {key: value for key, value in zip(COLUMNS, row) if value is not None}
+            doc["_id"] = doc.pop("id")
+            if "created_at" in doc:
+                doc["created_at"] = datetime.fromisoformat(doc["created_at"])
+            if "tags" in doc:
+                doc["tags"] = json.loads(doc["tags"])
+            docs[doc["_id"]] = doc
+
+        placeholders = ",".join("?" * len(docs))
+        if docs and _wants(projection, "params"):
+            for run_pk, key, value in self.conn.execute(
+                    f"SELECT run_pk, key, value FROM params WHERE run_pk IN ({placeholders}) ORDER BY rowid", list(docs)):
+                docs[run_pk].setdefault("params", []).append({"key": key, "value": json.loads(value)})
+
+        if docs and _wants(projection, "metrics.details"):
+            for run_pk, metric, step, value in self.conn.execute(
+                    f"SELECT run_pk, metric, step, value FROM metrics WHERE run_pk IN ({placeholders}) ORDER BY rowid", list(docs)):
+                metrics = docs[run_pk].setdefault("metrics", {"metric": [], "details": {"step": [], "value": []}})
+                metrics["metric"].append(metric)
+                metrics["details"]["step"].append(step)
+                metrics["details"]["value"].append(math.nan if value is None else value)
+        elif docs and _wants(projection, "metrics"):    # Only the names: one entry per metric, like bucketed storage.
+            for run_pk, metric in self.conn.execute(
+                    f"SELECT run_pk, metric FROM metrics WHERE run_pk IN ({placeholders}) GROUP BY run_pk, metric ORDER BY MIN(rowid)", list(docs)):
+                docs[run_pk].setdefault("metrics", {"metric": []})["metric"].append(metric)
+
+        return [apply_projection(doc, projection) for doc in docs.values()]
+
+    def write_batch(self, run: dict, created_at, models: dict, bucketed: bool = False):
+        with self._lock, self.conn:
+            for model_name, model in models.items():
+                key = (run["run_id"], run["project_name"], model_name, run["project_type"])
+                self.conn.execute("INSERT OR IGNORE INTO runs (run_id, project_name, model_name, project_type, created_at) VALUES (?, ?, ?, ?, ?)",
+                                  key + (created_at.isoformat(),))
+                (run_pk,) = self.conn.execute("SELECT id FROM runs WHERE run_id = ? AND project_name = ? AND model_name IS ? AND project_type IS ?",
+                                              key).fetchone()
+                self.conn.executemany("INSERT INTO params (run_pk, key, value) VALUES (?, ?, ?)",
+                                      [(run_pk, param["key"], json.dumps(param["value"], default = str)) for param in model["params"]])
+                self.conn.executemany("INSERT INTO metrics (run_pk, metric, step, value) VALUES (?, ?, ?, ?)",
+                                      [(run_pk, metric, step, value) for metric, step, value in zip(model["metric"], model["step"], model["value"])])
+
+    def finalize_run(self, run_id: str, status: str, notes: str, tags: list):
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE runs SET status = ?, notes = ?, tags = ? WHERE run_id = ?", (status, notes, json.dumps(tags), run_id))
+
+    def update_run(self, run_id: str, project_name: str, model_name: str = None, push: dict = None, set_fields: dict = None):
+        push, set_fields = push or {}, set_fields or {}
+        if set(push) - {"params", "tags"} or set(set_fields) - {"status", "notes"}:
+            raise ValueError("Only params and tags can be pushed and only status and notes can be set.")
+
+        query = f"SELECT {', '.join(COLUMNS)} FROM runs WHERE run_id = ? AND project_name = ?" + (" AND model_name = ?" if model_name else "")
+        with self._lock, self.conn:
+            row = self.conn.execute(query + " ORDER BY id LIMIT 1", (run_id, project_name) + ((model_name,) if model_name else ())).fetchone()
+            if row is None:
+                return None
+            run_pk = row[0]
+            if push.get("params"):
+                self.conn.executemany("INSERT INTO params (run_pk, key, value) VALUES (?, ?, ?)",
+                                      [(run_pk, param["key"], json.dumps(param["value"], default = str)) for param in push["params"]])
+            if push.get("tags"):
+                tags = json.loads(row[COLUMNS.index("tags")] or "[]") + list(push["tags"])
+                self.conn.execute("UPDATE runs SET tags = ? WHERE id = ?", (json.dumps(tags), run_pk))
+            for field, value in set_fields.items():
+                self.conn.execute(f"UPDATE runs SET {field} = ? WHERE id = ?", (value, run_pk))
+            row = self.conn.execute(f"SELECT {', '.join(COLUMNS)} FROM runs WHERE id = ?", (run_pk,)).fetchone()
+            doc = self._documents([row])[0]
+        doc.pop("_id")
+        return doc
+
+    def iter_runs(self, query: dict, projection: dict = None, after = None, limit: int = None, batch_size: int = 500):
+        unknown = set(query) - set(QUERY_COLUMNS)
+        if unknown:
+            raise ValueError(f"The SQLite backend can't filter on {sorted(unknown)}.")
+        where = "".join(f" AND {column} = ?" for column in query)
+        last, remaining = after or 0, limit
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            with self._lock:    # Paging on id instead of holding a cursor, so other threads can use the connection in between.
+                rows = self.conn.execute(f"SELECT {', '.join(COLUMNS)} FROM runs WHERE id > ?{where} ORDER BY id LIMIT ?",
+                                         [last] + list(query.values()) + [size]).fetchall()
+                docs = self._documents(rows, projection)
+            yield from docs
+            if len(rows) < size:
+                return
+            last = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def _metric_run(self, run_id: str, project_name: str, metric: str):
+        """
+        Returns the id of the DL run row holding a metric, or None.
+        """
+        row = self.conn.execute("SELECT id FROM runs WHERE run_id = ? AND project_name = ? AND project_type = 'DL' AND "
+                                "EXISTS (SELECT 1 FROM metrics WHERE run_pk = runs.id AND metric = ?) ORDER BY id LIMIT 1",
+                                (run_id, project_name, metric)).fetchone()
+        return row[0] if row else None
+
+    def read_series(self, run_id: str, project_name: str, metric: str):
+        with self._lock:
+            run_pk = self._metric_run(run_id, project_name, metric)
+            if run_pk is None:
+                return None
+            points = self.conn.execute("SELECT step, value FROM metrics WHERE run_pk = ? AND metric = ? ORDER BY step, rowid",
+                                       (run_pk, metric)).fetchall()
+        points = np.array(points, dtype = float).reshape(-1, 2)    # NULL values become NaN.
+        return points[:, 0], points[:, 1]
+
+    def read_series_since(self, run_id: str, project_name: str, metric: str, since: float):
+        with self._lock:
+            run_pk = self._metric_run(run_id, project_name, metric)
+            if run_pk is None:
+                return None
+            points = self.conn.execute("SELECT step, value FROM metrics WHERE run_pk = ? AND metric = ? AND step > ? ORDER BY step, rowid",
+                                       (run_pk, metric, since)).fetchall()
+        points = np.array(points, dtype = float).reshape(-1, 2)    # NULL values become NaN.
+        return points[:, 0], points[:, 1]
+
+    def metric_version(self, run_id: str, project_name: str, metric: str):
+        with self._lock:
+            run_pk = self._metric_run(run_id, project_name, metric)
+            if run_pk is None:
+                return None
+            return tuple(self.conn.execute("SELECT COUNT(*), MAX(rowid) FROM metrics WHERE run_pk = ? AND metric = ?",
+                                           (run_pk, metric)).fetchone())
+
+    def leaderboard(self, project_name: str, metric: str = None, goal: str = "max", by: str = "best", top_k: int = None) -> list:
+        order = "DESC" if goal == "max" else "ASC"
+        with self._lock:
+            rows = self.conn.execute(f"""
+                WITH ranked AS (
+                    SELECT runs.run_id, runs.model_name, metrics.run_pk, metrics.metric, metrics.step, metrics.value,
+                           ROW_NUMBER() OVER (PARTITION BY metrics.run_pk, metrics.metric ORDER BY metrics.value IS NULL, metrics.value {order}) AS best_rank,
+                           ROW_NUMBER() OVER (PARTITION BY metrics.run_pk, metrics.metric ORDER BY metrics.step DESC, metrics.rowid DESC) AS last_rank
+                    FROM metrics JOIN runs ON runs.id = metrics.run_pk
+                    WHERE runs.project_name = ?{" AND metrics.metric = ?" if metric else ""}
+                )
+                SELECT run_id, model_name, metric,
+                       MAX(CASE WHEN best_rank = 1 THEN value END), MAX(CASE WHEN best_rank = 1 AND value IS NOT NULL THEN step END),
+                       MAX(CASE WHEN last_rank = 1 THEN value END), MAX(CASE WHEN last_rank = 1 THEN step END), COUNT(*)
+                FROM ranked GROUP BY run_pk, metric""", (project_name, metric) if metric else (project_name,)).fetchall()
+
+        keys = ("run_id", "model_name", "metric", "best", "best_step", "last", "last_step", "points")
+        rows = [dict(zip(keys, row)) for row in rows]
+        for row in rows:
+            row["best"], row["last"] = (math.nan if row[key] is None else row[key] for key in ("best", "last"))
+        sign = -1 if goal == "max" else 1
+        rows.sort(key = lambda row: (row["metric"], math.isnan(row[by]), 0 if math.isnan(row[by]) else sign * row[by],
+                                     row["run_id"], row["model_name"] or ""))    # NaN ranks last whatever the goal.
+        if top_k:
+            rows = [row for _, group in groupby(rows, key = lambda row: row["metric"]) for row in islice(group, top_k)]
+        return rows
+
+    def delete_runs(self, project_name: str, run_id: str = None) -> int:
+        query, args = ("project_name = ? AND run_id = ?", (project_name, run_id)) if run_id else ("project_name = ?", (project_name,))
+        with self._lock, self.conn:
+            for table in ("params", "metrics"):
+                self.conn.execute(f"DELETE FROM {table} WHERE run_pk IN (SELECT id FROM runs WHERE {query})", args)
+            return self.conn.execute(f"DELETE FROM runs WHERE {query}", args).rowcount
+
+    def delete_all(self) -> bool:
+        with self._lock, self.conn:
+            for table in ("params", "metrics", "runs"):
+                self.conn.execute(f"DELETE FROM {table}")
+        return True
+
+    def encode_after(self, last_id) -> str:
+        return base64.urlsafe_b64encode(str(last_id).encode("ascii")).decode("ascii").rstrip("=")
+
+    def decode_after(self, token: str):
+        try:
+            return int(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("ascii"))
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid page token: {token}") from e
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,283 @@
+# Importing dependencies
+import os
+import atexit
+import asyncio
+from itertools import islice
+
+# Tracking storage backend shared by the SwiftPredict client and the API: 'mongo' or 'sqlite'
+STORAGE_BACKEND = os.getenv("SWIFTPREDICT_BACKEND", "mongo").lower()
+STORAGE_BACKENDS = ("mongo", "sqlite")
+LEADERBOARD_GOALS = ("max", "min")
+LEADERBOARD_KEYS = ("best", "last")
+
+# Run at interpreter exit before the shared MongoDB clients are closed, see `register_exit_callback`.
+_exit_callbacks = []
+
+
+def register_exit_callback(callback):
+    """
+    Runs `callback` at interpreter exit, before `connections` closes the shared MongoDB clients.
+
+    A callback passed to `atexit` directly would run after the clients are closed whenever the
+    connections module is imported after it, since `atexit` runs callbacks last in, first out.
+
+    Args:
+        callback (callable): Called without arguments, at most once.
+    """
+    if not _exit_callbacks:
+        atexit.register(run_exit_callbacks)    # For processes that never open a MongoDB client.
+    _exit_callbacks.append(callback)
+
+
+def run_exit_callbacks():
+    """
+    Runs and forgets the callbacks of `register_exit_callback`, most recently registered first.
+    """
+    while _exit_callbacks:
+        _exit_callbacks.pop()()
+
+
+class TrackingStore:
+    """
+    Interface of the storage backends behind the `SwiftPredict` client and the tracking API.
+
+    Documents returned by a store have the shape of the Mongo Run documents:
+    {run_id, project_name, model_name, project_type, created_at, status, notes, tags,
+     params: [{key, value}], metrics: {metric: [...], details: {step: [...], value: [...]}}},
+    plus an opaque '_id' used for pagination.
+
+    Queries are dicts of equality conditions on run_id, project_name, model_name, project_type and status.
+    Projections are Mongo-style: either inclusions ({field: 1}, dotted paths allowed) or exclusions ({field: 0}).
+
+    Attributes:
+        transient_errors (tuple): Exception types worth retrying a write for (lost connection, locked database).
+    """
+
+    transient_errors = (ConnectionError, TimeoutError)
+
+    def write_batch(self, run: dict, created_at, models: dict, bucketed: bool = False):
+        """
+        Appends params and metric points to the documents of a run, creating them as needed.
+
+        Args:
+            run (dict): The run's run_id, project_name and project_type.
+            created_at (datetime): Creation time stored on new documents.
+            models (dict): model_name -> {"params": [{key, value}], "metric": [...], "step": [...], "value": [...]}.
+            bucketed (bool, optional): Store the metric points outside the run document, in fixed-size buckets.
+        """
+        raise NotImplementedError
+
+    def finalize_run(self, run_id: str, status: str, notes: str, tags: list):
+        """
+        Sets the status, notes and tags of every document of a run.
+        """
+        raise NotImplementedError
+
+    def update_run(self, run_id: str, project_name: str, model_name: str = None, push: dict = None, set_fields: dict = None):
+        """
+        Appends to the 'params' or 'tags' arrays (`push`) and sets fields (`set_fields`) of one run document.
+
+        Returns:
+            dict or None: The updated document without its _id, or None if no document matched.
+        """
+        raise NotImplementedError
+
+    def iter_runs(self, query: dict, projection: dict = None, after = None, limit: int = None, batch_size: int = 500):
+        """
+        Iterates over the documents matching `query` in _id order, starting after the _id `after`.
+        """
+        raise NotImplementedError
+
+    def read_series(self, run_id: str, project_name: str, metric: str):
+        """
+        Reads every point of a DL metric.
+
+        Returns:
+            tuple or None: (steps, values) float arrays ordered by step, or None if the run doesn't have this metric.
+        """
+        raise NotImplementedError
+
+    def read_series_since(self, run_id: str, project_name: str, metric: str, since: float):
+        """
+        Reads the points of a DL metric logged after step `since`, transferring only those points.
+
+        Returns:
+            tuple or None: (steps, values) float arrays ordered by step, or None if the run doesn't have this metric.
+        """
+        raise NotImplementedError
+
+    def metric_version(self, run_id: str, project_name: str, metric: str):
+        """
+        Returns a value that changes whenever points are added to a DL metric, or None if the run doesn't have it.
+        """
+        raise NotImplementedError
+
+    def leaderboard(self, project_name: str, metric: str = None, goal: str = "max", by: str = "best", top_k: int = None) -> list:
+        """
+        Summarizes the metrics of a project per run and model, computed inside the database.
+
+        Args:
+            project_name (str): Name of the project.
+            metric (str, optional): Only summarize this metric. Defaults to every metric.
+            goal (str, optional): 'max' if higher values are better, 'min' otherwise. Defaults to 'max'.
+            by (str, optional): Rank on the 'best' or the 'last' value. Defaults to 'best'.
+            top_k (int, optional): Keep the top k rows of each metric. Defaults to every row.
+
+        Returns:
+            list: Rows {run_id, model_name, metric, best, best_step, last, last_step, points},
+                  grouped by metric and ranked by `by` within each metric. NaN values never count as
+                  'best' (a series of only NaN has a NaN best and a None best_step), and rows whose
+                  ranked value is NaN come last whatever the goal.
+        """
+        raise NotImplementedError
+
+    def delete_runs(self, project_name: str, run_id: str = None) -> int:
+        """
+        Deletes one run, or every run of a project, and returns the number of deleted documents.
+        """
+        raise NotImplementedError
+
+    def delete_all(self) -> bool:
+        """
+        Deletes all tracking data and returns whether it succeeded.
+        """
+        raise NotImplementedError
+
+    def ensure_indexes(self):
+        """
+        Creates the indexes the queries rely on, if they don't exist yet.
+        """
+        raise NotImplementedError
+
+    def encode_after(self, last_id) -> str:
+        """
+        Turns the _id of the last document of a page into the opaque token of the next page.
+        """
+        raise NotImplementedError
+
+    def decode_after(self, token: str):
+        """
+        Turns a page token back into an _id.
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases the connections of the store.
+        """
+
+
+class AsyncStoreAdapter:
+    """
+    Exposes a synchronous `TrackingStore` through the asynchronous interface the API uses,
+    running every call in a worker thread.
+    """
+
+    def __init__(self, store: TrackingStore):
+        self.store = store
+
+    def __getattr__(self, name):
+        method = getattr(self.store, name)
+        if name in ("encode_after", "decode_after", "close"):
+            return method
+
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return call
+
+    async def iter_runs(self, query: dict, projection: dict = None, after = None, limit: int = None, batch_size: int = 500):
+        """
+        Iterates over the documents of `TrackingStore.iter_runs`, fetching `batch_size` documents per worker-thread call.
+        """
+        iterator = self.store.iter_runs(query, projection, after = after, limit = limit, batch_size = batch_size)
+        while True:
+            batch = await asyncio.to_thread(lambda: list(islice(iterator, batch_size)))
+            if not batch:
+                return
+            for doc in batch:
+                yield doc
+
+
+def is_inclusion(projection: dict) -> bool:
+    """
+    Returns whether a Mongo-style projection lists the fields to return (rather than the fields to leave out).
+    """
+    return any(value for key, value in projection.items() if key != "_id") or projection == {"_id": 1}
+
+
+def apply_projection(doc: dict, projection: dict = None) -> dict:
+    """
+    Applies a Mongo-style inclusion or exclusion projection to a document. _id is kept unless excluded.
+    """
+    if not projection:
+        return doc
+    if is_inclusion(projection):
+        projected = {"_id": doc["_id"]} if projection.get("_id", 1) and "_id" in doc else {}
+        for path in projection:
+            if path == "_id" or not projection[path]:
+                continue
+            source, target, keys = doc, projected, path.split(".")
+            for key in keys[:-1]:
+                if not isinstance(source.get(key), dict):
+                    break
+                source, target = source[key], target.setdefault(key, {})
+            else:
+                if keys[-1] in source:
+                    target[keys[-1]] = source[keys[-1]]
+        return projected
+
+    projected = dict(doc)
+    for path in projection:
+        keys, target = path.split("."), projected
+        for key in keys[:-1]:
+            if not isinstance(target.get(key), dict):
+                break
+            target[key] = dict(target[key])
+            target = target[key]
+        else:
+            target.pop(keys[-1], None)
+    return projected
+
+
+def create_store(backend: str = None) -> TrackingStore:
+    """
+    Creates the synchronous store used by the `SwiftPredict` client.
+
+    Args:
+        backend (str, optional): 'mongo' or 'sqlite'. Defaults to `STORAGE_BACKEND`.
+
+    Environment Variables:
+        SWIFTPREDICT_BACKEND: Default backend. Defaults to 'mongo'.
+        MONGO_URI: MongoDB connection string of the 'mongo' backend.
+        SWIFTPREDICT_SQLITE_PATH: Database file of the 'sqlite' backend.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    backend = (backend or STORAGE_BACKEND).lower()
+    if backend == "mongo":
+        from .mongo_store import MongoStore
+        return MongoStore()
+    if backend == "sqlite":
+        from .sqlite_store import SQLiteStore
+        return SQLiteStore()
+    raise ValueError(f"backend must be one of {STORAGE_BACKENDS}.")
+
+
+def create_async_store(backend: str = None):
+    """
+    Creates the asynchronous store used by the API: Motor for 'mongo', `SQLiteStore` in worker threads for 'sqlite'.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    backend = (backend or STORAGE_BACKEND).lower()
+    if backend == "mongo":
+        from .mongo_store import AsyncMongoStore
+        return AsyncMongoStore()
+    if backend == "sqlite":
+        return AsyncStoreAdapter(create_store(backend))
+    raise ValueError(f"backend must be one of {STORAGE_BACKENDS}.")
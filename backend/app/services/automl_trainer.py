@@ -21,6 +21,9 @@ class AutoML:
         target_column (str): Name of the target column in the dataset.
         task (str): Type of ML task, either 'classification' or 'regression'.
         modified_df : The updated pandas df.
+        data_profile (dict): Statistics of the full file when it was read in chunks, see `stream_csv`.
+        peak_rss_mb (float): Peak memory of the process after the last `fit`, in MB.
+        pipeline_spec (dict): Fitted preprocessing state used to build an `InferencePipeline`.
     """
 
     def __init__(self):
@@ -37,32 +40,96 @@ class AutoML:
         self.target_column = ''
         self.task = None
         self.modified_df = Any
-
-    def fit(self, project_name: str, file_path: str, target_column: str, drop_id: bool = True, drop_name: bool = True) -> dict:
+        self.data_profile = {}
+        self.peak_rss_mb = None
+        self.pipeline_spec = {}
+        self._pipelines = {}
+
+    def fit(self, project_name: str, file_path: str, target_column: str, drop_id: bool = True, drop_name: bool = True,
+            n_jobs: int = -1, refit: str = "best", selection: str = "full", time_budget: float = None,
+            halving_tolerance: float = 0.02, text_n_process: int = 1, cache_text: bool = False, sparse: bool = False, chunksize: int = None,
+            sample_size: int = 100_000, cache_dataset: bool = False, corr_threshold: float = 0.99,
+            corr_sample_rows: int = None) -> dict:
         """
         Trains models on the provided dataset using the AutoML pipeline.
 
         Args:
             project_name (str): Name of the project to associate with this run.
-            file_path (str): Path to the input CSV file.
+            file_path (str): Path to the input CSV file, or to a columnar dataset directory written by
+                             `write_columnar` (loaded memory-mapped).
             target_column (str): Column name to be predicted (label column).
             drop_name (bool): Columns name with name or Name will be dropped.
             drop_id (bool): Columns with column name == id or ID will be removed.
+            n_jobs (int): Total number of cores shared by all models and CV folds during training
+                          (-1 for all cores, 1 to train the models one after another).
+            refit (str): 'best' (default) refits only the winning models on the full training data,
+                         'all' refits every model, 'folds' uses the winners' cross-validation fold
+                         estimators as an ensemble without any refit.
+            selection (str): 'full' (default) runs 5-fold CV for every model. 'halving' first scores every
+                             model on two folds, discards the models clearly worse than the leader and only
+                             runs full CV on the survivors. The elimination trace is logged as params of each model.
+            time_budget (float, optional): Seconds after which 'halving' selection stops starting new
+                                           folds and ranks the survivors on the folds evaluated so far.
+            halving_tolerance (float): 'halving' only eliminates a model whose screening accuracy (R2 for
+                                       regression) is below the leader's by more than this, and by more than
+                                       the fold-to-fold noise. Raise it to eliminate less aggressively.
+            text_n_process (int): Number of processes spaCy uses to preprocess high-cardinality text columns.
+            cache_text (bool): Cache preprocessed texts in a local SQLite file (under SWIFTPREDICT_CACHE_DIR,
+                               default '~/.cache/swiftpredict') so re-runs on the same data skip spaCy.
+            sparse (bool): Keep one-hot and TF-IDF features as SciPy CSR matrices (no SVD) stacked with the
+                           numeric columns, for wide categorical data. Only sparse-capable models are trained
+                           and X_test is a sparse matrix.
+            chunksize (int, optional): Read the CSV in chunks of this many rows instead of loading it at once.
+                                       Dtypes, null counts, cardinalities and class counts of the full file are
+                                       collected into `data_profile` in the same pass, and the models are trained
+                                       on a stratified sample of at most `sample_size` rows.
+            sample_size (int): Maximum number of rows kept when `chunksize` is set.
+            cache_dataset (bool): Keep a columnar copy of the CSV (one file per column, keyed by the file's size,
+                                  modification time and first/last bytes) next to the source file, and memory-map
+                                  it on later runs instead of parsing the CSV again. Can't be combined with `chunksize`.
+            corr_threshold (float): Numeric columns whose absolute correlation with an earlier numeric column
+                                    reaches this value are removed before training (1.0 only removes exact linear duplicates).
+            corr_sample_rows (int, optional): Estimate those correlations on a random sample of this many rows,
+                                              for very wide datasets.
+
+        Raises:
+            ValueError: If both `chunksize` and `cache_dataset` are set.
 
         Returns:
             dict: Dictionary containing the best model names (string) for each metric and the overall best model.
         """
+        if chunksize and cache_dataset:
+            raise ValueError("chunksize and cache_dataset can't be combined: chunked reading keeps a sample, "
+                             "the dataset cache keeps the whole file.")
         from .preprocessing import training_pipeline, detect_task
+        from .ingestion import stream_csv, peak_rss_mb
+        from .dataset_cache import is_columnar_dataset, read_columnar, read_csv_cached
 
         self.project_name = project_name
         self.file_path = file_path
         self.target_column = target_column
-        self.data = pd.read_csv(self.file_path)
+        if is_columnar_dataset(self.file_path):
+            self.data = read_columnar(self.file_path)
+        elif chunksize:
+            self.data, self.data_profile = stream_csv(self.file_path, target_column = self.target_column,
+                                                      sample_size = sample_size, chunksize = chunksize)
+            print(f"SwiftPredict: Sampled {self.data_profile['sampled_rows']} of {self.data_profile['rows']} rows.")
+        elif cache_dataset:
+            self.data = read_csv_cached(self.file_path)
+        else:
+            self.data = pd.read_csv(self.file_path)
         self.task = detect_task(df = self.data, y = self.target_column)
 
-        self.best_models, self.std_scaler, self.removed_columns, self.ohe_lst, self.vectorizer_lst, self.X_test, self.y_test, best_model_showcase, self.modified_df = (training_pipeline(
-            self.data, target_column = self.target_column, project_name = self.project_name, drop_name = drop_name, drop_id = drop_id
+        self._pipelines = {}
+        self.best_models, self.std_scaler, self.removed_columns, self.ohe_lst, self.vectorizer_lst, self.X_test, self.y_test, best_model_showcase, self.modified_df, self.pipeline_spec = (training_pipeline(
+            self.data, target_column = self.target_column, project_name = self.project_name, drop_name = drop_name, drop_id = drop_id,
+            n_jobs = n_jobs, refit = refit, selection = selection, time_budget = time_budget, halving_tolerance = halving_tolerance,
+            text_n_process = text_n_process, cache_text = cache_text, sparse = sparse,
+            corr_threshold = corr_threshold, corr_sample_rows = corr_sample_rows
         ))
+        self.peak_rss_mb = peak_rss_mb()
+        if self.peak_rss_mb is not None:
+            print(f"SwiftPredict: Peak memory usage {self.peak_rss_mb:.1f} MB.")
         return best_model_showcase
 
     def export_model(self, model_path: str, key: str = None) -> None:
@@ -82,6 +149,59 @@ class AutoML:
             pickle.dump(model_to_export, f)
 
 
+    def build_pipeline(self, key: str = None):
+        """
+        Compiles the fitted preprocessing and a best model into an `InferencePipeline`.
+
+        Args:
+            key (str, optional): The metric key for selecting a specific best model.
+                                 If None, the overall best model is used.
+
+        Returns:
+            InferencePipeline: Pipeline accepting raw DataFrame batches.
+
+        Raises:
+            ValueError: If the AutoML instance hasn't been fitted yet.
+        """
+        from .inference import InferencePipeline
+
+        if not self.pipeline_spec:
+            raise ValueError("Call fit before building an inference pipeline.")
+        if key not in self._pipelines:
+            model = self.best_models["overall"][0] if not key else self.best_models[key]
+            self._pipelines[key] = InferencePipeline(model = model, std_scaler = self.std_scaler, task = self.task,
+                                                     target_column = self.target_column, **self.pipeline_spec)
+        return self._pipelines[key]
+
+    def predict(self, df: pd.DataFrame, key: str = None):
+        """
+        Predicts on raw rows with the same columns as the training CSV.
+
+        Args:
+            df (pd.DataFrame): Raw input batch; the target column may be present and is ignored.
+            key (str, optional): The metric key for selecting a specific best model.
+                                 If None, the overall best model is used.
+
+        Returns:
+            np.ndarray: Predictions, decoded to the original labels for string targets.
+        """
+        return self.build_pipeline(key = key).predict(df)
+
+    def export_pipeline(self, pipeline_path: str, key: str = None) -> None:
+        """
+        Exports the fitted preprocessing together with a best model as a single pickled
+        `InferencePipeline`, loadable with `InferencePipeline.load`.
+
+        Args:
+            pipeline_path (str): The file path to save the serialized pipeline.
+            key (str, optional): The metric key for selecting a specific best model.
+                                 If None, the overall best model is saved.
+
+        Returns:
+            None
+        """
+        self.build_pipeline(key = key).save(pipeline_path)
+
     def evaluate_performance(self, model = None, key: str = None) -> dict:
         """
         Evaluates model performance using stored test data.
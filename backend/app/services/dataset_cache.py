@@ -0,0 +1,133 @@
+# Importing dependencies
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+import pandas as pd
+import numpy as np
+
+META_FILE = "meta.json"
+
+
+def file_fingerprint(file_path: str, sample_bytes: int = 1024 ** 2) -> str:
+    """
+    Identifies a version of a file from its size, its modification time and its first and last bytes.
+
+    Unlike a hash of the whole file, this costs O(1) I/O, so a cache hit doesn't re-read the file the
+    cache exists to avoid parsing. The sampled bytes catch in-place rewrites that keep the size and
+    restore the modification time.
+
+    Args:
+        file_path (str): Path to the file.
+        sample_bytes (int): Number of bytes hashed at the start and at the end of the file.
+
+    Returns:
+        str: Hex digest of (size, mtime_ns, first and last `sample_bytes` bytes).
+    """
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(f"{stat.st_size}:{stat.st_mtime_ns}".encode(), digest_size = 16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(sample_bytes))
+        if stat.st_size > sample_bytes:
+            f.seek(max(sample_bytes, stat.st_size - sample_bytes))
+            digest.update(f.read(sample_bytes))
+    return digest.hexdigest()
+
+
+def is_columnar_dataset(path: str) -> bool:
+    """
+    Returns True if `path` is a directory written by `write_columnar`.
+    """
+    return (Path(path) / META_FILE).is_file()
+
+
+def write_columnar(df: pd.DataFrame, directory: str):
+    """
+    Stores a DataFrame as one file per column plus a `meta.json` describing them.
+
+    Numeric and boolean columns are stored as plain arrays that can be memory-mapped. Object columns
+    are stored as JSON lists (missing values as null, other non-JSON values as their string) and loaded
+    into memory, so reading a dataset never unpickles anything. The directory is written next to its
+    final location first and then renamed, so readers never see a partial dataset.
+
+    Args:
+        df (pd.DataFrame): The data to store.
+        directory (str): Destination directory.
+    """
+    directory = Path(directory)
+    tmp_directory = directory.with_name(directory.name + ".tmp")
+    shutil.rmtree(tmp_directory, ignore_errors = True)
+    tmp_directory.mkdir(parents = True)
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        if values.dtype != object:
+            np.save(tmp_directory / f"{i}.npy", values, allow_pickle = False)
+            columns.append({"name": col, "file": f"{i}.npy", "mmap": True})
+        else:
+            with open(tmp_directory / f"{i}.json", "w") as f:
+                json.dump(df[col].astype(object).where(df[col].notna(), None).tolist(), f, default = str)
+            columns.append({"name": col, "file": f"{i}.json", "mmap": False})
+
+    with open(tmp_directory / META_FILE, "w") as f:
+        json.dump({"columns": columns, "rows": len(df)}, f)
+    shutil.rmtree(directory, ignore_errors = True)
+    os.replace(tmp_directory, directory)
+
+
+def read_columnar(directory: str) -> pd.DataFrame:
+    """
+    Loads a dataset written by `write_columnar`, memory-mapping every numeric column.
+
+    Args:
+        directory (str): Directory of the dataset.
+
+    Returns:
+        pd.DataFrame: The dataset. Memory-mapped columns are read-only views of the files.
+
+    Raises:
+        ValueError: If the dataset was written by an older version with pickled object columns.
+    """
+    directory = Path(directory)
+    with open(directory / META_FILE) as f:
+        meta = json.load(f)
+
+    data = {}
+    for column in meta["columns"]:
+        if column["mmap"]:
+            data[column["name"]] = np.load(directory / column["file"], mmap_mode = "r")
+        elif column["file"].endswith(".json"):
+            with open(directory / column["file"]) as f:
+                data[column["name"]] = pd.Series(json.load(f)).fillna(np.nan)    # Missing values as read_csv returns them.
+        else:
+            raise ValueError(f"{directory} stores pickled columns (older SwiftPredict version); write it again with write_columnar.")
+    return pd.DataFrame(data, copy = False)
+
+
+def read_csv_cached(file_path: str) -> pd.DataFrame:
+    """
+    Reads a CSV through a columnar cache stored next to it.
+
+    The cache lives in '.<file name>.swiftpredict/<fingerprint>/' (see `file_fingerprint`), so editing the
+    CSV invalidates it.
+    The first call parses the CSV and writes the cache (replacing caches of older versions of the
+    file). Later calls memory-map the cached columns instead of parsing the CSV again.
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        pd.DataFrame: The dataset.
+    """
+    file_path = Path(file_path)
+    cache_root = file_path.with_name(f".{file_path.name}.swiftpredict")
+    cache_dir = cache_root / file_fingerprint(file_path)
+    if is_columnar_dataset(cache_dir):
+        return read_columnar(cache_dir)
+
+    df = pd.read_csv(file_path)
+    shutil.rmtree(cache_root, ignore_errors = True)    # Dropping caches of previous versions of the file.
+    write_columnar(df, cache_dir)
+    return df
@@ -0,0 +1,68 @@
+# Importing dependencies
+import numpy as np
+
+
+class FoldEnsemble:
+    """
+    Combines the estimators fitted on the cross-validation folds into a single model, so the
+    fold models can be used directly instead of refitting the winner on the full training data.
+
+    Classification averages `predict_proba` across the folds (falling back to a majority vote),
+    regression averages the predictions.
+
+    Attributes:
+        estimators (list): Fitted estimators, one per cross-validation fold.
+        task (str): The ML task ('classification' or 'regression').
+    """
+
+    def __init__(self, estimators: list, task: str):
+        self.estimators = list(estimators)
+        self.task = task
+
+    @property
+    def base_estimator(self):
+        """
+        The estimator of the first fold, used for naming and parameter logging.
+        """
+        return self.estimators[0]
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self.estimators[0].classes_
+
+    def get_params(self, deep: bool = True) -> dict:
+        return self.base_estimator.get_params(deep = deep)
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Averages the class probabilities of all fold estimators.
+
+        Args:
+            X (array-like): Features to predict on.
+
+        Returns:
+            np.ndarray: Array of shape (n_samples, n_classes).
+        """
+        return np.mean([estimator.predict_proba(X) for estimator in self.estimators], axis = 0)
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts with every fold estimator and combines the results.
+
+        Args:
+            X (array-like): Features to predict on.
+
+        Returns:
+            np.ndarray: Predicted labels or values.
+        """
+        if self.task == "classification":
+            if all(hasattr(estimator, "predict_proba") for estimator in self.estimators):
+                return self.classes_[np.argmax(self.predict_proba(X), axis = 1)]
+
+            votes = np.stack([np.ravel(estimator.predict(X)) for estimator in self.estimators])
+            labels, encoded = np.unique(votes, return_inverse = True)
+            encoded = encoded.reshape(votes.shape)
+            counts = np.apply_along_axis(np.bincount, 0, encoded, minlength = len(labels))
+            return labels[np.argmax(counts, axis = 0)]
+
+        return np.mean([np.ravel(estimator.predict(X)) for estimator in self.estimators], axis = 0)
@@ -0,0 +1,151 @@
+# Importing dependencies
+import time
+import pickle
+import pandas as pd
+import numpy as np
+from scipy import sparse as sp
+
+
+class InferencePipeline:
+    """
+    The fitted preprocessing of an AutoML run and one trained model, compiled into a single
+    vectorized transform that accepts raw DataFrame batches (same columns as the training CSV,
+    with or without the target column).
+
+    Attributes:
+        model (Any): The trained estimator.
+        std_scaler (StandardScaler): Scaler fitted on the training features.
+        task (str): 'classification' or 'regression'.
+        target_column (str): Name of the target column, dropped from the input if present.
+        removed_columns (list): Names of the columns dropped during training (id/name/correlated).
+        encoders (list): Tuples (column, 'ohe' or 'tfidf', fitted encoder, fitted TruncatedSVD or None),
+                         in the order the columns were encoded.
+        feature_columns (list): Column order of the dense feature matrix.
+        numeric_columns (list): Leading numeric columns of the sparse feature matrix.
+        label_encoder (LabelEncoder): Encoder of a string target, used to decode predictions.
+        sparse (bool): Whether the model was trained on the sparse feature pipeline.
+        handle_html (bool): Whether HTML tags are stripped from text columns.
+    """
+
+    def __init__(self, model, std_scaler, task: str, target_column: str, removed_columns: list, encoders: list,
+                 feature_columns: list, numeric_columns: list, label_encoder = None, sparse: bool = False,
+                 handle_html: bool = False):
+        self.model = model
+        self.std_scaler = std_scaler
+        self.task = task
+        self.target_column = target_column
+        self.removed_columns = removed_columns
+        self.encoders = encoders
+        self.feature_columns = feature_columns
+        self.numeric_columns = numeric_columns
+        self.label_encoder = label_encoder
+        self.sparse = sparse
+        self.handle_html = handle_html
+
+        # Missing numeric values are imputed with the training mean, which the scaler maps to 0.
+        means = std_scaler.mean_ if getattr(std_scaler, "mean_", None) is not None else np.zeros(std_scaler.n_features_in_)
+        columns = numeric_columns if sparse else feature_columns
+        self._fill_values = pd.Series(means[:len(columns)], index = columns)
+
+    def _encode(self, df: pd.DataFrame) -> list:
+        """
+        Applies every fitted categorical encoder to its column.
+
+        Returns:
+            list: Tuples (encoded block, feature names) in encoding order.
+        """
+        blocks = []
+        for column, kind, encoder, svd in self.encoders:
+            values = df[column] if column in df.columns else pd.Series(np.nan, index = df.index, dtype = object)
+            if kind == "ohe":
+                blocks.append((encoder.transform(values.to_frame(column)), encoder.get_feature_names_out([column])))
+                continue
+
+            from .preprocessing import preprocess_texts    # Only pipelines with text columns need spaCy.
+
+            tfidf = encoder.transform(preprocess_texts(values, handle_html = self.handle_html))
+            if self.sparse:
+                blocks.append((tfidf, encoder.get_feature_names_out()))
+            elif svd is not None:
+                reduced = svd.transform(tfidf)
+                blocks.append((reduced, [f"{column}_svd_{i}" for i in range(reduced.shape[1])]))
+        return blocks
+
+    def transform(self, df: pd.DataFrame):
+        """
+        Turns a raw DataFrame batch into the scaled feature matrix the model was trained on.
+
+        Args:
+            df (pd.DataFrame): Raw rows.
+
+        Returns:
+            np.ndarray or sp.csr_matrix: Scaled features, one row per input row.
+        """
+        df = df.drop(columns = [col for col in self.removed_columns + [self.target_column] if col in df.columns])
+        df = df.replace(["True", "False"], [1, 0]).replace(["Yes", "No"], [1, 0])
+        blocks = self._encode(df)
+
+        if self.sparse:
+            numeric = df.reindex(columns = self.numeric_columns).astype(float).fillna(self._fill_values)
+            X = sp.hstack([sp.csr_matrix(numeric.to_numpy())] + [sp.csr_matrix(block) for block, _ in blocks], format = "csr")
+            return self.std_scaler.transform(X)
+
+        encoded = [pd.DataFrame(block.toarray() if sp.issparse(block) else block, columns = names, index = df.index)
+                   for block, names in blocks]
+        X = pd.concat([df] + encoded, axis = 1).reindex(columns = self.feature_columns).astype(float)
+        return self.std_scaler.transform(X.fillna(self._fill_values))
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Predicts on a raw DataFrame batch.
+
+        Args:
+            df (pd.DataFrame): Raw rows.
+
+        Returns:
+            np.ndarray: Predictions, decoded to the original labels for string targets.
+        """
+        predictions = np.ravel(self.model.predict(self.transform(df)))
+        if self.label_encoder is not None:
+            return self.label_encoder.inverse_transform(predictions.astype(int))
+        return predictions
+
+    def predict_proba(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Predicts class probabilities on a raw DataFrame batch (classification only).
+        """
+        return self.model.predict_proba(self.transform(df))
+
+    def measure_throughput(self, df: pd.DataFrame, repeats: int = 5) -> float:
+        """
+        Measures end-to-end prediction throughput on a sample batch.
+
+        Args:
+            df (pd.DataFrame): A representative batch of raw rows.
+            repeats (int): Number of timed `predict` calls; the fastest one is reported.
+
+        Returns:
+            float: Rows per second.
+        """
+        self.predict(df)    # Warm-up, e.g. loading spaCy.
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            self.predict(df)
+            timings.append(time.perf_counter() - start)
+        return len(df) / min(timings)
+
+    def save(self, path: str):
+        """
+        Serializes the pipeline with pickle.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> "InferencePipeline":
+        """
+        Loads a pipeline written by `save` or `AutoML.export_pipeline`.
+        """
+        with open(path, "rb") as f:
+            return pickle.load(f)
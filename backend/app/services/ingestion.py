@@ -0,0 +1,106 @@
+# Importing dependencies
+import sys
+import pandas as pd
+import numpy as np
+
+MAX_TRACKED_UNIQUES = 10_000    # Columns with more distinct values are only reported as exceeding this.
+MAX_CLASSES = 20    # Same threshold `detect_task` uses to tell integer classes from a regression target.
+MIN_PER_CLASS = 6   # Enough rows for SMOTE's default 5 neighbours and a stratified split.
+RESERVOIR_HEADROOM = 0.1    # Extra share of `sample_size` kept while streaming, absorbing the sampling noise of the class shares.
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns the peak resident set size of the current process in MB, or None if it isn't available.
+    """
+    try:
+        import resource
+    except ImportError:   # Not available on Windows.
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024    # Bytes on macOS, KB on Linux.
+
+
+def stream_csv(file_path: str, target_column: str, sample_size: int = 100_000, chunksize: int = 100_000,
+               random_state: int = 21) -> tuple:
+    """
+    Reads a CSV in chunks and builds a bounded-memory training sample plus a profile of the full file,
+    in a single streaming pass.
+
+    Every row gets a uniform random key and only the rows with the smallest keys are kept. While the
+    target looks categorical (at most `MAX_CLASSES` distinct values and not float) these are the
+    `sample_size * (1 + RESERVOIR_HEADROOM)` smallest keys of the file plus the `MIN_PER_CLASS` smallest
+    keys of every class, so each class keeps about its share of the sample, and at most
+    `sample_size * (1 + RESERVOIR_HEADROOM) + MAX_CLASSES * MIN_PER_CLASS` rows are held at any time
+    besides the current chunk. Otherwise the `sample_size` smallest keys are kept. At the end the
+    classes are trimmed to their share of the file, keeping at least `MIN_PER_CLASS` rows of every class.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        target_column (str): Name of the target column.
+        sample_size (int): Maximum number of rows in the returned sample.
+        chunksize (int): Number of rows read per chunk.
+        random_state (int): Seed of the sampling.
+
+    Returns:
+        tuple:
+            - pd.DataFrame: The sample, in file order with a fresh RangeIndex.
+            - dict: Profile of the full file with 'rows', 'dtypes', 'null_counts', 'cardinality'
+                    (None when above `MAX_TRACKED_UNIQUES`), 'class_counts' (None for a continuous
+                    target), 'sampled_rows' and 'peak_rss_mb'.
+    """
+    rng = np.random.default_rng(random_state)
+    reservoir_size = sample_size + int(sample_size * RESERVOIR_HEADROOM)
+    reservoir = None
+    rows = 0
+    null_counts = None
+    uniques = {}
+    class_counts = pd.Series(dtype = "int64")
+    stratified = True
+
+    for chunk in pd.read_csv(file_path, chunksize = chunksize):
+        rows += len(chunk)
+        nulls = chunk.isnull().sum()
+        null_counts = nulls if null_counts is None else null_counts.add(nulls, fill_value = 0)
+
+        for col in chunk.columns:
+            if uniques.get(col, set()) is not None:
+                seen = uniques.setdefault(col, set())
+                seen.update(chunk[col].dropna().unique().tolist())
+                if len(seen) > MAX_TRACKED_UNIQUES:
+                    uniques[col] = None
+
+        target = chunk[target_column]
+        if stratified:
+            class_counts = class_counts.add(target.value_counts(dropna = False), fill_value = 0)
+            stratified = not pd.api.types.is_float_dtype(target) and len(class_counts) <= MAX_CLASSES
+
+        chunk = chunk.assign(_sample_key = rng.random(len(chunk)))
+        reservoir = chunk if reservoir is None else pd.concat([reservoir, chunk])
+        reservoir = reservoir.sort_values("_sample_key")
+        if stratified:
+            rank = reservoir.groupby(target_column, dropna = False, sort = False).cumcount().to_numpy()
+            reservoir = reservoir[(np.arange(len(reservoir)) < reservoir_size) | (rank < MIN_PER_CLASS)]
+        else:
+            reservoir = reservoir.head(sample_size)
+
+    if reservoir is None:
+        raise ValueError(f"{file_path} doesn't contain any rows.")
+
+    if stratified:
+        quotas = np.maximum(np.round(sample_size * class_counts / rows), np.minimum(class_counts, MIN_PER_CLASS))
+        rank = reservoir.groupby(target_column, dropna = False, sort = False).cumcount()
+        reservoir = reservoir[rank.to_numpy() < reservoir[target_column].map(quotas).fillna(sample_size).to_numpy()]
+
+    sample = reservoir.drop(columns = ["_sample_key"]).sort_index().reset_index(drop = True)
+
+    profile = {
+        "rows": rows,
+        "dtypes": {col: str(dtype) for col, dtype in sample.dtypes.items()},    # Resolved across all chunks by the concat.
+        "null_counts": null_counts.astype(int).to_dict(),
+        "cardinality": {col: len(seen) if seen is not None else None for col, seen in uniques.items()},
+        "class_counts": class_counts.astype(int).to_dict() if stratified else None,
+        "sampled_rows": len(sample),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    return sample, profile
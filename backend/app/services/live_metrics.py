@@ -0,0 +1,79 @@
+# Importing dependencies
+import asyncio
+
+
+class MetricNotifier:
+    """
+    Wakes live metric streams up when their run is written to.
+
+    A single change stream per API process (`watch_changes` of the store) is fanned out to the
+    subscribers of each (project_name, run_id), so a stream only re-reads its run after a write to
+    that run. Stores without change streams (SQLite, standalone MongoDB servers) fall back to
+    polling: subscribers are simply woken up every `poll_interval` seconds.
+
+    Attributes:
+        store: The asynchronous tracking store.
+        poll_interval (float): Seconds between checks in polling mode.
+        mode (str): 'change_stream' or 'polling' (None until the first subscription).
+    """
+
+    def __init__(self, store, poll_interval: float = 1.0):
+        self.store = store
+        self.poll_interval = poll_interval
+        self.mode = None
+        self._subscribers = {}
+        self._task = None
+
+    def subscribe(self, key: tuple) -> asyncio.Event:
+        """
+        Registers a subscriber for a (project_name, run_id) key, starting the change stream on first use.
+
+        Returns:
+            asyncio.Event: Set whenever the run is written to. The subscriber clears it before each read.
+        """
+        if self._task is None:
+            if hasattr(self.store, "watch_changes"):
+                self.mode = "change_stream"
+                self._task = asyncio.get_running_loop().create_task(self._watch())
+            else:
+                self.mode = "polling"
+                self._task = asyncio.get_running_loop().create_future()    # Nothing to run, just marks the notifier as started.
+        event = asyncio.Event()
+        self._subscribers.setdefault(key, set()).add(event)
+        return event
+
+    def unsubscribe(self, key: tuple, event: asyncio.Event):
+        """
+        Removes a subscriber registered with `subscribe`.
+        """
+        events = self._subscribers.get(key, set())
+        events.discard(event)
+        if not events:
+            self._subscribers.pop(key, None)
+
+    async def wait(self, event: asyncio.Event, timeout: float) -> bool:
+        """
+        Waits until the subscriber's run is written to, or `timeout` (at most `poll_interval` in polling mode) passes.
+
+        Returns:
+            bool: True if woken up by a write notification.
+        """
+        if self.mode == "polling":
+            timeout = min(timeout, self.poll_interval)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _watch(self):
+        try:
+            async for key in self.store.watch_changes():
+                for event in self._subscribers.get(key, ()):
+                    event.set()
+        except Exception as e:    # Change streams need a replica set or a sharded cluster.
+            print(f"SwiftPredict: Live metrics fall back to polling every {self.poll_interval}s ({e})")
+        self.mode = "polling"
+        for events in self._subscribers.values():
+            for event in events:
+                event.set()    # Waking everyone up so they switch to polling right away.
@@ -0,0 +1,263 @@
+# Importing dependencies
+import re
+import time
+import asyncio
+import threading
+from pathlib import Path
+from collections import OrderedDict, Counter, deque
+import pandas as pd
+import numpy as np
+from .inference import InferencePipeline
+
+MODEL_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_\-.]+$")
+
+
+class ModelCache:
+    """
+    An in-process LRU cache of exported `InferencePipeline`s, loaded from '<model_dir>/<name>.pkl'.
+
+    The model files are checked at most once per `check_interval` seconds per model rather than on
+    every request. A re-exported file (new modification time) is loaded on the first check after the
+    export, and `reload` forces the next request to check right away.
+
+    Attributes:
+        model_dir (Path): Directory holding the pickled pipelines.
+        capacity (int): Maximum number of pipelines kept in memory.
+        check_interval (float): Seconds during which a model's last file check is trusted.
+    """
+
+    def __init__(self, model_dir: str, capacity: int = 8, check_interval: float = 5.0):
+        self.model_dir = Path(model_dir)
+        self.capacity = capacity
+        self.check_interval = check_interval
+        self._pipelines = OrderedDict()    # name -> (pipeline, mtime_ns of the loaded file)
+        self._checked = {}                 # name -> (mtime_ns, monotonic time of the check)
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> Path:
+        """
+        Returns the file of a model, refusing names that could escape `model_dir`.
+
+        Raises:
+            FileNotFoundError: If the name is invalid or no such model was exported.
+        """
+        path = self.model_dir / f"{name}.pkl"
+        if not MODEL_NAME_PATTERN.match(name) or ".." in name or not path.is_file():
+            raise FileNotFoundError(f"Model {name} DOESN'T EXIST in {self.model_dir}")
+        return path
+
+    def check(self, name: str) -> int:
+        """
+        Makes sure a model exists, touching the filesystem only if its last check is older than `check_interval`.
+
+        Returns:
+            int: Modification time (ns) of the model file as of the last check.
+
+        Raises:
+            FileNotFoundError: If the name is invalid or the model doesn't exist (anymore).
+        """
+        now = time.monotonic()
+        with self._lock:
+            checked = self._checked.get(name)
+            if checked is not None and now - checked[1] < self.check_interval:
+                return checked[0]
+        try:
+            mtime = self.path(name).stat().st_mtime_ns
+        except FileNotFoundError:
+            self.reload(name)    # Deleted since it was loaded.
+            raise
+        with self._lock:
+            self._checked[name] = (mtime, now)
+        return mtime
+
+    def reload(self, name: str = None):
+        """
+        Forgets a model (or every model if `name` is None), so the next request checks and loads its file again.
+        """
+        with self._lock:
+            if name is None:
+                self._pipelines.clear()
+                self._checked.clear()
+            else:
+                self._pipelines.pop(name, None)
+                self._checked.pop(name, None)
+
+    def get(self, name: str) -> InferencePipeline:
+        """
+        Returns a loaded pipeline, loading it (and evicting the least recently used one) on a miss or
+        when the file changed since it was loaded.
+        """
+        mtime = self.check(name)
+        with self._lock:
+            entry = self._pipelines.get(name)
+            if entry is not None and entry[1] == mtime:
+                self._pipelines.move_to_end(name)
+                return entry[0]
+            pipeline = InferencePipeline.load(self.path(name))
+            self._pipelines[name] = (pipeline, mtime)
+            self._pipelines.move_to_end(name)
+            if len(self._pipelines) > self.capacity:
+                self._pipelines.popitem(last = False)
+            return pipeline
+
+    def loaded(self) -> list:
+        """
+        Returns the names of the models currently in memory, least recently used first.
+        """
+        with self._lock:
+            return list(self._pipelines)
+
+
+class ServingStats:
+    """
+    Request latencies (over a sliding window) and a histogram of batch sizes for one model.
+    """
+
+    def __init__(self, window: int = 10_000):
+        self.latencies_ms = deque(maxlen = window)
+        self.batch_sizes = Counter()
+        self.requests = 0
+        self.batches = 0
+
+    def record_request(self, latency_ms: float):
+        self.requests += 1
+        self.latencies_ms.append(latency_ms)
+
+    def record_batch(self, rows: int):
+        self.batches += 1
+        bucket = 1 << (max(rows, 1).bit_length() - 1)     # Power-of-two buckets: 1, 2-3, 4-7, ...
+        self.batch_sizes[bucket] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current statistics as a JSON-serializable dict.
+        """
+        latencies = np.array(self.latencies_ms)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+            "p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else None,
+            "batch_rows_histogram": {f"{bucket}-{bucket * 2 - 1}": count for bucket, count in sorted(self.batch_sizes.items())},
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests for one model into a single vectorized `predict` call.
+
+    The first queued request opens a batch, which then collects further requests until either
+    `max_wait_ms` has passed or `max_batch_rows` rows are queued. The batch is predicted in a worker
+    thread so the event loop keeps accepting requests. If the combined call fails, every request of the
+    batch is predicted on its own, so a bad record only fails the request it came from.
+    """
+
+    def __init__(self, predict_fn, stats: ServingStats, max_batch_rows: int = 1024, max_wait_ms: float = 2.0):
+        self.predict_fn = predict_fn
+        self.stats = stats
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Queues a batch of rows and waits for its predictions.
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        future = loop.create_future()
+        await self._queue.put((df, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            rows = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+            while rows < self.max_batch_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+                rows += len(batch[-1][0])
+
+            self.stats.record_batch(rows)
+            try:
+                combined = pd.concat([df for df, _ in batch], ignore_index = True)
+                predictions = await loop.run_in_executor(None, self.predict_fn, combined)
+            except Exception as e:
+                if len(batch) == 1:
+                    if not batch[0][1].done():
+                        batch[0][1].set_exception(e)
+                else:
+                    await self._predict_each(batch)
+                continue
+
+            offset = 0
+            for df, future in batch:
+                if not future.done():
+                    future.set_result(predictions[offset:offset + len(df)])
+                offset += len(df)
+
+    async def _predict_each(self, batch: list):
+        """
+        Predicts the requests of a failed batch one by one, failing only the requests that fail on their own.
+        """
+        loop = asyncio.get_running_loop()
+        for df, future in batch:
+            if future.done():    # The client went away.
+                continue
+            try:
+                future.set_result(await loop.run_in_executor(None, self.predict_fn, df))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+
+
+class ModelServer:
+    """
+    Serves exported AutoML pipelines: an LRU model cache plus one micro-batcher and one set of
+    latency statistics per model.
+    """
+
+    def __init__(self, model_dir: str, capacity: int = 8, max_batch_rows: int = 1024, max_wait_ms: float = 2.0,
+                 check_interval: float = 5.0):
+        self.cache = ModelCache(model_dir, capacity = capacity, check_interval = check_interval)
+        self.max_batch_rows = max_batch_rows
+        self.max_wait_ms = max_wait_ms
+        self._batchers = {}
+        self._stats = {}
+
+    async def predict(self, name: str, records: list) -> list:
+        """
+        Predicts on a list of raw records (dicts keyed by column name).
+
+        Raises:
+            FileNotFoundError: If the model doesn't exist.
+            ValueError: If `records` is empty. Records the pipeline can't convert also raise
+                        ValueError (or TypeError/KeyError), from the prediction itself.
+        """
+        start = time.perf_counter()
+        self.cache.check(name)
+        if not records:
+            raise ValueError("records must contain at least one row")
+        if name not in self._batchers:
+            self._stats[name] = ServingStats()
+            self._batchers[name] = MicroBatcher(lambda df: self.cache.get(name).predict(df), self._stats[name],
+                                                max_batch_rows = self.max_batch_rows, max_wait_ms = self.max_wait_ms)
+        predictions = await self._batchers[name].submit(pd.DataFrame.from_records(records))
+        self._stats[name].record_request((time.perf_counter() - start) * 1000)
+        return predictions.tolist()
+
+    def stats(self) -> dict:
+        """
+        Returns the serving statistics of every model plus the models currently loaded.
+        """
+        return {"loaded_models": self.cache.loaded(), "models": {name: stats.snapshot() for name, stats in self._stats.items()}}
@@ -0,0 +1,83 @@
+# Importing dependencies
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from matplotlib.figure import Figure
+
+
+def render_metric_plot(steps, values, metric: str, run_id: str) -> bytes:
+    """
+    Renders a metric plot to PNG bytes.
+
+    Uses a standalone Agg `Figure` instead of `pyplot`, so concurrent renders in different threads
+    share no global state and the figure is freed as soon as it goes out of scope.
+
+    Args:
+        steps (array-like): Steps of the series.
+        values (array-like): Values of the series.
+        metric (str): Name of the metric.
+        run_id (str): Unique identifier of the run.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot(steps, values)
+    ax.set_xlabel("Step")
+    ax.set_ylabel(metric.title())
+    ax.set_title(f"{metric.title()} plot of Run_id : {run_id}")
+
+    buf = BytesIO()
+    fig.savefig(buf, format = "png")
+    return buf.getvalue()
+
+
+class PlotCache:
+    """
+    A thread-safe in-memory LRU cache of rendered PNGs.
+
+    Keys should include a version of the plotted data, so a run that logs new points
+    gets a new key instead of a stale image.
+
+    Attributes:
+        capacity (int): Maximum number of cached images.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that had to render.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        """
+        Returns the cached PNG of a key (marking it as recently used), or None.
+        """
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return self._images[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: tuple, png: bytes):
+        """
+        Stores a PNG, evicting the least recently used one if the cache is full.
+        """
+        with self._lock:
+            self._images[key] = png
+            self._images.move_to_end(key)
+            if len(self._images) > self.capacity:
+                self._images.popitem(last = False)
+
+    def stats(self) -> dict:
+        """
+        Returns the size and hit/miss counts of the cache.
+        """
+        with self._lock:
+            return {"cached_plots": len(self._images), "capacity": self.capacity, "hits": self.hits, "misses": self.misses}
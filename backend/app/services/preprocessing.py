@@ -5,37 +5,47 @@ from sklearn.decomposition import TruncatedSVD
 from sklearn.naive_bayes import GaussianNB
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from xgboost import XGBRegressor, XGBClassifier
-from lightgbm import LGBMRegressor, LGBMClassifier
-from catboost import CatBoostClassifier, CatBoostRegressor  # Importing CatBoost models for classification and regression
-from sklearn.model_selection import train_test_split, cross_validate
+from sklearn.model_selection import train_test_split, cross_validate, StratifiedKFold, KFold
 from sklearn.metrics import make_scorer, accuracy_score, f1_score, precision_score, roc_auc_score
-from imblearn.over_sampling import SMOTE
+from joblib import Parallel, delayed
 from ..client.swift_predict import SwiftPredict
+from .ensemble import FoldEnsemble
+from .text_cache import TextCache
 from statistics import multimode
 import pandas as pd
 import numpy as np
 from scipy.stats import normaltest
+from scipy import sparse as sp
 from tqdm.auto import tqdm
 import warnings
 import string
+import os
+import math
+import time
 import re
+from functools import lru_cache
 warnings.filterwarnings("ignore")
 
 
-tqdm.pandas(desc = "Preprocessing text")
-
-import spacy
-from spacy.cli import download
+@lru_cache(maxsize = None)
+def get_nlp():
+    """
+    Loads the spaCy pipeline on first use, downloading 'en_core_web_sm' if it isn't installed.
 
-try:
-    # Attempting to load the model
-    nlp = spacy.load("en_core_web_sm", disable=["ner", "parser"])
-except OSError:
-    # If the model isn't found, downloading it automatically
-    print("SwiftPredict: Downloading required spaCy language model (en_core_web_sm)...")
-    download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm", disable=["ner", "parser"])   # Only keeping tagger + lemmatizer for speed
+    Returns:
+        spacy.language.Language: The pipeline with only the tagger and lemmatizer enabled.
+    """
+    import spacy
+    from spacy.cli import download
+
+    try:
+        # Attempting to load the model
+        return spacy.load("en_core_web_sm", disable=["ner", "parser"])
+    except OSError:
+        # If the model isn't found, downloading it automatically
+        print("SwiftPredict: Downloading required spaCy language model (en_core_web_sm)...")
+        download("en_core_web_sm")
+        return spacy.load("en_core_web_sm", disable=["ner", "parser"])   # Only keeping tagger + lemmatizer for speed
 
 def get_dtype_columns(df):
     """
@@ -72,7 +82,7 @@ def text_preprocessor(text: str, handle_emojis: bool = False, handle_html: bool
     text = str(text).translate(str.maketrans('', '', string.punctuation))
 
     # Processing with spaCy
-    doc = nlp(text)
+    doc = get_nlp()(text)
 
     # Lemmatizing and remove stopwords and non-alphabetic tokens
     tokens = [token.lemma_.lower() for token in doc if not token.is_stop]
@@ -81,6 +91,62 @@ def text_preprocessor(text: str, handle_emojis: bool = False, handle_html: bool
         return " ".join(tokens)
     return ""
 
+def preprocess_texts(texts, handle_html: bool = False, batch_size: int = 1000, n_process: int = 1,
+                     cache: TextCache = None) -> list:
+    """
+    Batched version of `text_preprocessor` for a whole column.
+
+    Duplicate values are processed only once. The HTML and punctuation stages run vectorized over
+    the unique values, then the texts are streamed through `nlp.pipe` in batches (optionally across
+    several processes). The output matches calling `text_preprocessor` on every value.
+
+    Args:
+        texts (pd.Series or list): The texts to preprocess.
+        handle_html (bool): If True, removes HTML tags.
+        batch_size (int): Number of texts spaCy processes per batch.
+        n_process (int): Number of processes used by spaCy (-1 for all cores).
+        cache (TextCache, optional): Persistent cache consulted before running spaCy and filled
+                                     with the newly processed texts.
+
+    Returns:
+        list: The preprocessed texts, in the same order as `texts`.
+    """
+    codes, uniques = pd.factorize(pd.Series(texts, dtype = object).astype(str))
+    uniques = uniques.tolist()
+
+    if cache is None:
+        processed = _lemmatize_texts(uniques, handle_html, batch_size, n_process)
+    else:
+        import spacy
+        nlp = get_nlp()
+        namespace = f"{nlp.meta['name']}-{nlp.meta['version']}|spacy-{spacy.__version__}|{','.join(nlp.pipe_names)}|html={handle_html}"
+        keys = [TextCache.make_key(text, namespace) for text in uniques]
+        cached = cache.get_many(keys)
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        fresh = _lemmatize_texts([uniques[i] for i in missing], handle_html, batch_size, n_process)
+        cache.set_many({keys[i]: value for i, value in zip(missing, fresh)})
+        cached.update((keys[i], value) for i, value in zip(missing, fresh))
+        processed = [cached[key] for key in keys]
+
+    return np.asarray(processed, dtype = object)[codes].tolist() if processed else [""] * len(codes)
+
+def _lemmatize_texts(texts: list, handle_html: bool, batch_size: int, n_process: int) -> list:
+    """
+    Runs the HTML, punctuation and spaCy stages of `text_preprocessor` over a list of strings.
+    """
+    texts = pd.Series(texts, dtype = object)
+
+    # Optional: Remove HTML
+    if handle_html:
+        texts = texts.str.replace(r'<.*?>', '', regex = True)
+
+    # Removing punctuation
+    texts = texts.str.translate(str.maketrans('', '', string.punctuation))
+
+    docs = get_nlp().pipe(texts.tolist(), batch_size = batch_size, n_process = n_process)
+    return [" ".join(token.lemma_.lower() for token in doc if not token.is_stop)
+            for doc in tqdm(docs, total = len(texts), desc = "Preprocessing text")]
+
 def handle_null_values(df):
     """
      Handles missing values in the DataFrame using intelligent strategies.
@@ -171,6 +237,8 @@ def handle_imbalance(df, target_column : str, X_train, y_train):
     min_data = min(class_counts)
 
     if min_data/max_data < 0.15:  # If the min data is less than 15 % of the max data the dataset will be considered imbalanced.
+        from imblearn.over_sampling import SMOTE
+
         smote = SMOTE(random_state = 21)
         X_res, target_res = smote.fit_resample(X_train, y_train)
 
@@ -179,19 +247,27 @@ def handle_imbalance(df, target_column : str, X_train, y_train):
     else:
         return X_train, y_train
 
-def model_zoo(task, model = None):
+def model_zoo(task, model = None, sparse: bool = False):
     """
     Returns a list of models applicable to the specified ML task.
 
     Args:
         task (str): The type of ML task ('classification' or 'regression').
         model (object, optional): A specific model to include in the list.
+        sparse (bool): If True, only returns models that accept SciPy sparse input.
 
     Returns:
         list: List of model classes corresponding to the task.
     """
+    # The boosting libraries are slow to import, so they are only loaded once a zoo is requested.
+    from xgboost import XGBRegressor, XGBClassifier
+    from lightgbm import LGBMRegressor, LGBMClassifier
+    from catboost import CatBoostClassifier, CatBoostRegressor
+
     if task == "classification":
         models = [GaussianNB, XGBClassifier, RandomForestClassifier, LGBMClassifier, LogisticRegression, CatBoostClassifier]
+        if sparse:
+            models.remove(GaussianNB)   # GaussianNB only works on dense arrays.
         if model:
             return models.append(model)
         else:
@@ -203,7 +279,255 @@ def model_zoo(task, model = None):
         else:
             return models
 
-def train_model(task, X_train, y_train, logger = None):
+def build_model(k, task: str, n_threads: int = -1):
+    """
+    Instantiates a model class from the model zoo with the constructor arguments it needs.
+
+    Args:
+        k (type): Model class from `model_zoo`.
+        task (str): The ML task ('classification' or 'regression').
+        n_threads (int): Number of threads the estimator may use internally (-1 for all cores).
+
+    Returns:
+        object: An unfitted estimator.
+    """
+    name = k.__name__
+    if name == "GaussianNB":
+        return k()
+    elif name == "LGBMClassifier":
+        return k(verbose = -1, n_jobs = n_threads)
+    elif name == "LogisticRegression":
+        return k(solver = "saga", n_jobs = n_threads)
+    elif name == "CatBoostClassifier":
+        return k(verbose = 0, thread_count = n_threads)
+    elif name == "CatBoostRegressor":
+        return k(thread_count = n_threads)
+    elif name in ("XGBClassifier", "RandomForestClassifier", "LinearRegression", "XGBRegressor",
+                  "LGBMRegressor", "RandomForestRegressor"):
+        return k(n_jobs = n_threads)
+    return k()
+
+def _fit_and_score(model, X, y, split, scoring, return_estimator: bool = False):
+    """
+    Fits a model on one cross-validation split and scores it, or on the full data if `split` is None.
+
+    Args:
+        model (object): Unfitted estimator.
+        X (np.ndarray): Training features.
+        y (np.ndarray or pd.Series): Training labels.
+        split (tuple or None): (train indices, test indices) of the fold.
+        scoring (dict or list): Scoring methods accepted by `cross_validate`.
+        return_estimator (bool): If True, also returns the estimator fitted on the fold.
+
+    Returns:
+        tuple: Dict of fold scores keyed like `cross_validate` output ('test_<metric>') and the fitted
+               estimator (None for cross-validation folds unless `return_estimator` is set).
+    """
+    if split is None:
+        return {}, model.fit(X, y)
+    cv = cross_validate(estimator = model, X = X, y = y, cv = [split], scoring = scoring, return_estimator = return_estimator)
+    scores = {name: values[0] for name, values in cv.items() if name.startswith("test_")}
+    return scores, cv["estimator"][0] if return_estimator else None
+
+def _run_in_pool(task, tasks, X, y, scoring, n_jobs: int = -1, return_estimator: bool = False):
+    """
+    Runs (model class, split) tasks in a process pool sized from a single core budget.
+
+    The pool size and the threads handed to every estimator are derived from `n_jobs`, so nested
+    `n_jobs` inside LightGBM/XGBoost/LogisticRegression cannot oversubscribe the machine.
+
+    Returns:
+        list: (scores, estimator, params) per task, in the same order as `tasks`. `params` are the
+              constructor params of the estimator as trained, including its thread count.
+    """
+    core_budget = (os.cpu_count() or 1) if n_jobs is None or n_jobs < 0 else n_jobs
+    workers = max(1, min(core_budget, len(tasks)))
+    n_threads = max(1, core_budget // workers)
+
+    models = [build_model(k, task, n_threads) for k, _ in tasks]
+    results = Parallel(n_jobs = workers, return_as = "generator")(
+        delayed(_fit_and_score)(model, X, y, split, scoring, return_estimator)
+        for model, (_, split) in zip(models, tasks)
+    )
+    results = list(tqdm(results, total = len(tasks), desc = "Training the Models"))
+    return [(scores, estimator, model.get_params()) for (scores, estimator), model in zip(results, models)]
+
+def cross_validate_zoo(task, models, X_train, y_train, scoring, n_jobs: int = -1, folds: int = 5,
+                       refit: bool = True, return_estimator: bool = False, fold_indices: list = None):
+    """
+    Cross-validates (and optionally refits) every model of the zoo in a process pool.
+
+    Each (model, fold) pair and each full refit is scheduled as an independent task, and the
+    results are collected in the same deterministic order as `models`.
+
+    Args:
+        task (str): The ML task ('classification' or 'regression').
+        models (list): Model classes from `model_zoo`.
+        X_train (np.ndarray): Training features.
+        y_train (np.ndarray or pd.Series): Training labels.
+        scoring (dict or list): Scoring methods accepted by `cross_validate`.
+        n_jobs (int): Total number of cores to use (-1 for all cores, 1 to train sequentially).
+        folds (int): Number of cross-validation folds.
+        refit (bool): If True, every model is also refitted on the full training data.
+        return_estimator (bool): If True, the fold estimators are kept under the 'estimator' key.
+        fold_indices (list, optional): Only run these folds out of the `folds` splits. Defaults to all.
+
+    Returns:
+        tuple:
+            - dict: Fold scores per model, str(model class) -> {'test_<metric>': np.ndarray}, plus the
+                    'params' of the estimator as cross-validated (with the thread count it was given).
+            - dict: Models refitted on the full training data, str(model class) -> estimator.
+    """
+    splitter = StratifiedKFold(n_splits = folds) if task == "classification" else KFold(n_splits = folds)
+    splits = list(splitter.split(X_train, y_train))
+    if fold_indices is not None:
+        splits = [splits[i] for i in fold_indices]
+
+    tasks = [(k, split) for k in models for split in splits]
+    if refit:
+        tasks += [(k, None) for k in models]
+    results = _run_in_pool(task, tasks, X_train, y_train, scoring, n_jobs = n_jobs, return_estimator = return_estimator)
+
+    cv_results = {str(k): {} for k in models}
+    trained_models = {}
+    for (k, split), (scores, estimator, params) in zip(tasks, results):
+        if split is None:
+            trained_models[str(k)] = estimator
+        else:
+            cv_results[str(k)]["params"] = params
+            for name, value in scores.items():
+                cv_results[str(k)].setdefault(name, []).append(value)
+            if return_estimator:
+                cv_results[str(k)].setdefault("estimator", []).append(estimator)
+
+    cv_results = {key: {name: values if name in ("estimator", "params") else np.array(values) for name, values in scores.items()}
+                  for key, scores in cv_results.items()}
+    return cv_results, trained_models
+
+def halving_cross_validate(task, models, X_train, y_train, scoring, primary_metric: str, n_jobs: int = -1,
+                           folds: int = 5, screening_folds: int = 2, tolerance: float = 0.02, time_budget: float = None,
+                           return_estimator: bool = False):
+    """
+    Cross-validates the zoo with successive halving instead of paying full CV for every model.
+
+    Every model is first scored on `screening_folds` folds. Only the clear losers are discarded: a model
+    is eliminated if its mean fold-by-fold gap to the leader on `primary_metric` exceeds both `tolerance`
+    and twice the standard error of that gap, so models within the screening noise of the leader survive.
+    The survivors are evaluated on the remaining folds. If `time_budget` seconds have already elapsed
+    after the screening round, the remaining folds are skipped and the survivors are ranked on the
+    screening folds alone. No model is refitted on the full data here.
+
+    Args:
+        task (str): The ML task ('classification' or 'regression').
+        models (list): Model classes from `model_zoo`.
+        X_train (np.ndarray): Training features.
+        y_train (np.ndarray or pd.Series): Training labels.
+        scoring (dict or list): Scoring methods accepted by `cross_validate`.
+        primary_metric (str): Scorer name used to rank the candidates (higher is better).
+        n_jobs (int): Total number of cores to use.
+        folds (int): Number of cross-validation folds.
+        screening_folds (int): Number of folds every model is scored on before elimination.
+        tolerance (float): Smallest gap to the leader's screening score for which a model is eliminated.
+        time_budget (float, optional): Seconds after which no further folds are started.
+        return_estimator (bool): If True, the fold estimators are kept under the 'estimator' key.
+
+    Returns:
+        tuple:
+            - dict: Fold scores per model (eliminated models only have the screening folds).
+            - dict: Elimination trace, str(model class) -> {'folds': int, 'eliminated': bool}.
+    """
+    started = time.monotonic()
+    screening_folds = max(1, min(screening_folds, folds))
+    cv_results, _ = cross_validate_zoo(task, models, X_train, y_train, scoring, n_jobs = n_jobs, folds = folds, refit = False,
+                                       return_estimator = return_estimator, fold_indices = list(range(screening_folds)))
+
+    screening = {str(k): np.nan_to_num(cv_results[str(k)][f"test_{primary_metric}"], nan = -np.inf) for k in models}
+    leader = screening[str(max(models, key = lambda k: screening[str(k)].mean()))]
+
+    def clearly_worse(k):
+        gaps = leader - screening[str(k)]    # Paired on the same folds, which cancels out the fold difficulty.
+        margin = 2 * gaps.std(ddof = 1) / math.sqrt(len(gaps)) if len(gaps) > 1 else 0.0
+        return bool(gaps.mean() > max(tolerance, margin))    # NaN gaps (every model failed) never eliminate.
+
+    survivors = [k for k in models if not clearly_worse(k)]
+    trace = {str(k): {"folds": screening_folds, "eliminated": k not in survivors} for k in models}
+
+    if screening_folds == folds:
+        return cv_results, trace
+    if time_budget is not None and time.monotonic() - started >= time_budget:
+        print(f"SwiftPredict: Time budget of {time_budget}s used up after the screening round, skipping the remaining folds.")
+        return cv_results, trace
+
+    remaining, _ = cross_validate_zoo(task, survivors, X_train, y_train, scoring, n_jobs = n_jobs, folds = folds, refit = False,
+                                      return_estimator = return_estimator, fold_indices = list(range(screening_folds, folds)))
+    for k in survivors:
+        for name, values in remaining[str(k)].items():
+            if name == "estimator":
+                cv_results[str(k)][name] = cv_results[str(k)][name] + values
+            elif name != "params":
+                cv_results[str(k)][name] = np.concatenate([cv_results[str(k)][name], values])
+        trace[str(k)]["folds"] = folds
+    return cv_results, trace
+
+def evaluate_zoo(task, models, X_train, y_train, scoring, primary_metric: str, n_jobs: int = -1, refit: str = "best",
+                 selection: str = "full", time_budget: float = None, halving_tolerance: float = 0.02):
+    """
+    Evaluates the model zoo with either full cross-validation or successive halving.
+
+    Returns:
+        tuple:
+            - dict: Fold scores per model, see `cross_validate_zoo`.
+            - dict: Models already refitted on the full training data.
+            - dict: Elimination trace per model (empty for full selection).
+    """
+    if selection == "halving":
+        cv_results, trace = halving_cross_validate(task, models, X_train, y_train, scoring, primary_metric, n_jobs = n_jobs,
+                                                   tolerance = halving_tolerance, time_budget = time_budget,
+                                                   return_estimator = refit == "folds")
+        return cv_results, {}, trace
+
+    cv_results, trained_models = cross_validate_zoo(task, models, X_train, y_train, scoring, n_jobs = n_jobs,
+                                                    refit = refit == "all", return_estimator = refit == "folds")
+    return cv_results, trained_models, {}
+
+def finalize_winners(task, winners, cv_results, trained_models, X_train, y_train, refit: str = "best", n_jobs: int = -1):
+    """
+    Makes sure every winning model has a final estimator, without retraining the losers.
+
+    Args:
+        task (str): The ML task ('classification' or 'regression').
+        winners (list): Model classes selected for `best_models`.
+        cv_results (dict): Output of `cross_validate_zoo`.
+        trained_models (dict): Models already refitted on the full training data.
+        X_train (np.ndarray): Training features.
+        y_train (np.ndarray or pd.Series): Training labels.
+        refit (str): 'best' refits the winners on the full data, 'folds' wraps their fold
+                     estimators into a `FoldEnsemble` instead.
+        n_jobs (int): Total number of cores to use.
+
+    Returns:
+        dict: `trained_models` completed with an estimator for every winner.
+    """
+    missing = [k for k in winners if str(k) not in trained_models]
+    if refit == "folds":
+        for k in missing:
+            trained_models[str(k)] = FoldEnsemble(cv_results[str(k)]["estimator"], task = task)
+    elif missing:
+        results = _run_in_pool(task, [(k, None) for k in missing], X_train, y_train, scoring = None, n_jobs = n_jobs)
+        for k, (_, estimator, _) in zip(missing, results):
+            trained_models[str(k)] = estimator
+    return trained_models
+
+def model_name(model) -> str:
+    """
+    Returns the class name of a trained model, looking through `FoldEnsemble` wrappers.
+    """
+    if isinstance(model, FoldEnsemble):
+        return type(model.base_estimator).__name__
+    return type(model).__name__
+
+def train_model(task, X_train, y_train, logger = None, n_jobs: int = -1, refit: str = "best", selection: str = "full",
+                time_budget: float = None, halving_tolerance: float = 0.02):
     """
     Trains multiple models and logs metrics using cross-validation.
 
@@ -212,53 +536,64 @@ def train_model(task, X_train, y_train, logger = None):
         X_train (np.ndarray): Training features.
         y_train (np.ndarray or pd.Series): Training labels.
         logger (SwiftPredict): Logger object for metric and parameter logging.
-        log_only_best (bool): If set to true only logs the best model.
+        n_jobs (int): Total number of cores shared by all models and folds (-1 for all cores).
+        refit (str): 'all' refits every model on the full data, 'best' refits only the models selected
+                     for `best_models`, 'folds' uses the ensemble of their fold estimators without refitting.
+        selection (str): 'full' cross-validates every model on all folds, 'halving' screens every model
+                         on two folds and only finishes the CV of the models not clearly worse than the leader
+                         (see `halving_cross_validate`).
+                         Eliminated models are logged with their screening scores and can't be selected.
+                         With 'halving', refit='all' only refits the selected models.
+        time_budget (float, optional): Seconds after which 'halving' stops starting new folds.
+        halving_tolerance (float): Smallest screening gap to the leader for which 'halving' eliminates a model.
+
+    Raises:
+        ValueError: If `refit` or `selection` is not a supported value.
 
     Returns:
         tuple:
             - dict: Best models based on individual metrics and overall ranking.
             - dict: Model names for each best-performing metric.
     """
+    if refit not in ("all", "best", "folds"):
+        raise ValueError("refit must be one of 'all', 'best' or 'folds'.")
+    if selection not in ("full", "halving"):
+        raise ValueError("selection must be either 'full' or 'halving'.")
+
     if task == "classification":
         avg_acc_scores = []
         avg_f1_score = []
         avg_precision = []
-        models = model_zoo(task = task)
-        trained_models = {}
+        models = model_zoo(task = task, sparse = sp.issparse(X_train))
         scoring_methods = {
             "accuracy": make_scorer(accuracy_score),
             "f1": make_scorer(f1_score, average = 'weighted', zero_division = 0),
             "precision": make_scorer(precision_score, average = 'weighted', zero_division = 0)
         }
-        for k in tqdm(models, desc = "Training the Models"):     # Training each classification model in model zoo.
-            if k.__name__ != "GaussianNB":
-                if k.__name__ == "LGBMClassifier":
-                    model = k(verbose = -1, n_jobs = -1)
-                elif k.__name__ == "LogisticRegression":
-                    model = k(solver = "saga", n_jobs = -1)
-                elif k.__name__ == "CatBoostClassifier":
-                    model = k(verbose = 0)
-                else:
-                    model = k(n_jobs=-1)
-            else :
-                model = k()
-
-            cv = cross_validate(estimator = model, X = X_train, y = y_train, cv = 5, scoring = scoring_methods)
+        cv_results, trained_models, trace = evaluate_zoo(task, models, X_train, y_train, scoring_methods, primary_metric = "accuracy",
+                                                         n_jobs = n_jobs, refit = refit, selection = selection, time_budget = time_budget,
+                                                         halving_tolerance = halving_tolerance)
+        for k in models:     # Logging each classification model in model zoo.
+            cv = cv_results[str(k)]
+            model = build_model(k, task)
             acc = cv["test_accuracy"]
             f1 = cv["test_f1"]
             precision = cv["test_precision"]
-            trained_models[str(k)] = model.fit(X_train, y_train)
 
-            for key, value in model.get_params().items():
-                logger.log_param(key = key, value = value, model_name = type(model).__name__)
+            logger.log_params(params = cv["params"], model_name = type(model).__name__)    # As trained, e.g. with its n_jobs.
 
             logger.log_or_update_metric(value = acc.mean(), key = "accuracy", model_name = type(model).__name__)
             logger.log_or_update_metric(value = f1.mean(), key = "f1_score", model_name = type(model).__name__)
             logger.log_or_update_metric(value = precision.mean(), key = "precision", model_name = type(model).__name__)
 
-            avg_precision.append(precision.mean())
-            avg_f1_score.append(f1.mean())
-            avg_acc_scores.append(acc.mean())
+            eliminated = str(k) in trace and trace[str(k)]["eliminated"]
+            if trace:
+                logger.log_params(params = {"halving_folds": trace[str(k)]["folds"], "halving_eliminated": eliminated},
+                                  model_name = type(model).__name__)
+
+            avg_precision.append(-np.inf if eliminated else precision.mean())
+            avg_f1_score.append(-np.inf if eliminated else f1.mean())
+            avg_acc_scores.append(-np.inf if eliminated else acc.mean())
 
         performers = [
             avg_acc_scores.index(max(avg_acc_scores)),
@@ -267,6 +602,8 @@ def train_model(task, X_train, y_train, logger = None):
             ]
 
         overall_best = multimode(performers)
+        trained_models = finalize_winners(task, [models[i] for i in set(performers)], cv_results, trained_models,
+                                          X_train, y_train, refit = refit, n_jobs = n_jobs)
 
         best_models = {"f1": trained_models[
             str(models[avg_f1_score.index(max(avg_f1_score))]
@@ -282,7 +619,7 @@ def train_model(task, X_train, y_train, logger = None):
         best_model_showcase = {}
 
         for metric, model in best_models.items():
-            best_model_showcase[metric] = type(model).__name__ if type(model).__name__ != 'list' else [type(k).__name__ for k in model ]
+            best_model_showcase[metric] = model_name(model) if type(model).__name__ != 'list' else [model_name(k) for k in model ]
 
         return best_models, best_model_showcase
 
@@ -290,28 +627,33 @@ def train_model(task, X_train, y_train, logger = None):
         avg_neg_mse = []
         avg_neg_mae = []
         avg_r2 = []
-        trained_models = {}
 
-        models = model_zoo(task = task)
+        models = model_zoo(task = task, sparse = sp.issparse(X_train))
         scoring_methods = ["neg_mean_squared_error", "neg_mean_absolute_error", "r2"]
-        for k in tqdm(models, desc = "Training the Models"):  # Training each classification model in model zoo.
-            model = k()
-            cv = cross_validate(estimator = model, X = X_train, y = y_train, cv = 5, scoring = scoring_methods)
+        cv_results, trained_models, trace = evaluate_zoo(task, models, X_train, y_train, scoring_methods, primary_metric = "r2",
+                                                         n_jobs = n_jobs, refit = refit, selection = selection, time_budget = time_budget,
+                                                         halving_tolerance = halving_tolerance)
+        for k in models:  # Logging each regression model in model zoo.
+            cv = cv_results[str(k)]
+            model = build_model(k, task)
             neg_mse = cv["test_neg_mean_squared_error"]
             neg_mae = cv["test_neg_mean_absolute_error"]
             r2 = cv["test_r2"]
-            trained_models[str(k)] = model.fit(X_train, y_train)
 
-            for key, value in model.get_params().items():
-                logger.log_param(key = key, value = value, model_name = type(model).__name__)
+            logger.log_params(params = cv["params"], model_name = type(model).__name__)    # As trained, e.g. with its n_jobs.
 
             logger.log_or_update_metric(value = -1 * neg_mse.mean(), key = "MSE", model_name = type(model).__name__)
             logger.log_or_update_metric(value = -1 * neg_mae.mean(), key = "MAE", model_name = type(model).__name__)
             logger.log_or_update_metric(value = r2.mean(), key = "R2", model_name = type(model).__name__)
 
-            avg_neg_mse.append(neg_mse.mean())
-            avg_neg_mae.append(neg_mae.mean())
-            avg_r2.append(r2.mean())
+            eliminated = str(k) in trace and trace[str(k)]["eliminated"]
+            if trace:
+                logger.log_params(params = {"halving_folds": trace[str(k)]["folds"], "halving_eliminated": eliminated},
+                                  model_name = type(model).__name__)
+
+            avg_neg_mse.append(-np.inf if eliminated else neg_mse.mean())
+            avg_neg_mae.append(-np.inf if eliminated else neg_mae.mean())
+            avg_r2.append(-np.inf if eliminated else r2.mean())
 
         performers = [
             avg_neg_mae.index(max(avg_neg_mae)),
@@ -320,6 +662,8 @@ def train_model(task, X_train, y_train, logger = None):
         ]
 
         overall_best = multimode(performers)
+        trained_models = finalize_winners(task, [models[i] for i in set(performers)], cv_results, trained_models,
+                                          X_train, y_train, refit = refit, n_jobs = n_jobs)
 
         best_models = {"MAE": trained_models[
             str(models[avg_neg_mae.index(max(avg_neg_mae))]
@@ -334,39 +678,56 @@ def train_model(task, X_train, y_train, logger = None):
 
         best_model_showcase = {}
         for metric, model in best_models.items():
-            best_model_showcase[metric] = str(type(model).__name__) if str(type(model).__name__) != 'list' else [str(type(k).__name__) for k in model ]
+            best_model_showcase[metric] = model_name(model) if str(type(model).__name__) != 'list' else [model_name(k) for k in model ]
 
         return best_models, best_model_showcase
 
-def handle_cat_columns(df, cat_columns, handle_html: bool = False):
+def handle_cat_columns(df, cat_columns, handle_html: bool = False, text_batch_size: int = 1000, text_n_process: int = 1,
+                       text_cache: TextCache = None, sparse: bool = False):
     """
     Encodes categorical columns using OneHotEncoding or TF-IDF based on cardinality.
 
+    In sparse mode the encoded columns are not added to the DataFrame. The one-hot and raw TF-IDF
+    outputs (without SVD) are kept as CSR matrices and returned horizontally stacked, row-aligned
+    with the returned DataFrame.
+
     Args:
         df (pd.DataFrame): The input DataFrame.
         cat_columns (list): List of categorical column names.
         handle_html (bool): If there are html tags in the data or not.
+        text_batch_size (int): Batch size used by spaCy for high-cardinality text columns.
+        text_n_process (int): Number of processes used by spaCy for high-cardinality text columns.
+        text_cache (TextCache, optional): Persistent cache of preprocessed texts.
+        sparse (bool): If True, keeps the encoded features as a sparse matrix.
 
     Returns:
         tuple:
             - pd.DataFrame: Updated DataFrame with encoded categorical columns.
             - list: List of tuples (column index, fitted OneHotEncoder).
             - list: List of tuples (column index, fitted TfidfVectorizer).
+            - sp.csr_matrix: Only in sparse mode, the encoded categorical features.
     """
-    ohe = OneHotEncoder(sparse_output = False, handle_unknown = "ignore")
+    encoded_blocks = []
     ohe_lst = []
-    temp_df = df.copy()
+    original_columns = df.columns.tolist()
     new_df = df.copy()
     vectorizer_lst = []
     for k in new_df.columns.tolist():
-        index = temp_df.columns.get_loc(k)
+        index = original_columns.index(k)
         if k in cat_columns:
             num_unique_classes = new_df[k].nunique()
             if num_unique_classes <= 5:  # If the classes in a feature is <= 5, We can use OHE as it won't create dimensionality issue
 
+                ohe = OneHotEncoder(sparse_output = sparse, handle_unknown = "ignore")    # One encoder per column, so each entry of ohe_lst stays usable.
                 transformed_array = ohe.fit_transform(new_df[[k]])
+                if sparse:
+                    encoded_blocks.append(transformed_array.tocsr())
+                    ohe_lst.append((index, ohe))
+                    new_df.drop([k], axis = 1, inplace = True)
+                    continue
+
                 transformed_feature_names = ohe.get_feature_names_out([k])
-                transformed_df = pd.DataFrame(transformed_array, columns = transformed_feature_names)
+                transformed_df = pd.DataFrame(transformed_array, columns = transformed_feature_names, index = new_df.index)
 
                 ohe_lst.append((index, ohe))
 
@@ -376,12 +737,17 @@ def handle_cat_columns(df, cat_columns, handle_html: bool = False):
             else:
                 vectorizer = TfidfVectorizer()
                 print(f"Preprocessing column: {k}")
-                new_df[k] = new_df[k].progress_apply(lambda x: text_preprocessor(x, handle_html = handle_html))
+                new_df[k] = preprocess_texts(new_df[k], handle_html = handle_html, batch_size = text_batch_size,
+                                             n_process = text_n_process, cache = text_cache)
 
                 tfidf_array = vectorizer.fit_transform(new_df[k].astype(str))
 
+                if sparse:
+                    encoded_blocks.append(tfidf_array.tocsr())
+                    vectorizer_lst.append((index, vectorizer, None))
+
                 # Check if there are at least 2 features to apply SVD
-                if tfidf_array.shape[1] >= 2:
+                elif tfidf_array.shape[1] >= 2:
                     max_components = min(300, tfidf_array.shape[1] - 1)  # n_components must be < n_features
                     svd_temp = TruncatedSVD(n_components = max_components)
                     svd_temp.fit(tfidf_array)
@@ -408,9 +774,74 @@ def handle_cat_columns(df, cat_columns, handle_html: bool = False):
 
                 # Drop original column
                 new_df.drop(columns=[k], inplace=True)
+
+    if sparse:
+        encoded = sp.hstack(encoded_blocks, format = "csr") if encoded_blocks else sp.csr_matrix((len(new_df), 0))
+        return new_df, ohe_lst, vectorizer_lst, encoded
     return new_df, ohe_lst, vectorizer_lst
 
-def training_pipeline(df, target_column: str, project_name: str, drop_name: bool = True, drop_id: bool = True):
+def prune_correlated_columns(df, columns: list, threshold: float = 0.99, block_size: int = 512,
+                             sample_rows: int = None, random_state: int = 21) -> list:
+    """
+    Finds the numeric columns that are (almost) linearly dependent on an earlier column.
+
+    Columns are visited in order and a column is dropped if its absolute Pearson correlation with a
+    column kept before it reaches `threshold`, so exactly one column of each correlated group survives.
+    The correlations are never materialized as a full p x p matrix: the standardized float32 data is
+    multiplied block by block, and each block is only compared with the columns kept so far.
+    Constant columns have no defined correlation and are always kept.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        columns (list): Numeric columns to consider, in priority order.
+        threshold (float): Absolute correlation from which a column is considered redundant.
+        block_size (int): Number of columns compared per matrix product. Bounds the extra memory to
+                          `block_size` x (number of kept columns) correlations.
+        sample_rows (int, optional): Estimate the correlations on a random sample of this many rows
+                                     instead of every row, for very wide or long data. The result is
+                                     approximate for correlations close to `threshold`.
+        random_state (int): Seed of the row sample.
+
+    Returns:
+        list: Names of the columns to drop, in the order of `columns`.
+    """
+    if len(columns) < 2:
+        return []
+    data = df[columns]
+    if sample_rows is not None and len(data) > sample_rows:
+        data = data.sample(n = sample_rows, random_state = random_state)
+    z = data.to_numpy(dtype = np.float32, na_value = np.nan, copy = True)
+
+    # Standardizing so that the dot product of two columns is their correlation.
+    z -= np.nanmean(z, axis = 0)
+    np.nan_to_num(z, copy = False)    # Missing values contribute nothing once centered.
+    norms = np.linalg.norm(z, axis = 0)
+    z /= np.where(norms > 0, norms, 1)
+
+    threshold = threshold - 1e-5    # Tolerating float32 rounding, so that 1.0 still catches exact duplicates.
+    kept = []
+    dropped = []
+    for start in range(0, z.shape[1], block_size):
+        block = z[:, start:start + block_size]
+        if kept:
+            redundant = (np.abs(block.T @ z[:, kept]) >= threshold).any(axis = 1)
+        else:
+            redundant = np.zeros(block.shape[1], dtype = bool)
+        within = np.abs(block.T @ block) >= threshold
+        block_kept = []
+        for i in range(block.shape[1]):
+            if redundant[i] or within[i, block_kept].any():
+                dropped.append(columns[start + i])
+            else:
+                block_kept.append(i)
+        kept.extend(start + i for i in block_kept)
+    return dropped
+
+def training_pipeline(df, target_column: str, project_name: str, drop_name: bool = True, drop_id: bool = True,
+                      n_jobs: int = -1, refit: str = "best", selection: str = "full", time_budget: float = None,
+                      halving_tolerance: float = 0.02,
+                      text_n_process: int = 1, cache_text: bool = False, sparse: bool = False,
+                      corr_threshold: float = 0.99, corr_sample_rows: int = None):
     """
        Executes a complete training pipeline: preprocessing, feature engineering,
        imbalance handling, model training, and logging.
@@ -421,6 +852,19 @@ def training_pipeline(df, target_column: str, project_name: str, drop_name: bool
            project_name (str): Name of the project for logging.
            drop_id (bool): If set to true removes the columns with name == ID or id or index.
            drop_name (bool): If set to true removes the columns with name == name or Name.
+           n_jobs (int): Total number of cores used for model training (-1 for all cores).
+           refit (str): Which models get a final fit, see `train_model`.
+           selection (str): 'full' or 'halving' model selection, see `train_model`.
+           time_budget (float, optional): Time budget in seconds for 'halving' selection.
+           halving_tolerance (float): Elimination tolerance of 'halving' selection, see `halving_cross_validate`.
+           text_n_process (int): Number of processes used by spaCy to preprocess text columns.
+           cache_text (bool): If True, preprocessed texts are cached on disk (see `TextCache`) and reused
+                              by later runs.
+           sparse (bool): If True, one-hot and TF-IDF features stay SciPy CSR matrices stacked with the
+                          numeric columns, and only sparse-capable models are trained.
+           corr_threshold (float): Numeric columns whose absolute correlation with an earlier column reaches
+                                   this value are removed, see `prune_correlated_columns`.
+           corr_sample_rows (int, optional): Estimate the correlations on a sample of this many rows.
 
        Returns:
            tuple:
@@ -429,14 +873,19 @@ def training_pipeline(df, target_column: str, project_name: str, drop_name: bool
                - list: Indices of removed highly correlated features.
                - list: One-hot encoders used with their column indices.
                - list: TF-IDF vectorizers used with their column indices.
-               - np.ndarray: Scaled test features.
+               - np.ndarray: Scaled test features (sp.csr_matrix in sparse mode).
                - pd.Series: Test labels.
                - dict: Best model names for each metric.
+               - pd.DataFrame: The preprocessed DataFrame.
+               - dict: Everything `InferencePipeline` needs besides the model and scaler ('removed_columns'
+                       as names, 'encoders', 'feature_columns', 'numeric_columns', 'label_encoder', 'sparse').
        """
-    logger = SwiftPredict(project_name = project_name, project_type = "ML")
+    logger = SwiftPredict(project_name = project_name, project_type = "ML", buffered = True)
     new_df = df.copy()
     target = df[target_column]
     removed_columns = []
+    removed_columns_name = []
+    lbl_encoder = None
     # Handling categorical labels
 
     if target.dtype == "object":
@@ -451,12 +900,14 @@ def training_pipeline(df, target_column: str, project_name: str, drop_name: bool
         columns = [col for col in new_df.columns.tolist() if col.lower() == "name"]
         for k in columns:
             removed_columns.append(new_df.columns.get_loc(k))
+        removed_columns_name.extend(columns)
         new_df.drop(columns, axis = 1, inplace = True)
 
     if drop_id:
         columns = [col for col in new_df.columns if "id" in col.lower() or "index" in col.lower()]
         for k in columns:
             removed_columns.append(new_df.columns.get_loc(k))
+        removed_columns_name.extend(columns)
         new_df.drop(columns, axis = 1, inplace = True)
 
     columns = get_dtype_columns(new_df)
@@ -466,6 +917,7 @@ def training_pipeline(df, target_column: str, project_name: str, drop_name: bool
     # print("Num Columns : ", num_columns)  # For debugging
     ohe_lst = []
     vectorizer_lst = []
+    encoded = None
 
     # Getting the task type
     task = detect_task(new_df, y = target_column)
@@ -473,42 +925,72 @@ def training_pipeline(df, target_column: str, project_name: str, drop_name: bool
     # Handling null values
     new_df = handle_null_values(new_df)
 
-    removed_columns_name = []
     not_removed_cat_columns = [col for col in cat_columns if (col not in removed_columns)]
     # print(f"Not removed cat columns : ", not_removed_cat_columns)
 
     # Handling categorical data
+    pre_cat_columns = new_df.columns.tolist()
     if cat_columns:
-        new_df, ohe_lst, vectorizer_lst = handle_cat_columns(df = new_df, cat_columns = not_removed_cat_columns)
+        text_cache = TextCache() if cache_text else None
+        new_df, ohe_lst, vectorizer_lst, *encoded = handle_cat_columns(df = new_df, cat_columns = not_removed_cat_columns,
+                                                                         text_n_process = text_n_process, text_cache = text_cache,
+                                                                         sparse = sparse)
+        encoded = encoded[0] if encoded else None
+        if text_cache is not None:
+            text_cache.close()
 
     # Removing unnecessary columns
-    corr = new_df[[col for col in num_columns if col != target_column]].corr()
-    direct_corr = [col for col in corr.columns if
-                   corr[col].abs().max() == 1]  # Getting the columns having correlation 1
-    useful_col_len = len(direct_corr) // 2
-    while len(direct_corr) > useful_col_len:
-        removed_columns.append(new_df.columns.get_loc(direct_corr[- 1]))  # Appending the index of the removed columns
-        new_df.drop([direct_corr.pop()], inplace = True, axis = 1)
+    correlated = prune_correlated_columns(new_df, [col for col in num_columns if col != target_column],
+                                          threshold = corr_threshold, sample_rows = corr_sample_rows)
+    if correlated:
+        removed_columns.extend(new_df.columns.get_indexer(correlated).tolist())  # Appending the index of the removed columns
+        removed_columns_name.extend(correlated)
+        new_df.drop(correlated, inplace = True, axis = 1)
 
     # print(f"After removing unnecessary columns : ", new_df.columns.tolist())
     # print(f"Original df : ", df.columns.tolist())
-    new_df = handle_null_values(new_df)   # Ensuring before splitting that no null values are created due to preprocessing.
+    if sparse:
+        # Rows must stay aligned with the encoded matrix, and no nulls are introduced since nothing is concatenated.
+        numeric_columns = new_df.drop([target_column], axis = 1).columns.tolist()
+        X = sp.csr_matrix(new_df[numeric_columns].to_numpy(dtype = float))
+        if encoded is not None:
+            X = sp.hstack([X, encoded], format = "csr")
+        feature_columns = numeric_columns
+    else:
+        new_df = handle_null_values(new_df)   # Ensuring before splitting that no null values are created due to preprocessing.
+        X = new_df.drop([target_column], axis = 1)
+        feature_columns = X.columns.tolist()
+        numeric_columns = [col for col in feature_columns if col in num_columns]
 
     # Splitting the data
-    X = new_df.drop([target_column], axis = 1)
     y = new_df[target_column]
     X_train, X_test, y_train, y_test = train_test_split(X, y, stratify = y if task == "classification" else None, random_state = 21)
 
     # Scaling numerical data
-    std_scaler = StandardScaler()
+    std_scaler = StandardScaler(with_mean = not sparse)    # Centering would densify a sparse matrix.
     X_scaled = std_scaler.fit_transform(X_train)
     X_test = std_scaler.transform(X_test)
 
+    X_train = X_scaled
     if task == "classification":
         X_train, y_train = handle_imbalance(new_df, target_column = target_column, X_train = X_scaled, y_train = y_train)
 
-    best_models, best_model_showcase = train_model(task = task, X_train = X_train, y_train = y_train, logger = logger)
-
-    return best_models, std_scaler, removed_columns, ohe_lst, vectorizer_lst, X_test, y_test, best_model_showcase, new_df
+    best_models, best_model_showcase = train_model(task = task, X_train = X_train, y_train = y_train, logger = logger, n_jobs = n_jobs, refit = refit,
+                                                   selection = selection, time_budget = time_budget, halving_tolerance = halving_tolerance)
+    logger.close()    # Flushes and releases the logger's reference on the shared MongoDB client.
+
+    encoders = sorted([(index, pre_cat_columns[index], "ohe", ohe, None) for index, ohe in ohe_lst] +
+                      [(index, pre_cat_columns[index], "tfidf", vectorizer, svd) for index, vectorizer, svd in vectorizer_lst],
+                      key = lambda encoder: encoder[0])    # Columns are encoded in their DataFrame order.
+    pipeline_spec = {
+        "removed_columns": removed_columns_name,
+        "encoders": [encoder[1:] for encoder in encoders],
+        "feature_columns": feature_columns,
+        "numeric_columns": numeric_columns,
+        "label_encoder": lbl_encoder,
+        "sparse": sparse,
+    }
+
+    return best_models, std_scaler, removed_columns, ohe_lst, vectorizer_lst, X_test, y_test, best_model_showcase, new_df, pipeline_spec
 
 
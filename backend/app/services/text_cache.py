@@ -0,0 +1,90 @@
+# Importing dependencies
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from ..core.config import default_cache_dir
+
+
+class TextCache:
+    """
+    A persistent SQLite cache of preprocessed texts, keyed by a hash of the raw text plus a
+    namespace describing how it was processed (spaCy model, version and preprocessing flags).
+
+    The cache is size-bounded: once it holds more than `max_entries` rows, the least recently
+    used entries are evicted.
+
+    Attributes:
+        path (Path): Location of the SQLite database file.
+        max_entries (int): Maximum number of cached texts.
+    """
+
+    _BATCH = 500    # Stays below SQLite's limit on bound variables per statement.
+
+    def __init__(self, path: str = None, max_entries: int = 1_000_000):
+        """
+        Opens (or creates) the cache database.
+
+        Args:
+            path (str, optional): Path of the database file. Defaults to 'text_cache.sqlite'
+                                  inside `default_cache_dir()`.
+            max_entries (int, optional): Maximum number of cached texts. Defaults to 1,000,000.
+        """
+        self.path = Path(path) if path else default_cache_dir() / "text_cache.sqlite"
+        self.path.parent.mkdir(parents = True, exist_ok = True)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS texts (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS texts_last_used ON texts (last_used)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(text: str, namespace: str) -> str:
+        """
+        Hashes a raw text together with its processing namespace.
+        """
+        return hashlib.blake2b(f"{namespace}\0{text}".encode("utf-8"), digest_size = 16).hexdigest()
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Looks up several keys at once and marks the hits as recently used.
+
+        Args:
+            keys (list): Keys created with `make_key`.
+
+        Returns:
+            dict: Key -> cached value, for the keys that were found.
+        """
+        found = {}
+        for i in range(0, len(keys), self._BATCH):
+            chunk = keys[i:i + self._BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self.conn.execute(f"SELECT key, value FROM texts WHERE key IN ({placeholders})", chunk).fetchall())
+        if found:
+            now = time.time()
+            self.conn.executemany("UPDATE texts SET last_used = ? WHERE key = ?", [(now, key) for key in found])
+            self.conn.commit()
+        return found
+
+    def set_many(self, items: dict):
+        """
+        Stores several key/value pairs and evicts the least recently used entries if the cache is full.
+
+        Args:
+            items (dict): Key -> preprocessed text.
+        """
+        now = time.time()
+        self.conn.executemany("INSERT OR REPLACE INTO texts (key, value, last_used) VALUES (?, ?, ?)",
+                              [(key, value, now) for key, value in items.items()])
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM texts").fetchone()
+        if count > self.max_entries:
+            self.conn.execute("DELETE FROM texts WHERE key IN (SELECT key FROM texts ORDER BY last_used LIMIT ?)",
+                              (count - self.max_entries,))
+        self.conn.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.conn.close()
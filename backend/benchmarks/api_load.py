@@ -0,0 +1,115 @@
+# Run from the repository root: python -m backend.benchmarks.api_load [--backends sqlite] [--concurrency 1 16 64]
+# Importing dependencies
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+import httpx
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.storage import create_store, AsyncStoreAdapter, STORAGE_BACKENDS
+
+PROJECT_NAME = "api_load_benchmark"
+# One read of a run, one leaderboard aggregation and one mutation, cycled over the seeded runs.
+REQUESTS = [
+    ("GET", "/{project_name}/runs/{run_id}"),
+    ("GET", "/{project_name}/leaderboard?metric=accuracy"),
+    ("POST", "/{project_name}/runs/{run_id}/add_notes?notes=benchmark"),
+]
+
+
+def api_stores(backend: str) -> dict:
+    """
+    Returns the API data layers compared for a backend, as factories of async stores.
+
+    'pymongo-threads' runs the blocking driver in worker threads, which is how the API served
+    requests before it moved to Motor (one threadpool worker held per in-flight request).
+    """
+    if backend == "mongo":
+        from backend.app.core.mongo_store import AsyncMongoStore, MongoStore
+        return {"motor": AsyncMongoStore, "pymongo-threads": lambda: AsyncStoreAdapter(MongoStore())}
+    return {"sqlite-threads": lambda: AsyncStoreAdapter(create_store(backend))}
+
+
+def seed_runs(store, runs: int, steps: int) -> list:
+    """
+    Logs `runs` finished runs with a few params and an accuracy curve, and returns their run ids.
+    """
+    run_ids = []
+    for i in range(runs):
+        logger = SwiftPredict(project_name = PROJECT_NAME, project_type = "DL", store = store, buffered = True)
+        logger.log_params({"learning_rate": 0.01 * (i + 1), "batch_size": 32}, model_name = "model")
+        for step in range(steps):
+            logger.log_or_update_metric("accuracy", (i + 1) * step / (runs * steps), model_name = "model", step = step)
+        logger.finalize_run("completed")
+        run_ids.append(logger.run_id)
+    return run_ids
+
+
+async def run_load(app, run_ids: list, concurrency: int, requests: int) -> tuple:
+    """
+    Sends `requests` requests from `concurrency` concurrent clients through the ASGI app.
+
+    Returns:
+        tuple: (requests per second, p50 latency in ms, p99 latency in ms)
+    """
+    latencies = []
+    pending = iter(range(requests))
+    async with httpx.AsyncClient(transport = httpx.ASGITransport(app = app), base_url = "http://benchmark") as client:
+
+        async def client_loop():
+            for i in pending:    # Shared by the clients, so every request is sent once.
+                method, path = REQUESTS[i % len(REQUESTS)]
+                url = path.format(project_name = PROJECT_NAME, run_id = run_ids[i % len(run_ids)])
+                start = time.perf_counter()
+                response = await client.request(method, url)
+                latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n = 100)
+    return requests / elapsed, percentiles[49], percentiles[98]
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Measures tracking API throughput and tail latency under concurrent clients.")
+    parser.add_argument("--backends", nargs = "+", default = list(STORAGE_BACKENDS), choices = STORAGE_BACKENDS)
+    parser.add_argument("--concurrency", nargs = "+", type = int, default = [1, 16, 64])
+    parser.add_argument("--requests", type = int, default = 2000)
+    parser.add_argument("--runs", type = int, default = 20)
+    parser.add_argument("--steps", type = int, default = 100)
+    args = parser.parse_args()
+
+    # Not touching the user's tracking database unless asked to.
+    os.environ.setdefault("SWIFTPREDICT_SQLITE_PATH", str(Path(tempfile.mkdtemp()) / "tracking.sqlite"))
+    from backend.app.api import logger_apis
+
+    print(f"{'backend':<10}{'data layer':<18}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for backend in args.backends:
+        store = create_store(backend)
+        try:
+            run_ids = seed_runs(store, args.runs, args.steps)
+            for name, factory in api_stores(backend).items():
+                logger_apis.store = factory()    # The handlers look the module-level store up on every call.
+                asyncio.run(logger_apis.store.ensure_indexes())
+                for concurrency in args.concurrency:
+                    rate, p50, p99 = asyncio.run(run_load(logger_apis.app, run_ids, concurrency, args.requests))
+                    print(f"{backend:<10}{name:<18}{concurrency:>8}{rate:>10,.0f}{p50:>10.1f}{p99:>10.1f}")
+                logger_apis.store.close()
+        except Exception as e:    # E.g. no MongoDB server running.
+            print(f"{backend:<10}skipped: {e}")
+        finally:
+            try:
+                store.delete_runs(PROJECT_NAME)
+            except Exception:
+                pass
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
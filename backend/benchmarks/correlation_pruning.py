@@ -0,0 +1,74 @@
+# Run from the repository root: python -m backend.benchmarks.correlation_pruning [--columns 100 1000 5000] [--rows 5000]
+# Importing dependencies
+import time
+import argparse
+import tracemalloc
+import numpy as np
+import pandas as pd
+from backend.app.services.preprocessing import prune_correlated_columns
+
+
+def make_frame(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a wide frame whose second half are noisy copies of columns of the first half.
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size = (rows, columns - columns // 2)).astype(np.float32)
+    copies = base[:, rng.integers(0, base.shape[1], columns // 2)] + rng.normal(0, 0.01, (rows, columns // 2)).astype(np.float32)
+    return pd.DataFrame(np.hstack([base, copies]), columns = [f"col_{i}" for i in range(columns)])
+
+
+def full_matrix_prune(df: pd.DataFrame, columns: list, threshold: float) -> list:
+    """
+    The pruning rule on the full `df.corr()` matrix, as done before the blocked float32 version.
+    """
+    corr = df[columns].corr().abs().to_numpy()
+    kept, dropped = [], []
+    for i, col in enumerate(columns):
+        if kept and (corr[i, kept] >= threshold).any():
+            dropped.append(col)
+        else:
+            kept.append(i)
+    return dropped
+
+
+def measure(function, *args, **kwargs) -> tuple:
+    """
+    Runs a function once.
+
+    Returns:
+        tuple: (result, seconds, peak traced memory in MB)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Compares blocked float32 correlation pruning with df.corr() across column counts.")
+    parser.add_argument("--columns", nargs = "+", type = int, default = [100, 500, 1000, 2000])
+    parser.add_argument("--rows", type = int, default = 5_000)
+    parser.add_argument("--threshold", type = float, default = 0.99)
+    parser.add_argument("--block-size", type = int, default = 512)
+    parser.add_argument("--sample-rows", type = int, default = None)
+    parser.add_argument("--full-max-columns", type = int, default = 1000, help = "Skip df.corr() above this many columns.")
+    args = parser.parse_args()
+
+    print(f"{'columns':>8}{'method':>10}{'seconds':>10}{'peak MB':>10}{'dropped':>10}")
+    for columns in args.columns:
+        df = make_frame(args.rows, columns)
+        names = list(df.columns)
+        dropped, seconds, peak = measure(prune_correlated_columns, df, names, threshold = args.threshold,
+                                         block_size = args.block_size, sample_rows = args.sample_rows)
+        print(f"{columns:>8}{'blocked':>10}{seconds:>10.2f}{peak:>10.1f}{len(dropped):>10}")
+        if columns <= args.full_max_columns:
+            reference, seconds, peak = measure(full_matrix_prune, df, names, args.threshold)
+            print(f"{columns:>8}{'df.corr':>10}{seconds:>10.2f}{peak:>10.1f}{len(reference):>10}")
+
+
+if __name__ == "__main__":
+    main()
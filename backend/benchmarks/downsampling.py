@@ -0,0 +1,47 @@
+# Run from the repository root: python -m backend.benchmarks.downsampling [--steps 10000000] [--max-points 500 2000]
+# Importing dependencies
+import json
+import time
+import argparse
+import numpy as np
+from backend.app.core.downsampling import DOWNSAMPLING_METHODS, downsample
+
+
+def make_series(steps: int, seed: int = 0) -> tuple:
+    """
+    Builds a loss-like curve (decay plus noise and a few spikes) of `steps` points.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.arange(steps, dtype = float)
+    y = np.exp(-x / (steps / 5)) + rng.normal(0, 0.02, steps)
+    y[rng.integers(0, steps, 10)] += 1.0
+    return x, y
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Measures the server-side downsampling of a long metric series.")
+    parser.add_argument("--steps", type = int, default = 10_000_000)
+    parser.add_argument("--max-points", nargs = "+", type = int, default = [500, 2_000, 10_000])
+    parser.add_argument("--repeat", type = int, default = 3)
+    args = parser.parse_args()
+
+    x, y = make_series(args.steps)
+    # What fetch_metric would send without max_points, for comparison.
+    start = time.perf_counter()
+    full_bytes = len(json.dumps({"step": x.tolist(), "value": y.tolist()}))
+    print(f"{args.steps:,} steps: full series {full_bytes / 1e6:,.0f} MB of JSON, encoded in {time.perf_counter() - start:.1f} s")
+
+    print(f"{'method':<10}{'max_points':>12}{'points':>10}{'best ms':>10}{'JSON KB':>10}")
+    for method in DOWNSAMPLING_METHODS:
+        for max_points in args.max_points:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                steps, values = downsample(x, y, max_points, method)
+                timings.append((time.perf_counter() - start) * 1000)
+            size = len(json.dumps({"step": steps.tolist(), "value": values.tolist()}))
+            print(f"{method:<10}{max_points:>12,}{len(steps):>10,}{min(timings):>10.1f}{size / 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Run from the repository root: python -m backend.benchmarks.log_throughput [--backends sqlite] [--steps 500]
+# Importing dependencies
+import os
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.storage import create_store, STORAGE_BACKENDS
+
+MODES = {
+    "direct": {},
+    "buffered": {"buffered": True},
+    "background": {"background": True},
+}
+PROJECT_NAME = "log_throughput_benchmark"
+
+
+def log_workload(store, mode: str, steps: int, models: int, metrics: int) -> float:
+    """
+    Logs the same DL-style workload through one `SwiftPredict` run and times it.
+
+    Every model logs a few params, then `metrics` metric points per step for `steps` steps.
+    The time includes the final flush, so buffered and background modes are measured until
+    every event is in the database.
+
+    Args:
+        store (TrackingStore): Store shared by the runs of one backend.
+        mode (str): 'direct', 'buffered' or 'background'.
+        steps (int): Logged steps per model.
+        models (int): Number of models.
+        metrics (int): Metrics logged per step.
+
+    Returns:
+        float: Logged events per second.
+    """
+    logger = SwiftPredict(project_name = PROJECT_NAME, project_type = "DL", store = store, **MODES[mode])
+    events = 0
+    start = time.perf_counter()
+    for model in range(models):
+        model_name = f"model_{model}"
+        logger.log_params({"learning_rate": 0.01, "batch_size": 32, "optimizer": "adam"}, model_name = model_name)
+        events += 3
+        for step in range(steps):
+            for metric in range(metrics):
+                logger.log_or_update_metric(f"metric_{metric}", 1.0 / (step + 1), model_name = model_name, step = step)
+                events += 1
+    logger.close()
+    return events / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Measures SwiftPredict logging throughput per storage backend and mode.")
+    parser.add_argument("--backends", nargs = "+", default = list(STORAGE_BACKENDS), choices = STORAGE_BACKENDS)
+    parser.add_argument("--modes", nargs = "+", default = list(MODES), choices = list(MODES))
+    parser.add_argument("--steps", type = int, default = 500)
+    parser.add_argument("--models", type = int, default = 2)
+    parser.add_argument("--metrics", type = int, default = 4)
+    args = parser.parse_args()
+
+    # Not touching the user's tracking database unless asked to.
+    os.environ.setdefault("SWIFTPREDICT_SQLITE_PATH", str(Path(tempfile.mkdtemp()) / "tracking.sqlite"))
+
+    print(f"{'backend':<10}{'mode':<12}{'events/s':>12}")
+    for backend in args.backends:
+        store = create_store(backend)
+        try:
+            for mode in args.modes:
+                rate = log_workload(store, mode, args.steps, args.models, args.metrics)
+                print(f"{backend:<10}{mode:<12}{rate:>12,.0f}")
+        except Exception as e:    # E.g. no MongoDB server running.
+            print(f"{backend:<10}skipped: {e}")
+        finally:
+            try:
+                store.delete_runs(PROJECT_NAME)
+            except Exception:
+                pass
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
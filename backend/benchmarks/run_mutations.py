@@ -0,0 +1,109 @@
+# Run from the repository root: python -m backend.benchmarks.run_mutations [--runs 200] [--mutations 2000]
+# Importing dependencies
+import time
+import secrets
+import argparse
+from pymongo import MongoClient, ReturnDocument, monitoring
+from pymongo.errors import PyMongoError
+from backend.app.core.config import MONGO_URI, ensure_indexes
+from backend.app.core.mongo_store import run_update
+
+# The mutations the API handlers perform, as (push, set_fields) of `TrackingStore.update_run`.
+MUTATIONS = {
+    "update_status": (None, {"status": "completed"}),
+    "add_notes": (None, {"notes": "benchmark"}),
+    "add_tags": ({"tags": ["benchmark"]}, None),
+    "log_param": ({"params": [{"key": "learning_rate", "value": 0.01}]}, None),
+}
+
+
+class CommandCounter(monitoring.CommandListener):
+    """
+    Counts the commands sent to the server, i.e. the round trips.
+    """
+
+    def __init__(self):
+        self.commands = 0
+
+    def started(self, event):
+        self.commands += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def read_update_read(collection, query: dict, update: dict):
+    """
+    The handlers' former pattern: check the run exists, update it, then read it back.
+    """
+    if collection.find_one(query, {"_id": 1}) is None:
+        return None
+    collection.update_one(query, update)
+    return collection.find_one(query, {"_id": 0})
+
+
+def find_and_update(collection, query: dict, update: dict):
+    """
+    The current pattern (`MongoStore.update_run`): one atomic find_one_and_update returning the updated run.
+    """
+    return collection.find_one_and_update(query, update, projection = {"_id": 0}, return_document = ReturnDocument.AFTER)
+
+
+PATTERNS = {"read-update-read": read_update_read, "find_one_and_update": find_and_update}
+
+
+def time_mutations(collection, counter: CommandCounter, pattern, run_ids: list, mutation: str, mutations: int) -> tuple:
+    """
+    Applies one kind of mutation `mutations` times, cycling over the runs.
+
+    Returns:
+        tuple: (mutations per second, round trips per mutation)
+    """
+    push, set_fields = MUTATIONS[mutation]
+    commands = counter.commands
+    start = time.perf_counter()
+    for i in range(mutations):
+        query, update = run_update(run_ids[i % len(run_ids)], "benchmark", None, push, set_fields)
+        if pattern(collection, query, update) is None:
+            raise RuntimeError("A seeded run wasn't found")
+    elapsed = time.perf_counter() - start
+    return mutations / elapsed, (counter.commands - commands) / mutations
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Compares the round trips and throughput of the run mutation patterns on MongoDB.")
+    parser.add_argument("--uri", default = MONGO_URI)
+    parser.add_argument("--runs", type = int, default = 200)
+    parser.add_argument("--mutations", type = int, default = 2000)
+    args = parser.parse_args()
+
+    counter = CommandCounter()
+    client = MongoClient(args.uri, serverSelectionTimeoutMS = 5000, event_listeners = [counter])
+    db = client[f"SwiftPredictBenchmark_{secrets.token_hex(4)}"]    # Scratch database, dropped afterwards.
+    try:
+        collection = db["Run"]
+        ensure_indexes(collection)
+        run_ids = [f"run_{i}" for i in range(args.runs)]
+        collection.insert_many([{"run_id": run_id, "project_name": "benchmark", "project_type": "ML", "status": "running"}
+                                for run_id in run_ids])
+
+        print(f"{'mutation':<16}{'pattern':<22}{'ops/s':>10}{'round trips':>14}")
+        for mutation in MUTATIONS:
+            for name, pattern in PATTERNS.items():
+                rate, round_trips = time_mutations(collection, counter, pattern, run_ids, mutation, args.mutations)
+                print(f"{mutation:<16}{name:<22}{rate:>10,.0f}{round_trips:>14.1f}")
+    except PyMongoError as e:    # E.g. no MongoDB server running.
+        print(f"skipped: {e}")
+    finally:
+        try:
+            client.drop_database(db.name)
+        except PyMongoError:
+            pass
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
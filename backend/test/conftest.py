@@ -0,0 +1,20 @@
+# Importing dependencies
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from backend.app.core.config import MONGO_URI
+
+
+@pytest.fixture
+def mongo_uri() -> str:
+    """
+    Returns MONGO_URI, skipping the test when no MongoDB server answers there within a second.
+    """
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS = 1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError as e:
+        pytest.skip(f"No MongoDB server reachable at {MONGO_URI}: {e}")
+    finally:
+        client.close()
+    return MONGO_URI
@@ -0,0 +1,62 @@
+# Importing dependencies
+import json
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from backend.app.api import logger_apis
+from backend.app.api.logger_apis import app, json_safe
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.sqlite_store import SQLiteStore
+from backend.app.core.storage import AsyncStoreAdapter
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = SQLiteStore(tmp_path / "tracking.sqlite")
+    monkeypatch.setattr(logger_apis, "store", AsyncStoreAdapter(store))
+    yield store
+    store.close()
+
+
+def log_nan_run(store) -> str:
+    logger = SwiftPredict(project_name = "nan", project_type = "DL", buffered = True, store = store)
+    for step, value in enumerate([0.5, float("nan"), 0.75]):
+        logger.log_or_update_metric("loss", value, "model", step = step)
+    logger.finalize_run("completed")
+    return logger.run_id
+
+
+def test_json_safe_replaces_non_finite_floats():
+    assert json_safe({"a": [1.0, float("nan")], "b": (float("inf"), "x")}) == {"a": [1.0, None], "b": [None, "x"]}
+    assert json_safe(np.array([1.0, np.nan, -np.inf])) == [1.0, None, None]
+    assert json_safe(np.array([1, 2])) == [1, 2]
+
+
+def test_nan_metric_values_are_returned_as_null(store):
+    run_id = log_nan_run(store)
+    client = TestClient(app)
+
+    response = client.get(f"/nan/runs/{run_id}/metrics/loss")
+    assert response.status_code == 200
+    assert response.json()["value"] == [0.5, None, 0.75]
+
+    response = client.get("/projects/completed", params = {"fields": "run_id,metrics"})
+    assert response.status_code == 200
+    (run,) = response.json()["data"]
+    assert run["metrics"]["details"]["value"] == [0.5, None, 0.75]
+
+    response = client.get("/projects/completed", params = {"fields": "metrics", "stream": True})
+    (line,) = response.text.splitlines()
+    assert json.loads(line)["metrics"]["details"]["value"] == [0.5, None, 0.75]
+
+
+def test_leaderboard_with_nan_values_returns_null(store):
+    log_nan_run(store)
+    logger = SwiftPredict(project_name = "nan", project_type = "DL", buffered = True, store = store)
+    logger.log_or_update_metric("loss", float("nan"), "diverged", step = 0)
+    logger.close()
+
+    response = TestClient(app).get("/nan/leaderboard", params = {"metric": "loss", "goal": "min"})
+    assert response.status_code == 200
+    rows = response.json()["rows"]
+    assert [(row["model_name"], row["best"], row["last"]) for row in rows] == [("model", 0.5, 0.75), ("diverged", None, None)]
@@ -0,0 +1,55 @@
+# Importing dependencies
+import numpy as np
+import pandas as pd
+import pytest
+from backend.app.services.preprocessing import prune_correlated_columns
+
+
+def correlated_frame(rows: int = 2_000, seed: int = 0) -> pd.DataFrame:
+    # Independent base columns plus derived ones whose correlation with their base is far from 0.99.
+    rng = np.random.default_rng(seed)
+    data = {f"base_{i}": rng.normal(size = rows) for i in range(8)}
+    for i in range(8):
+        base = data[f"base_{i}"]
+        data[f"copy_{i}"] = base.copy()    # 1.0
+        data[f"affine_{i}"] = -3 * base + 7    # -1.0
+        data[f"close_{i}"] = base + rng.normal(0, 0.05, rows)    # ~0.999
+        data[f"loose_{i}"] = base + rng.normal(0, 0.5, rows)    # ~0.89
+    data["constant"] = np.ones(rows)
+    columns = list(data)
+    order = np.random.default_rng(seed + 1).permutation(len(columns))    # Derived columns may come before their base.
+    return pd.DataFrame({columns[i]: data[columns[i]] for i in order})
+
+
+def reference_prune(df: pd.DataFrame, columns: list, threshold: float) -> list:
+    # The same greedy rule on the full float64 correlation matrix.
+    corr = df[columns].corr().abs().to_numpy()
+    kept, dropped = [], []
+    for i, col in enumerate(columns):
+        if any(corr[i, j] >= threshold for j in kept):
+            dropped.append(col)
+        else:
+            kept.append(i)
+    return dropped
+
+
+def test_exact_duplicate_is_dropped():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(size = 500), "b": rng.normal(size = 500)})
+    df["a_again"] = df["a"]
+    assert prune_correlated_columns(df, ["a", "b", "a_again"], threshold = 1.0) == ["a_again"]
+
+
+def test_uncorrelated_columns_are_kept():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size = (1_000, 20)), columns = [f"x{i}" for i in range(20)])
+    df["constant"] = 1.0
+    assert prune_correlated_columns(df, list(df.columns), threshold = 0.5) == []
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 512])
+@pytest.mark.parametrize("threshold", [0.99, 0.8, 1.0])
+def test_blocked_pruning_matches_the_full_correlation_matrix(block_size, threshold):
+    df = correlated_frame()
+    columns = list(df.columns)
+    assert prune_correlated_columns(df, columns, threshold = threshold, block_size = block_size) == reference_prune(df, columns, threshold - 1e-9)    # float64 rounding of exact duplicates.
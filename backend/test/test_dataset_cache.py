@@ -0,0 +1,53 @@
+# Importing dependencies
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+from backend.app.services import dataset_cache
+from backend.app.services.dataset_cache import file_fingerprint, read_csv_cached, read_columnar, write_columnar
+
+
+def test_object_columns_round_trip_without_pickle(tmp_path, monkeypatch):
+    df = pd.DataFrame({"x": [1.5, 2.5, np.nan], "city": ["Paris", None, "Oslo"], "flag": [True, False, True]})
+    write_columnar(df, tmp_path / "data")
+
+    load = np.load
+    monkeypatch.setattr(dataset_cache.np, "load", lambda *args, **kwargs: load(*args, **{**kwargs, "allow_pickle": False}))
+    loaded = read_columnar(tmp_path / "data")
+    pd.testing.assert_frame_equal(loaded.copy(), df)
+
+
+def test_cache_hit_hashes_only_the_ends_of_the_file(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"x": np.arange(500_000), "label": np.arange(500_000) % 3}).to_csv(path, index = False)
+    first = read_csv_cached(str(path))
+
+    hashed = []
+    blake2b = hashlib.blake2b
+
+    class RecordingHash:
+        def __init__(self, data = b"", **kwargs):
+            self.digest = blake2b(data, **kwargs)
+
+        def update(self, data):
+            hashed.append(len(data))
+            self.digest.update(data)
+
+        def hexdigest(self):
+            return self.digest.hexdigest()
+
+    monkeypatch.setattr(dataset_cache.hashlib, "blake2b", RecordingHash)
+    monkeypatch.setattr(dataset_cache.pd, "read_csv", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("cache missed")))
+    second = read_csv_cached(str(path))
+    pd.testing.assert_frame_equal(second.copy(), first)
+    assert sum(hashed) <= 2 * 1024 ** 2 < os.path.getsize(path)
+
+
+def test_fingerprint_changes_with_the_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("x\n1\n")
+    before = file_fingerprint(str(path))
+    stat = os.stat(path)
+    path.write_text("x\n2\n")    # Same size, restored modification time.
+    os.utime(path, ns = (stat.st_atime_ns, stat.st_mtime_ns))
+    assert file_fingerprint(str(path)) != before
@@ -0,0 +1,39 @@
+# Importing dependencies
+import numpy as np
+import pytest
+from backend.app.core.downsampling import downsample, lttb_indices, minmax_indices
+
+
+def noisy_series(n: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    steps = np.arange(n, dtype = float)
+    return steps, np.sin(steps / 50) + rng.normal(0, 0.1, n)
+
+
+@pytest.mark.parametrize("n, max_points", [(10, 3), (1_000, 50), (10_001, 500), (100_000, 2_000)])
+def test_lttb_keeps_the_endpoints_and_returns_max_points(n, max_points):
+    steps, values = noisy_series(n)
+    indices = lttb_indices(steps, values, max_points)
+    assert len(indices) == max_points
+    assert indices[0] == 0 and indices[-1] == n - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize("n, max_points", [(10, 5), (1_000, 50), (10_001, 501), (100_000, 2_000)])
+def test_minmax_keeps_the_endpoints_and_the_extremes(n, max_points):
+    steps, values = noisy_series(n)
+    values[n // 3] = 100.0    # A one-step spike, which minmax must keep.
+    indices = minmax_indices(values, max_points)
+    assert max_points - 3 <= len(indices) <= max_points
+    assert indices[0] == 0 and indices[-1] == n - 1
+    assert n // 3 in indices and int(values.argmin()) in indices
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample_returns_the_kept_points(method):
+    steps, values = noisy_series(5_000)
+    sampled_steps, sampled_values = downsample(steps, values, 200, method)
+    assert len(sampled_steps) <= 200
+    assert (sampled_steps[0], sampled_steps[-1]) == (steps[0], steps[-1])
+    assert np.array_equal(sampled_values, values[sampled_steps.astype(int)])
+    assert downsample(steps[:100], values[:100], 200, method)[0].tolist() == steps[:100].tolist()
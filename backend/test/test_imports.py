@@ -0,0 +1,26 @@
+# Importing dependencies
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+HEAVY_MODULES = ["pandas", "numpy", "sklearn", "spacy", "xgboost", "lightgbm", "catboost", "matplotlib"]
+IMPORT_BUDGET_SECONDS = 0.5    # Generous for slow CI machines; importing the ML stack takes several seconds.
+
+IMPORT_SCRIPT = f"""
+import sys, json, time
+start = time.perf_counter()
+import swiftpredict
+swiftpredict.SwiftPredict
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [name for name in {HEAVY_MODULES!r} if name in sys.modules]}}))
+"""
+
+
+def test_importing_the_logger_stays_lightweight():
+    # A fresh interpreter, since this test process may already have imported the heavy libraries.
+    result = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], cwd = ROOT, capture_output = True, text = True, check = True)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report["loaded"] == []
+    assert report["elapsed"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,40 @@
+# Importing dependencies
+import numpy as np
+import pandas as pd
+from backend.app.services import ingestion
+from backend.app.services.ingestion import stream_csv, MAX_CLASSES, MIN_PER_CLASS, RESERVOIR_HEADROOM
+
+
+def write_sorted_csv(path, class_sizes: dict):
+    # Rows sorted by class, the worst case for a streaming sample.
+    labels = np.concatenate([np.full(size, label) for label, size in class_sizes.items()])
+    pd.DataFrame({"x": np.arange(len(labels)), "label": labels}).to_csv(path, index = False)
+
+
+def test_stratified_reservoir_stays_bounded(tmp_path, monkeypatch):
+    class_sizes = {label: 2_500 * (label + 1) for label in range(MAX_CLASSES - 1)}
+    class_sizes[MAX_CLASSES - 1] = 3    # A rare class, kept whole.
+    path = tmp_path / "data.csv"
+    write_sorted_csv(path, class_sizes)
+
+    held = []
+    concat = pd.concat
+
+    def recording_concat(frames, *args, **kwargs):
+        if "_sample_key" in frames[0].columns:
+            held.append(len(frames[0]))    # Rows kept from the previous chunks.
+        return concat(frames, *args, **kwargs)
+
+    monkeypatch.setattr(ingestion.pd, "concat", recording_concat)
+    sample_size = 2_000
+    sample, profile = stream_csv(str(path), "label", sample_size = sample_size, chunksize = 5_000)
+
+    assert max(held) <= sample_size * (1 + RESERVOIR_HEADROOM) + MAX_CLASSES * MIN_PER_CLASS
+    assert profile["rows"] == sum(class_sizes.values())
+    assert abs(len(sample) - sample_size) <= MAX_CLASSES * MIN_PER_CLASS
+
+    counts = sample["label"].value_counts()
+    assert counts[MAX_CLASSES - 1] == 3
+    for label, size in class_sizes.items():
+        expected = sample_size * size / profile["rows"]
+        assert abs(counts[label] - expected) <= max(MIN_PER_CLASS, 0.2 * expected)
@@ -0,0 +1,57 @@
+# Importing dependencies
+import math
+import secrets
+import pytest
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.sqlite_store import SQLiteStore
+
+# Per model: the values logged at steps 0, 1, ...
+SERIES = {
+    "steady": [0.5, float("nan"), 0.75],
+    "diverged": [float("nan"), float("nan")],
+    "late_nan": [0.9, float("nan")],
+}
+
+
+@pytest.fixture(params = ["sqlite", "mongo"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        store = SQLiteStore(tmp_path / "tracking.sqlite")
+    else:
+        from backend.app.core.mongo_store import MongoStore
+        store = MongoStore(request.getfixturevalue("mongo_uri"))
+    project_name = f"leaderboard_{secrets.token_hex(4)}"
+    for model_name, values in SERIES.items():
+        logger = SwiftPredict(project_name = project_name, project_type = "DL", buffered = True, store = store)
+        for step, value in enumerate(values):
+            logger.log_or_update_metric("loss", value, model_name, step = step)
+        logger.close()
+    yield store, project_name
+    store.delete_runs(project_name)
+    store.close()
+
+
+def summarize(rows: list) -> list:
+    # NaN as None, so rows compare with ==.
+    return [(row["model_name"], *(None if isinstance(value, float) and math.isnan(value) else value
+                                  for value in (row["best"], row["best_step"], row["last"], row["last_step"])), row["points"])
+            for row in rows]
+
+
+def test_nan_never_wins_best(store):
+    store, project_name = store
+    assert summarize(store.leaderboard(project_name, "loss", goal = "min")) == [
+        ("steady", 0.5, 0, 0.75, 2, 3),
+        ("late_nan", 0.9, 0, None, 1, 2),
+        ("diverged", None, None, None, 1, 2),
+    ]
+    assert [row[0] for row in summarize(store.leaderboard(project_name, "loss", goal = "max"))] == ["late_nan", "steady", "diverged"]
+    assert [row[0] for row in summarize(store.leaderboard(project_name, "loss", goal = "min", top_k = 1))] == ["steady"]
+
+
+@pytest.mark.parametrize("goal", ["min", "max"])
+def test_nan_last_values_rank_last(store, goal):
+    store, project_name = store
+    rows = summarize(store.leaderboard(project_name, "loss", goal = goal, by = "last"))
+    assert rows[0][0] == "steady"
+    assert {row[0] for row in rows[1:]} == {"late_nan", "diverged"}
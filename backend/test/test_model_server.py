@@ -0,0 +1,72 @@
+# Importing dependencies
+import os
+import asyncio
+import numpy as np
+import pytest
+from backend.app.services import model_server
+from backend.app.services.model_server import ModelCache, ModelServer
+
+
+class ConstantPipeline:
+    def __init__(self, value):
+        self.value = value
+
+    def predict(self, df):
+        return np.full(len(df), self.value)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    loaded = []
+
+    def load(path):
+        loaded.append(path)
+        return ConstantPipeline(len(loaded))
+
+    monkeypatch.setattr(model_server.InferencePipeline, "load", staticmethod(load))
+    return loaded
+
+
+def test_predict_checks_the_model_file_once_per_interval(tmp_path, monkeypatch, loads):
+    (tmp_path / "model.pkl").write_bytes(b"pipeline")
+    server = ModelServer(str(tmp_path), check_interval = 60)
+    checks = []
+    path = ModelCache.path
+    monkeypatch.setattr(ModelCache, "path", lambda self, name: checks.append(name) or path(self, name))
+
+    async def predict_many():
+        return [await server.predict("model", [{"x": i}]) for i in range(20)]
+
+    assert asyncio.run(predict_many()) == [[1]] * 20
+    assert len(checks) == 2    # The existence check plus the load.
+    assert len(loads) == 1
+
+
+def test_reload_picks_up_re_exported_and_deleted_models(tmp_path, loads):
+    model_file = tmp_path / "model.pkl"
+    model_file.write_bytes(b"pipeline")
+    server = ModelServer(str(tmp_path), check_interval = 60)
+    assert asyncio.run(server.predict("model", [{"x": 1}])) == [1]
+
+    stat = os.stat(model_file)
+    os.utime(model_file, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))    # Re-exported.
+    assert asyncio.run(server.predict("model", [{"x": 1}])) == [1]    # Within the interval: not checked yet.
+    server.cache.reload("model")
+    assert asyncio.run(server.predict("model", [{"x": 1}])) == [2]
+
+    model_file.unlink()
+    server.cache.reload()
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(server.predict("model", [{"x": 1}]))
+    assert server.cache.loaded() == []
+
+
+def test_expired_check_notices_a_re_exported_model(tmp_path, loads):
+    model_file = tmp_path / "model.pkl"
+    model_file.write_bytes(b"pipeline")
+    cache = ModelCache(str(tmp_path), check_interval = 0)
+    assert cache.get("model").value == 1
+    assert cache.get("model").value == 1
+    stat = os.stat(model_file)
+    os.utime(model_file, ns = (stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.get("model").value == 2
@@ -0,0 +1,25 @@
+# Importing dependencies
+import secrets
+import pytest
+from pymongo import MongoClient
+from backend.app.core.config import RUN_QUERY_SHAPES, ensure_indexes, find_collection_scans
+
+
+@pytest.fixture
+def run_collection(mongo_uri):
+    client = MongoClient(mongo_uri)
+    db = client[f"SwiftPredictTest_{secrets.token_hex(4)}"]    # Scratch database, dropped afterwards.
+    yield db["Run"]
+    client.drop_database(db.name)
+    client.close()
+
+
+def test_every_run_query_shape_uses_an_index(run_collection):
+    ensure_indexes(run_collection)
+    run_collection.insert_many([{"run_id": f"run_{i}", "project_name": "p", "project_type": "DL", "status": "running"} for i in range(10)])
+    assert find_collection_scans(run_collection) == []
+
+
+def test_an_unindexed_collection_is_reported(run_collection):
+    run_collection.insert_one({"run_id": "run", "project_name": "p"})
+    assert set(find_collection_scans(run_collection)) == set(RUN_QUERY_SHAPES)
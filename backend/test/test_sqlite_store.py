@@ -0,0 +1,54 @@
+# Importing dependencies
+import math
+import sqlite3
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.sqlite_store import SQLiteStore
+
+
+def test_nan_metric_round_trips(tmp_path):
+    store = SQLiteStore(tmp_path / "tracking.sqlite")
+    logger = SwiftPredict(project_name = "nan", project_type = "DL", buffered = True, store = store)
+    logger.log_or_update_metric("roc_auc", 0.5, "model", step = 1)
+    logger.log_or_update_metric("roc_auc", float("nan"), "model", step = 2)
+    logger.log_or_update_metric("roc_auc", 0.75, "model", step = 3)
+    logger.close()
+
+    steps, values = store.read_series(logger.run_id, "nan", "roc_auc")
+    assert steps.tolist() == [1.0, 2.0, 3.0]
+    assert values[0] == 0.5 and math.isnan(values[1]) and values[2] == 0.75
+
+    steps, values = store.read_series_since(logger.run_id, "nan", "roc_auc", 1)
+    assert steps.tolist() == [2.0, 3.0] and math.isnan(values[0])
+
+    (doc,) = store.iter_runs({"run_id": logger.run_id})
+    assert math.isnan(doc["metrics"]["details"]["value"][1])
+
+    for goal in ("max", "min"):
+        (row,) = store.leaderboard("nan", metric = "roc_auc", goal = goal)
+        assert row["best"] == (0.75 if goal == "max" else 0.5)    # NaN never wins.
+        assert row["last"] == 0.75 and row["points"] == 3
+    store.close()
+
+
+def test_nan_last_value_ranks_last(tmp_path):
+    store = SQLiteStore(tmp_path / "tracking.sqlite")
+    for value in (float("nan"), 0.5):
+        logger = SwiftPredict(project_name = "rank", project_type = "ML", store = store)
+        logger.log_or_update_metric("accuracy", value, f"model_{value}")
+    rows = store.leaderboard("rank", goal = "min", by = "last")
+    assert rows[0]["last"] == 0.5 and math.isnan(rows[1]["last"])
+    store.close()
+
+
+def test_not_null_metric_values_are_migrated(tmp_path):
+    path = tmp_path / "tracking.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE metrics (run_pk INTEGER NOT NULL, metric TEXT NOT NULL, step REAL NOT NULL, value REAL NOT NULL)")
+    conn.execute("INSERT INTO metrics VALUES (1, 'loss', 0, 0.25)")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteStore(path)
+    store.conn.execute("INSERT INTO metrics VALUES (1, 'loss', 1, NULL)")
+    assert store.conn.execute("SELECT step, value FROM metrics ORDER BY rowid").fetchall() == [(0.0, 0.25), (1.0, None)]
+    store.close()
@@ -0,0 +1,90 @@
+# Importing dependencies
+import sys
+import subprocess
+from pathlib import Path
+import pytest
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.storage import TrackingStore
+
+ROOT = Path(__file__).resolve().parents[2]
+# A buffered logger left open at exit, with the connections module imported after the client (as MongoStore does).
+EXIT_SCRIPT = """
+import sys
+from backend.app.client.swift_predict import SwiftPredict
+from backend.app.core.storage import TrackingStore
+from backend.app.core import connections
+
+events = open(sys.argv[1], "w", buffering = 1)
+close = connections.MongoClient.close
+
+def recording_close(client):
+    events.write("client closed\\n")
+    close(client)
+
+class RecordingStore(TrackingStore):
+    def write_batch(self, run, created_at, models, bucketed = False):
+        events.write("batch written\\n")
+
+connections.MongoClient.close = recording_close
+connections.get_client("mongodb://localhost:1", max_pool_size = 1)    # Doesn't connect until used.
+logger = SwiftPredict(project_name = "exit", project_type = "ML", buffered = True, store = RecordingStore())
+logger.log_param("a", 1, "model")
+"""
+
+
+class FailingStore(TrackingStore):
+    """
+    Records written batches and raises `error` for the first `failures` writes.
+    """
+
+    def __init__(self, error: Exception, failures: int):
+        self.error = error
+        self.failures = failures
+        self.batches = []
+
+    def write_batch(self, run: dict, created_at, models: dict, bucketed: bool = False):
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        self.batches.append(models)
+
+
+def test_transient_failure_keeps_events_for_the_next_flush():
+    store = FailingStore(ConnectionError("blip"), failures = 1)
+    logger = SwiftPredict(project_name = "retry", project_type = "ML", buffered = True, store = store)
+    logger.log_param("a", 1, "model")
+    with pytest.raises(ConnectionError):
+        logger.flush()
+    logger.flush()
+    assert store.batches == [{"model": {"params": [{"key": "a", "value": 1}], "metric": [], "step": [], "value": []}}]
+    assert logger.stats == {"enqueued": 1, "written": 1, "dropped": 0}
+    logger.close()
+
+
+def test_repeated_transient_failures_drop_the_batch():
+    store = FailingStore(ConnectionError("down"), failures = 3)
+    logger = SwiftPredict(project_name = "retry", project_type = "ML", buffered = True, store = store, flush_retries = 3)
+    logger.log_param("a", 1, "model")
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            logger.flush()
+    logger.flush()    # Third failure in a row: dropped instead of raised.
+    assert logger.stats["dropped"] == 1 and logger._buffer == []
+
+    logger.log_param("b", 2, "model")
+    logger.close()
+    assert store.batches[0]["model"]["params"] == [{"key": "b", "value": 2}]
+
+
+def test_permanent_failure_drops_the_batch_right_away():
+    store = FailingStore(TypeError("can't encode"), failures = 1)
+    logger = SwiftPredict(project_name = "retry", project_type = "ML", buffered = True, store = store)
+    logger.log_param("a", object(), "model")
+    logger.close()
+    assert logger.stats == {"enqueued": 1, "written": 0, "dropped": 1}
+
+
+def test_open_logger_is_flushed_before_the_clients_close_at_exit(tmp_path):
+    events = tmp_path / "events.txt"
+    subprocess.run([sys.executable, "-c", EXIT_SCRIPT, str(events)], cwd = ROOT, check = True)
+    assert events.read_text().splitlines() == ["batch written", "client closed"]
@@ -1,13 +1,17 @@
-from backend.app.services.automl_trainer import AutoML
-from backend.app.services.preprocessing import (
-    handle_null_values,
-    handle_imbalance,
-    handle_cat_columns,
-    detect_task,
-    get_dtype_columns,
-    text_preprocessor,
-)
-from backend.app.client.swift_predict import SwiftPredict
+import importlib
+
+# Exports are resolved on first access, so `import swiftpredict` (and the CLI or the SwiftPredict logger)
+# does not pay for importing scikit-learn, the boosting libraries and spaCy.
+_EXPORTS = {
+    "AutoML": "backend.app.services.automl_trainer",
+    "SwiftPredict": "backend.app.client.swift_predict",
+    "handle_null_values": "backend.app.services.preprocessing",
+    "handle_imbalance": "backend.app.services.preprocessing",
+    "handle_cat_columns": "backend.app.services.preprocessing",
+    "detect_task": "backend.app.services.preprocessing",
+    "get_dtype_columns": "backend.app.services.preprocessing",
+    "text_preprocessor": "backend.app.services.preprocessing",
+}
 
 __all__ = [
     "AutoML",
@@ -18,4 +22,16 @@ __all__ = [
     "detect_task",
     "get_dtype_columns",
     "text_preprocessor",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)